@@ -9,6 +9,7 @@ from salvo.adapters.base import (
     AdapterConfig,
     AdapterTurnResult,
     BaseAdapter,
+    BatchRequest,
     Message,
     TokenUsage,
     ToolCallResult,
@@ -19,6 +20,7 @@ __all__ = [
     "AdapterConfig",
     "AdapterTurnResult",
     "BaseAdapter",
+    "BatchRequest",
     "Message",
     "TokenUsage",
     "ToolCallResult",
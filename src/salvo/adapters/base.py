@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, ClassVar
 
 
 @dataclass
@@ -24,15 +24,22 @@ class ToolCallResult:
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(frozen=True)
 class TokenUsage:
-    """Token usage counts from a single adapter turn."""
+    """Token usage counts from a single adapter turn.
+
+    Frozen so a single instance (e.g. ZERO_USAGE) can be shared safely.
+    """
 
     input_tokens: int = 0
     output_tokens: int = 0
     total_tokens: int = 0
 
 
+# Shared all-zero usage for responses that carry no usage metadata.
+ZERO_USAGE = TokenUsage()
+
+
 @dataclass
 class AdapterTurnResult:
     """Result of a single send_turn() call to a provider adapter.
@@ -77,14 +84,26 @@ class AdapterConfig:
     extras: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class BatchRequest:
+    """One request in an offline provider batch (see BaseAdapter.send_batch)."""
+
+    messages: list[Message]
+    tools: list[dict[str, Any]] | None = None
+    config: AdapterConfig | None = None
+
+
 class BaseAdapter(ABC):
     """Abstract base class for all provider adapters.
 
     Subclasses must implement send_turn() which takes a conversation
     history, optional tool definitions, and adapter config, and returns
-    an AdapterTurnResult.
+    an AdapterTurnResult. Adapters that implement send_batch() set
+    supports_batch to True.
     """
 
+    supports_batch: ClassVar[bool] = False
+
     @abstractmethod
     async def send_turn(
         self,
@@ -104,6 +123,32 @@ class BaseAdapter(ABC):
         """
         ...
 
+    async def send_batch(
+        self,
+        requests: list[BatchRequest],
+        *,
+        poll_interval: float = 30.0,
+    ) -> list[AdapterTurnResult | Exception]:
+        """Run requests through the provider's offline batch API.
+
+        Only available when supports_batch is True; callers check it
+        first and use send_turn() otherwise.
+
+        Args:
+            requests: Requests to submit as one batch.
+            poll_interval: Seconds between batch status checks.
+
+        Returns:
+            One entry per request, in order: the result, or the
+            exception describing why that request failed.
+
+        Raises:
+            NotImplementedError: If the adapter has no batch support.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support batch requests"
+        )
+
     def provider_name(self) -> str:
         """Return the provider name for this adapter.
 
@@ -6,6 +6,7 @@ and extracts results into AdapterTurnResult.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any
 
@@ -13,11 +14,16 @@ from salvo.adapters.base import (
     AdapterConfig,
     AdapterTurnResult,
     BaseAdapter,
+    BatchRequest,
     Message,
     TokenUsage,
     ToolCallResult,
+    ZERO_USAGE,
 )
 
+# Batch API statuses after which a batch will not progress further.
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
 
 class OpenAIAdapter(BaseAdapter):
     """Adapter for OpenAI chat completion API.
@@ -26,6 +32,8 @@ class OpenAIAdapter(BaseAdapter):
     from the environment automatically.
     """
 
+    supports_batch = True
+
     def __init__(self) -> None:
         self._client: Any = None
 
@@ -103,13 +111,13 @@ class OpenAIAdapter(BaseAdapter):
             for tool in tools
         ]
 
-    async def send_turn(
+    def _build_request(
         self,
         messages: list[Message],
-        tools: list[dict[str, Any]] | None = None,
-        config: AdapterConfig | None = None,
-    ) -> AdapterTurnResult:
-        """Send a single turn to the OpenAI API.
+        tools: list[dict[str, Any]] | None,
+        config: AdapterConfig | None,
+    ) -> dict[str, Any]:
+        """Build chat completion request parameters for one turn.
 
         Args:
             messages: Conversation history as unified Message objects.
@@ -117,10 +125,10 @@ class OpenAIAdapter(BaseAdapter):
             config: Optional adapter configuration.
 
         Returns:
-            AdapterTurnResult with the model's response.
+            Keyword arguments for chat.completions.create(), also used
+            as the request body for batch requests.
         """
         config = config or AdapterConfig(model="gpt-4o")
-        client = self._get_client()
 
         kwargs: dict[str, Any] = {
             "model": config.model,
@@ -141,6 +149,26 @@ class OpenAIAdapter(BaseAdapter):
 
         # Pass through provider-specific extras
         kwargs.update(config.extras)
+        return kwargs
+
+    async def send_turn(
+        self,
+        messages: list[Message],
+        tools: list[dict[str, Any]] | None = None,
+        config: AdapterConfig | None = None,
+    ) -> AdapterTurnResult:
+        """Send a single turn to the OpenAI API.
+
+        Args:
+            messages: Conversation history as unified Message objects.
+            tools: Optional tool definitions.
+            config: Optional adapter configuration.
+
+        Returns:
+            AdapterTurnResult with the model's response.
+        """
+        client = self._get_client()
+        kwargs = self._build_request(messages, tools, config)
 
         response = await client.chat.completions.create(**kwargs)
 
@@ -161,12 +189,15 @@ class OpenAIAdapter(BaseAdapter):
                     )
                 )
 
-        # Extract usage
-        usage = TokenUsage(
-            input_tokens=response.usage.prompt_tokens,
-            output_tokens=response.usage.completion_tokens,
-            total_tokens=response.usage.total_tokens,
-        )
+        # Extract usage (the SDK reports usage as optional)
+        if response.usage is None:
+            usage = ZERO_USAGE
+        else:
+            usage = TokenUsage(
+                input_tokens=response.usage.prompt_tokens,
+                output_tokens=response.usage.completion_tokens,
+                total_tokens=response.usage.total_tokens,
+            )
 
         return AdapterTurnResult(
             content=content,
@@ -176,6 +207,125 @@ class OpenAIAdapter(BaseAdapter):
             finish_reason=choice.finish_reason,
         )
 
+    async def send_batch(
+        self,
+        requests: list[BatchRequest],
+        *,
+        poll_interval: float = 30.0,
+    ) -> list[AdapterTurnResult | Exception]:
+        """Run requests through the OpenAI Batch API.
+
+        Uploads the requests as a JSONL file, creates a batch against
+        /v1/chat/completions, polls until it reaches a terminal status,
+        and maps each output line back to its request by custom_id.
+
+        Args:
+            requests: Requests to submit as one batch.
+            poll_interval: Seconds between batch status checks.
+
+        Returns:
+            One entry per request, in order: the result, or the
+            exception for a request the batch did not complete or whose
+            output line could not be parsed.
+
+        Raises:
+            RuntimeError: If the batch as a whole fails, expires, or is
+                cancelled.
+        """
+        client = self._get_client()
+
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._build_request(req.messages, req.tools, req.config),
+                }
+            )
+            for i, req in enumerate(requests)
+        ]
+        input_file = await client.files.create(
+            file=("salvo_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        while batch.status not in _BATCH_TERMINAL_STATUSES:
+            await asyncio.sleep(poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(
+                f"OpenAI batch {batch.id} ended with status '{batch.status}'"
+            )
+
+        results: list[AdapterTurnResult | Exception] = [
+            RuntimeError(f"No output for batch request {i}")
+            for i in range(len(requests))
+        ]
+        if batch.output_file_id is None:
+            return results
+
+        output = await client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                i = int(record["custom_id"])
+            except (ValueError, KeyError, TypeError):
+                # No usable custom_id -- the request stays "no output"
+                continue
+            if not 0 <= i < len(requests):
+                continue
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                results[i] = RuntimeError(
+                    f"Batch request {i} failed: {record.get('error') or response}"
+                )
+                continue
+            try:
+                results[i] = self._result_from_body(response["body"])
+            except Exception as exc:
+                results[i] = exc
+        return results
+
+    def _result_from_body(self, body: dict[str, Any]) -> AdapterTurnResult:
+        """Build an AdapterTurnResult from a chat completion JSON body."""
+        choice = body["choices"][0]
+        message = choice["message"]
+
+        tool_calls = [
+            ToolCallResult(
+                id=tc["id"],
+                name=tc["function"]["name"],
+                arguments=json.loads(tc["function"]["arguments"]),
+            )
+            for tc in message.get("tool_calls") or []
+        ]
+
+        usage_data = body.get("usage")
+        if usage_data is None:
+            usage = ZERO_USAGE
+        else:
+            usage = TokenUsage(
+                input_tokens=usage_data["prompt_tokens"],
+                output_tokens=usage_data["completion_tokens"],
+                total_tokens=usage_data["total_tokens"],
+            )
+
+        return AdapterTurnResult(
+            content=message.get("content"),
+            tool_calls=tool_calls,
+            usage=usage,
+            raw_response=body,
+            finish_reason=choice["finish_reason"],
+        )
+
     def provider_name(self) -> str:
         """Return the provider name."""
         return "openai"
@@ -6,10 +6,10 @@ and JSON output for TrialSuiteResult display in terminal and CI.
 
 from __future__ import annotations
 
-import json
 import sys
 from typing import TYPE_CHECKING
 
+from pydantic_core import to_json
 from rich import box
 from rich.console import Console
 from rich.progress import (
@@ -285,5 +285,12 @@ def output_json(suite: TrialSuiteResult) -> None:
     Args:
         suite: The TrialSuiteResult to serialize.
     """
-    sys.stdout.write(suite.model_dump_json(indent=2))
-    sys.stdout.write("\n")
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(suite.model_dump_json(indent=2) + "\n")
+        return
+    # Hand pydantic-core's bytes straight to the binary layer; flush the
+    # text layer first so anything already written stays ahead of it.
+    sys.stdout.flush()
+    buffer.write(to_json(suite, indent=2) + b"\n")
+    buffer.flush()
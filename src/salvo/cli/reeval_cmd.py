@@ -108,7 +108,7 @@ async def _reeval_async(
 
     # Scenario drift detection
     if scenario_path is not None:
-        current_hash = hashlib.sha256(scenario.model_dump_json().encode()).hexdigest()
+        current_hash = hashlib.sha256(scenario.json_bytes).hexdigest()
         recorded_hash = recorded.metadata.scenario_hash
 
         if current_hash != recorded_hash:
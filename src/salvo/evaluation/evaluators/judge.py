@@ -7,14 +7,34 @@ score extraction, and aggregation into a single EvalResult.
 from __future__ import annotations
 
 import asyncio
+import functools
+import sys
+import weakref
 from typing import Any
 
-from salvo.adapters.base import AdapterConfig, Message
+from salvo.adapters.base import (
+    AdapterConfig,
+    AdapterTurnResult,
+    BaseAdapter,
+    BatchRequest,
+    Message,
+)
 from salvo.adapters.registry import get_adapter
 from salvo.evaluation.evaluators.base import BaseEvaluator
-from salvo.evaluation.judge.aggregation import aggregate_k_votes
+from salvo.evaluation.judge.aggregation import (
+    aggregate_k_votes,
+    majority_decided,
+    samples_needed,
+    vote_passes,
+)
+from salvo.evaluation.judge.cache import (
+    default_cache_dir,
+    judge_cache_key,
+    load_cached_result,
+    store_cached_result,
+)
 from salvo.evaluation.judge.context import build_context
-from salvo.evaluation.judge.extraction import extract_scores
+from salvo.evaluation.judge.extraction import criterion_name_set, extract_scores
 from salvo.evaluation.judge.prompt import (
     JUDGE_USER_TEMPLATE,
     build_judge_prompt,
@@ -36,6 +56,56 @@ _DEFAULTS = {
 }
 
 
+# Keys read by resolve_judge_config; only these participate in its cache key.
+_ASSERTION_KEYS = ("judge_adapter", "judge_model", "k", "temperature", "max_tokens")
+_PROJECT_KEYS = ("adapter", "model", "k", "temperature", "max_tokens")
+
+# Assertion names already given the verbose k=1 notice in this process.
+_K1_NOTICED: set[str] = set()
+
+# Judge adapters reused per event loop. Builtin adapters lazily build one
+# SDK client whose connection pool is then shared by every judge call on
+# that loop; clients are bound to the loop they were created on, so the
+# cache entry goes away with the loop.
+_ADAPTERS_BY_LOOP: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, BaseAdapter]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_judge_adapter(name: str) -> BaseAdapter:
+    """Return the judge adapter for name, shared within the running loop."""
+    adapters = _ADAPTERS_BY_LOOP.setdefault(asyncio.get_running_loop(), {})
+    adapter = adapters.get(name)
+    if adapter is None:
+        adapter = adapters[name] = get_adapter(name)
+    return adapter
+
+
+# Provider batch APIs (OpenAI, Anthropic) bill at half the synchronous price.
+_BATCH_API_COST_FACTOR = 0.5
+
+
+# Bound on concurrent judge calls, shared by every judge assertion on a
+# loop so N scenarios x k samples cannot overrun the provider's rate limit.
+_DEFAULT_MAX_CONCURRENCY = 16
+_SEMAPHORES_BY_LOOP: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+
+def _get_judge_semaphore(max_concurrency: int) -> asyncio.Semaphore:
+    """Return the judge semaphore for the running loop.
+
+    The first caller on a loop fixes its size; the limit is a
+    project-level setting, so every caller passes the same value.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _SEMAPHORES_BY_LOOP.get(loop)
+    if semaphore is None:
+        semaphore = _SEMAPHORES_BY_LOOP[loop] = asyncio.Semaphore(max_concurrency)
+    return semaphore
+
+
 def resolve_judge_config(
     assertion: dict,
     project_config: dict | None = None,
@@ -43,7 +113,9 @@ def resolve_judge_config(
     """Merge judge configuration from assertion, project, and defaults.
 
     Resolution order: assertion-level override > project-level judge
-    section > hard-coded defaults.
+    section > hard-coded defaults. Results are memoized on the relevant
+    keys, since every judge assertion in a suite typically shares the
+    same project config.
 
     Args:
         assertion: The assertion dict (may contain judge_model, k, etc.).
@@ -54,20 +126,49 @@ def resolve_judge_config(
         Dict with resolved judge_adapter, judge_model, k, temperature,
         max_tokens values.
     """
+    # Items carry each value's type: lru_cache(typed=True) only types the
+    # top-level arguments, and 1/True or 0/0.0 must not share an entry.
+    assertion_items = tuple(
+        (key, type(assertion[key]), assertion[key])
+        for key in _ASSERTION_KEYS
+        if key in assertion
+    )
+    project_items: tuple[tuple[str, type, Any], ...] = ()
+    if project_config:
+        project_items = tuple(
+            (key, type(project_config[key]), project_config[key])
+            for key in _PROJECT_KEYS
+            if key in project_config
+        )
+
+    try:
+        resolved = _resolve_cached(assertion_items, project_items)
+    except TypeError:
+        # Unhashable override value -- resolve without the cache
+        resolved = _resolve(assertion_items, project_items)
+    return dict(resolved)
+
+
+def _resolve(
+    assertion_items: tuple[tuple[str, type, Any], ...],
+    project_items: tuple[tuple[str, type, Any], ...],
+) -> tuple[tuple[str, Any], ...]:
+    """Resolve judge config from (key, type, value) items; see resolve_judge_config."""
+    assertion = {key: value for key, _, value in assertion_items}
+    project_config = {key: value for key, _, value in project_items}
     result = dict(_DEFAULTS)
 
     # Apply project-level overrides
-    if project_config:
-        if "adapter" in project_config:
-            result["judge_adapter"] = project_config["adapter"]
-        if "model" in project_config:
-            result["judge_model"] = project_config["model"]
-        if "k" in project_config:
-            result["k"] = project_config["k"]
-        if "temperature" in project_config:
-            result["temperature"] = project_config["temperature"]
-        if "max_tokens" in project_config:
-            result["max_tokens"] = project_config["max_tokens"]
+    if "adapter" in project_config:
+        result["judge_adapter"] = project_config["adapter"]
+    if "model" in project_config:
+        result["judge_model"] = project_config["model"]
+    if "k" in project_config:
+        result["k"] = project_config["k"]
+    if "temperature" in project_config:
+        result["temperature"] = project_config["temperature"]
+    if "max_tokens" in project_config:
+        result["max_tokens"] = project_config["max_tokens"]
 
     # Apply assertion-level overrides (highest priority)
     if "judge_adapter" in assertion:
@@ -81,7 +182,10 @@ def resolve_judge_config(
     if "max_tokens" in assertion and assertion["max_tokens"] is not None:
         result["max_tokens"] = assertion["max_tokens"]
 
-    return result
+    return tuple(result.items())
+
+
+_resolve_cached = functools.lru_cache(maxsize=256, typed=True)(_resolve)
 
 
 class JudgeEvaluator(BaseEvaluator):
@@ -128,8 +232,6 @@ class JudgeEvaluator(BaseEvaluator):
         criteria = assertion.get("criteria", [])
         weight = assertion.get("weight", 1.0)
         required = assertion.get("required", False)
-        include_sp = assertion.get("include_system_prompt", False)
-        custom_prompt = assertion.get("custom_prompt")
 
         # Extract injected project judge config and verbose flag
         project_judge_dict = assertion.pop("_project_judge_config", None)
@@ -149,28 +251,23 @@ class JudgeEvaluator(BaseEvaluator):
         temperature = config["temperature"]
         max_tokens = config["max_tokens"]
 
-        # Warn when k=1 disables majority voting (verbose-only)
-        if k == 1 and verbose:
-            import sys
-
+        # Warn when k=1 disables majority voting (verbose-only, once per name)
+        name = assertion.get("name", "?")
+        if k == 1 and verbose and name not in _K1_NOTICED:
+            _K1_NOTICED.add(name)
             print(
-                f"[salvo] warning: k=1 for judge assertion '{assertion.get('name', '?')}' "
+                f"[salvo] warning: k=1 for judge assertion '{name}' "
                 "-- majority voting is disabled",
                 file=sys.stderr,
             )
 
         # Build context and prompts
-        scenario = assertion.get("_scenario")
-        context_block = build_context(
-            trace, scenario=scenario, include_system_prompt=include_sp
-        )
-
-        system_prompt = custom_prompt if custom_prompt else build_judge_prompt(criteria)
-        user_prompt = JUDGE_USER_TEMPLATE.format(context_block=context_block)
+        system_prompt, user_prompt = _judge_prompts(trace, assertion, criteria)
         scoring_tool = build_scoring_tool(criteria)
+        criterion_names = criterion_name_set(criteria)
 
         # Resolve adapter
-        adapter = get_adapter(judge_adapter_name)
+        adapter = _get_judge_adapter(judge_adapter_name)
         provider = adapter.provider_name()
 
         # Build tool_choice extras
@@ -194,74 +291,534 @@ class JudgeEvaluator(BaseEvaluator):
             Message(role="user", content=user_prompt),
         ]
 
-        for _ in range(k):
-            try:
+        # Persistent response cache: opt-in via project config, and only
+        # for deterministic (temperature 0.0) judging.
+        cache_keys: list[str] | None = None
+        cache_dir = None
+        if project_judge_dict and project_judge_dict.get("cache") and temperature == 0.0:
+            cache_dir = default_cache_dir()
+            cache_keys = [
+                judge_cache_key(
+                    judge_adapter=judge_adapter_name,
+                    judge_model=judge_model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                    sample_index=i,
+                )
+                for i in range(k)
+            ]
+
+        semaphore = _get_judge_semaphore(
+            (project_judge_dict or {}).get("max_concurrency", _DEFAULT_MAX_CONCURRENCY)
+        )
+
+        async def _sample(i: int) -> tuple[AdapterTurnResult, bool]:
+            """Run one judge sample, returning (result, served_from_cache)."""
+            if cache_keys is not None:
+                cached = load_cached_result(cache_dir, cache_keys[i])
+                if cached is not None:
+                    return cached, True
+            async with semaphore:
                 result = await adapter.send_turn(
                     messages, tools=[scoring_tool], config=adapter_config
                 )
+            return result, False
+
+        # Self-consistency early exit: opt-in via project config. Samples
+        # are dispatched in the smallest batches that could decide the
+        # majority verdict, and any still in flight are cancelled once it
+        # is decided. Otherwise all k samples are fired at once.
+        early_stop = bool(project_judge_dict and project_judge_dict.get("early_stop"))
+
+        votes_by_index: dict[int, dict] = {}
+        passes = 0
+        completed = 0
+        launched = 0
+        pending: dict[asyncio.Task, int] = {}
+
+        def _launch(count: int) -> None:
+            nonlocal launched
+            for _ in range(min(count, k - launched)):
+                pending[asyncio.ensure_future(_sample(launched))] = launched
+                launched += 1
+
+        def _record(i: int, task: asyncio.Task) -> dict | None:
+            """Account for a finished sample; return its scores or None."""
+            nonlocal total_judge_cost, parse_failures
+            exc = task.exception()
+            if exc is not None:
+                if not isinstance(exc, Exception):
+                    raise exc
+                parse_failures += 1
+                return None
 
-                # Track cost
-                cost = estimate_cost(
-                    judge_model,
-                    result.usage.input_tokens,
-                    result.usage.output_tokens,
-                )
-                if cost is not None:
-                    total_judge_cost += cost
+            result, from_cache = task.result()
+            try:
+                # Track cost (cache hits made no API call)
+                if not from_cache:
+                    cost = estimate_cost(
+                        judge_model,
+                        result.usage.input_tokens,
+                        result.usage.output_tokens,
+                    )
+                    if cost is not None:
+                        total_judge_cost += cost
 
                 # Extract scores
-                scores = extract_scores(result, criteria)
-                if scores is not None:
-                    k_results.append(scores)
-                else:
-                    parse_failures += 1
+                scores = extract_scores(result, criteria, criterion_names)
             except Exception:
                 parse_failures += 1
+                return None
 
-        # All calls failed
-        if not k_results:
-            return EvalResult(
-                assertion_type="judge",
-                score=0.0,
-                passed=False,
-                weight=weight,
-                required=required,
-                details=(
-                    f"judge_parse_failed: {parse_failures}/{k} calls failed"
-                ),
-                metadata={
-                    "judge_model": judge_model,
-                    "judge_k": k,
-                    "judge_cost_usd": total_judge_cost,
-                },
+            if scores is None:
+                parse_failures += 1
+                return None
+
+            # Only cache responses that yielded usable scores
+            if cache_keys is not None and not from_cache:
+                store_cached_result(cache_dir, cache_keys[i], result)
+            return scores
+
+        _launch(samples_needed(0, 0, k) if early_stop else k)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=pending.__getitem__):
+                    i = pending.pop(task)
+                    completed += 1
+                    scores = _record(i, task)
+                    if scores is not None:
+                        votes_by_index[i] = scores
+                        if early_stop and vote_passes(scores, criteria, threshold):
+                            passes += 1
+
+                if not early_stop:
+                    continue
+                remaining = k - completed
+                if majority_decided(passes, len(votes_by_index), remaining) is not None:
+                    break
+                needed = samples_needed(passes, len(votes_by_index), remaining)
+                _launch(needed - len(pending))
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        # Keep votes in sample order regardless of completion order
+        k_results.extend(votes_by_index[i] for i in sorted(votes_by_index))
+
+        return _build_eval_result(
+            k_results,
+            criteria=criteria,
+            threshold=threshold,
+            weight=weight,
+            required=required,
+            judge_model=judge_model,
+            k=k,
+            parse_failures=parse_failures,
+            judge_cost=total_judge_cost,
+        )
+
+    async def evaluate_async_batch(
+        self, trace: RunTrace, assertions: list[dict]
+    ) -> list[EvalResult]:
+        """Evaluate several judge assertions on one trace with shared calls.
+
+        Assertions that resolve to the same judge configuration and
+        context are graded together: their criteria are namespaced as
+        ``a<index>.<criterion>`` in a single score_criteria tool, so the
+        group costs k adapter calls instead of k per assertion. Each
+        response is then split back into per-assertion votes and
+        aggregated exactly as evaluate_async would.
+
+        Assertions with a custom_prompt, and groups of one, go through
+        evaluate_async unchanged. Batched groups do not use the response
+        cache or early stop.
+
+        Args:
+            trace: The captured run trace.
+            assertions: Canonical judge assertion dicts.
+
+        Returns:
+            EvalResults in the same order as assertions.
+        """
+        results: list[EvalResult | None] = [None] * len(assertions)
+        groups: dict[tuple, list[int]] = {}
+        singles: list[int] = []
+
+        for idx, assertion in enumerate(assertions):
+            if assertion.get("custom_prompt"):
+                singles.append(idx)
+                continue
+            config = resolve_judge_config(
+                assertion, project_config=assertion.get("_project_judge_config")
             )
+            group_key = (
+                tuple(sorted(config.items())),
+                bool(assertion.get("include_system_prompt", False)),
+                id(assertion.get("_scenario")),
+            )
+            groups.setdefault(group_key, []).append(idx)
+
+        batches: list[list[int]] = []
+        for indices in groups.values():
+            if len(indices) == 1:
+                singles.extend(indices)
+            else:
+                batches.append(indices)
+
+        async def _single(idx: int) -> None:
+            results[idx] = await self.evaluate_async(trace, assertions[idx])
+
+        async def _batch(indices: list[int]) -> None:
+            batch_results = await self._evaluate_batch_group(
+                trace, [assertions[i] for i in indices]
+            )
+            for idx, result in zip(indices, batch_results):
+                results[idx] = result
 
-        # Aggregate results
-        overall_score, majority_passed, per_criterion_details = aggregate_k_votes(
-            k_results, criteria, threshold
+        await asyncio.gather(
+            *(_single(idx) for idx in singles),
+            *(_batch(indices) for indices in batches),
         )
+        return results  # type: ignore[return-value]
+
+    async def _evaluate_batch_group(
+        self, trace: RunTrace, assertions: list[dict]
+    ) -> list[EvalResult]:
+        """Grade assertions sharing one judge config with k combined calls."""
+        first = assertions[0]
+        project_judge_dict = first.get("_project_judge_config")
+        config = resolve_judge_config(first, project_config=project_judge_dict)
+        judge_model = config["judge_model"]
+        k = config["k"]
 
-        # Build details string
-        criterion_summary = ", ".join(
-            f"{d['name']}={d['median_score']:.2f}" for d in per_criterion_details
+        default_threshold = 0.8
+        if project_judge_dict and "default_threshold" in project_judge_dict:
+            default_threshold = project_judge_dict["default_threshold"]
+
+        # Namespace every criterion by its assertion's position in the batch
+        combined_criteria: list[dict] = []
+        for pos, assertion in enumerate(assertions):
+            for c in assertion.get("criteria", []):
+                combined_criteria.append(
+                    {**c, "name": f"a{pos}.{c['name']}"}
+                )
+
+        # Batched assertions never carry a custom_prompt
+        system_prompt, user_prompt = _judge_prompts(trace, first, combined_criteria)
+        messages = [
+            Message(role="system", content=system_prompt),
+            Message(role="user", content=user_prompt),
+        ]
+        scoring_tool = build_scoring_tool(combined_criteria)
+        combined_names = criterion_name_set(combined_criteria)
+
+        adapter = _get_judge_adapter(config["judge_adapter"])
+        adapter_config = AdapterConfig(
+            model=judge_model,
+            temperature=config["temperature"],
+            max_tokens=config["max_tokens"],
+            extras=format_tool_choice(adapter.provider_name(), "score_criteria"),
+        )
+        semaphore = _get_judge_semaphore(
+            (project_judge_dict or {}).get("max_concurrency", _DEFAULT_MAX_CONCURRENCY)
         )
-        details = (
-            f"judge={judge_model} k={k} votes={len(k_results)}/{k} | "
-            f"judge_cost=${total_judge_cost:.6f} | "
-            f"{criterion_summary}"
+
+        async def _sample() -> AdapterTurnResult:
+            async with semaphore:
+                return await adapter.send_turn(
+                    messages, tools=[scoring_tool], config=adapter_config
+                )
+
+        responses = await asyncio.gather(
+            *(_sample() for _ in range(k)), return_exceptions=True
         )
 
+        # Split each response back into per-assertion votes
+        votes: list[list[dict]] = [[] for _ in assertions]
+        total_judge_cost = 0.0
+        for response in responses:
+            if isinstance(response, BaseException):
+                if not isinstance(response, Exception):
+                    raise response
+                continue
+            try:
+                cost = estimate_cost(
+                    judge_model,
+                    response.usage.input_tokens,
+                    response.usage.output_tokens,
+                )
+                if cost is not None:
+                    total_judge_cost += cost
+                scores = extract_scores(response, combined_criteria, combined_names)
+            except Exception:
+                continue
+            if scores is None:
+                continue
+            for pos, assertion in enumerate(assertions):
+                vote = {}
+                for c in assertion.get("criteria", []):
+                    key = f"a{pos}.{c['name']}"
+                    if key in scores:
+                        vote[c["name"]] = scores[key]
+                if vote:
+                    votes[pos].append(vote)
+
+        # Each assertion is charged an equal share of the batch cost
+        cost_share = total_judge_cost / len(assertions)
+        return [
+            _build_eval_result(
+                votes[pos],
+                criteria=assertion.get("criteria", []),
+                threshold=assertion.get("threshold", default_threshold),
+                weight=assertion.get("weight", 1.0),
+                required=assertion.get("required", False),
+                judge_model=judge_model,
+                k=k,
+                parse_failures=k - len(votes[pos]),
+                judge_cost=cost_share,
+            )
+            for pos, assertion in enumerate(assertions)
+        ]
+
+    async def evaluate_batch_api_async(
+        self,
+        items: list[tuple[RunTrace, dict]],
+        *,
+        poll_interval: float = 30.0,
+    ) -> list[EvalResult]:
+        """Evaluate judge assertions through the provider's offline batch API.
+
+        For offline runs where latency does not matter: every k x N judge
+        request is submitted in one provider batch per judge adapter, at
+        roughly half the cost and outside the synchronous rate limits.
+        Items opt in with a truthy ``use_batch_api`` key in their
+        ``_project_judge_config`` dict (this is not a salvo.yaml setting);
+        other items, and items whose adapter has no batch support, are
+        evaluated with evaluate_async.
+
+        Args:
+            items: (trace, assertion) pairs to evaluate.
+            poll_interval: Seconds between batch status checks.
+
+        Returns:
+            EvalResults in the same order as items.
+        """
+        results: list[EvalResult | None] = [None] * len(items)
+        by_adapter: dict[str, list[int]] = {}
+        direct: list[int] = []
+
+        for idx, (_, assertion) in enumerate(items):
+            project_judge_dict = assertion.get("_project_judge_config")
+            if project_judge_dict and project_judge_dict.get("use_batch_api"):
+                config = resolve_judge_config(
+                    assertion, project_config=project_judge_dict
+                )
+                by_adapter.setdefault(config["judge_adapter"], []).append(idx)
+            else:
+                direct.append(idx)
+
+        async def _direct(idx: int) -> None:
+            trace, assertion = items[idx]
+            results[idx] = await self.evaluate_async(trace, assertion)
+
+        async def _batched(adapter_name: str, indices: list[int]) -> None:
+            adapter = _get_judge_adapter(adapter_name)
+            if not adapter.supports_batch:
+                await asyncio.gather(*(_direct(idx) for idx in indices))
+                return
+            batch_results = await self._evaluate_via_batch_api(
+                adapter,
+                [items[i] for i in indices],
+                poll_interval=poll_interval,
+            )
+            for idx, result in zip(indices, batch_results):
+                results[idx] = result
+
+        await asyncio.gather(
+            *(_direct(idx) for idx in direct),
+            *(_batched(name, indices) for name, indices in by_adapter.items()),
+        )
+        return results  # type: ignore[return-value]
+
+    async def _evaluate_via_batch_api(
+        self,
+        adapter: BaseAdapter,
+        items: list[tuple[RunTrace, dict]],
+        *,
+        poll_interval: float,
+    ) -> list[EvalResult]:
+        """Submit k requests per item as one batch and aggregate the votes."""
+        provider = adapter.provider_name()
+        prepared: list[tuple[dict, dict, float, frozenset[str]]] = []
+        requests: list[BatchRequest] = []
+
+        for trace, assertion in items:
+            project_judge_dict = assertion.get("_project_judge_config") or {}
+            config = resolve_judge_config(assertion, project_config=project_judge_dict)
+            criteria = assertion.get("criteria", [])
+            threshold = assertion.get(
+                "threshold", project_judge_dict.get("default_threshold", 0.8)
+            )
+            system_prompt, user_prompt = _judge_prompts(trace, assertion, criteria)
+            request = BatchRequest(
+                messages=[
+                    Message(role="system", content=system_prompt),
+                    Message(role="user", content=user_prompt),
+                ],
+                tools=[build_scoring_tool(criteria)],
+                config=AdapterConfig(
+                    model=config["judge_model"],
+                    temperature=config["temperature"],
+                    max_tokens=config["max_tokens"],
+                    extras=format_tool_choice(provider, "score_criteria"),
+                ),
+            )
+            requests.extend([request] * config["k"])
+            prepared.append(
+                (assertion, config, threshold, criterion_name_set(criteria))
+            )
+
+        try:
+            responses = await adapter.send_batch(requests, poll_interval=poll_interval)
+        except Exception as exc:
+            # The batch as a whole failed, expired or was cancelled -- fail
+            # its items without discarding results evaluated elsewhere.
+            return [
+                EvalResult(
+                    assertion_type="judge",
+                    score=0.0,
+                    passed=False,
+                    weight=assertion.get("weight", 1.0),
+                    required=assertion.get("required", False),
+                    details=f"judge_batch_failed: {exc}",
+                    metadata={
+                        "judge_model": config["judge_model"],
+                        "judge_k": config["k"],
+                        "judge_cost_usd": 0.0,
+                    },
+                )
+                for assertion, config, _, _ in prepared
+            ]
+
+        eval_results: list[EvalResult] = []
+        offset = 0
+        for assertion, config, threshold, names in prepared:
+            k = config["k"]
+            criteria = assertion.get("criteria", [])
+            votes: list[dict] = []
+            total_judge_cost = 0.0
+            for response in responses[offset:offset + k]:
+                if isinstance(response, Exception):
+                    continue
+                try:
+                    cost = estimate_cost(
+                        config["judge_model"],
+                        response.usage.input_tokens,
+                        response.usage.output_tokens,
+                    )
+                    if cost is not None:
+                        total_judge_cost += cost * _BATCH_API_COST_FACTOR
+                    scores = extract_scores(response, criteria, names)
+                except Exception:
+                    continue
+                if scores is not None:
+                    votes.append(scores)
+            offset += k
+
+            eval_results.append(
+                _build_eval_result(
+                    votes,
+                    criteria=criteria,
+                    threshold=threshold,
+                    weight=assertion.get("weight", 1.0),
+                    required=assertion.get("required", False),
+                    judge_model=config["judge_model"],
+                    k=k,
+                    parse_failures=k - len(votes),
+                    judge_cost=total_judge_cost,
+                )
+            )
+        return eval_results
+
+
+def _judge_prompts(
+    trace: RunTrace, assertion: dict, criteria: list[dict]
+) -> tuple[str, str]:
+    """Build the (system, user) judge prompts for one assertion."""
+    context_block = build_context(
+        trace,
+        scenario=assertion.get("_scenario"),
+        include_system_prompt=assertion.get("include_system_prompt", False),
+    )
+    custom_prompt = assertion.get("custom_prompt")
+    system_prompt = custom_prompt if custom_prompt else build_judge_prompt(criteria)
+    return system_prompt, JUDGE_USER_TEMPLATE.format(context_block=context_block)
+
+
+def _build_eval_result(
+    k_results: list[dict],
+    *,
+    criteria: list[dict],
+    threshold: float,
+    weight: float,
+    required: bool,
+    judge_model: str,
+    k: int,
+    parse_failures: int,
+    judge_cost: float,
+) -> EvalResult:
+    """Aggregate judge votes into the EvalResult for one assertion."""
+    # All calls failed
+    if not k_results:
         return EvalResult(
             assertion_type="judge",
-            score=overall_score,
-            passed=majority_passed,
+            score=0.0,
+            passed=False,
             weight=weight,
             required=required,
-            details=details,
+            details=(
+                f"judge_parse_failed: {parse_failures}/{k} calls failed"
+            ),
             metadata={
                 "judge_model": judge_model,
                 "judge_k": k,
-                "judge_cost_usd": total_judge_cost,
-                "per_criterion": per_criterion_details,
+                "judge_cost_usd": judge_cost,
             },
         )
+
+    # Aggregate results
+    overall_score, majority_passed, per_criterion_details = aggregate_k_votes(
+        k_results, criteria, threshold
+    )
+
+    # Build details string
+    criterion_summary = ", ".join(
+        f"{d['name']}={d['median_score']:.2f}" for d in per_criterion_details
+    )
+    details = (
+        f"judge={judge_model} k={k} votes={len(k_results)}/{k} | "
+        f"judge_cost=${judge_cost:.6f} | "
+        f"{criterion_summary}"
+    )
+
+    return EvalResult(
+        assertion_type="judge",
+        score=overall_score,
+        passed=majority_passed,
+        weight=weight,
+        required=required,
+        details=details,
+        metadata={
+            "judge_model": judge_model,
+            "judge_k": k,
+            "judge_cost_usd": judge_cost,
+            "per_criterion": per_criterion_details,
+        },
+    )
@@ -9,6 +9,23 @@ from __future__ import annotations
 import statistics
 
 
+def _fast_median(scores: list[float]) -> float:
+    """Median specialized for the small k used in practice.
+
+    k=1..3 are resolved with comparisons only (exact, no sort);
+    larger lists fall back to statistics.median.
+    """
+    n = len(scores)
+    if n == 1:
+        return scores[0]
+    if n == 2:
+        return (scores[0] + scores[1]) / 2
+    if n == 3:
+        a, b, c = scores
+        return max(min(a, b), min(max(a, b), c))
+    return statistics.median(scores)
+
+
 def aggregate_k_votes(
     k_results: list[dict],
     criteria: list[dict],
@@ -37,54 +54,101 @@ def aggregate_k_votes(
     if not k_results:
         return (0.0, False, [])
 
-    # Collect per-criterion scores across all votes
-    per_criterion: dict[str, list[float]] = {c["name"]: [] for c in criteria}
+    names = [c["name"] for c in criteria]
+    weights = [c["weight"] for c in criteria]
+    total_weight = sum(weights)
+
+    # Single pass over votes: collect per-criterion scores and each
+    # vote's weighted total together, so every score is extracted once.
+    per_criterion: list[list[float]] = [[] for _ in names]
+    pass_count = 0
 
     for vote in k_results:
-        for c in criteria:
-            name = c["name"]
-            if name in vote and isinstance(vote[name], dict) and "score" in vote[name]:
-                per_criterion[name].append(float(vote[name]["score"]))
+        vote_total = 0.0
+        for i, name in enumerate(names):
+            entry = vote.get(name)
+            if isinstance(entry, dict) and "score" in entry:
+                score = float(entry["score"])
+                per_criterion[i].append(score)
+                vote_total += score * weights[i]
+            # Missing criterion contributes 0.0
+
+        # Majority vote: compare each vote's weighted average to threshold
+        vote_avg = vote_total / total_weight if total_weight > 0 else 0.0
+        if vote_avg >= threshold:
+            pass_count += 1
 
     # Compute median per criterion
-    medians: dict[str, float] = {}
     per_criterion_details: list[dict] = []
+    weighted_sum = 0.0
 
-    for c in criteria:
-        name = c["name"]
-        scores = per_criterion[name]
-        median = statistics.median(scores) if scores else 0.0
-        medians[name] = median
+    for name, weight, scores in zip(names, weights, per_criterion):
+        median = _fast_median(scores) if scores else 0.0
+        weighted_sum += median * weight
         per_criterion_details.append({
             "name": name,
             "median_score": median,
             "all_scores": scores,
-            "weight": c["weight"],
+            "weight": weight,
         })
 
     # Compute weighted average of medians
-    total_weight = sum(c["weight"] for c in criteria)
-    if total_weight == 0:
-        overall_score = 0.0
-    else:
-        overall_score = sum(
-            medians[c["name"]] * c["weight"] for c in criteria
-        ) / total_weight
-
-    # Majority vote: compute each vote's weighted average, check threshold
-    pass_count = 0
-    for vote in k_results:
-        vote_total = 0.0
-        for c in criteria:
-            name = c["name"]
-            if name in vote and isinstance(vote[name], dict) and "score" in vote[name]:
-                vote_total += float(vote[name]["score"]) * c["weight"]
-            # Missing criterion contributes 0.0
-
-        vote_avg = vote_total / total_weight if total_weight > 0 else 0.0
-        if vote_avg >= threshold:
-            pass_count += 1
+    overall_score = weighted_sum / total_weight if total_weight != 0 else 0.0
 
     passed = pass_count > len(k_results) / 2
 
     return (overall_score, passed, per_criterion_details)
+
+
+def vote_passes(vote: dict, criteria: list[dict], threshold: float) -> bool:
+    """Return whether a single vote's weighted average meets threshold.
+
+    Uses the same rule as the majority vote in aggregate_k_votes:
+    missing criteria contribute 0.0.
+    """
+    total_weight = sum(c["weight"] for c in criteria)
+    if total_weight <= 0:
+        return 0.0 >= threshold
+    vote_total = 0.0
+    for c in criteria:
+        entry = vote.get(c["name"])
+        if isinstance(entry, dict) and "score" in entry:
+            vote_total += float(entry["score"]) * c["weight"]
+    return vote_total / total_weight >= threshold
+
+
+def majority_decided(passes: int, votes: int, remaining: int) -> bool | None:
+    """Check whether the majority verdict is fixed regardless of remaining samples.
+
+    The verdict is ``passes > votes / 2`` over successfully parsed votes.
+    Each remaining sample may pass, fail, or fail to parse (adding no vote).
+
+    Args:
+        passes: Votes so far that met the threshold.
+        votes: Successfully parsed votes so far.
+        remaining: Samples not yet completed.
+
+    Returns:
+        True if the verdict is decided as pass, False if decided as fail,
+        None if remaining samples could still change it.
+    """
+    margin = 2 * passes - votes
+    if margin > remaining:
+        return True
+    if margin + remaining <= 0:
+        return False
+    return None
+
+
+def samples_needed(passes: int, votes: int, remaining: int) -> int:
+    """Smallest number of further samples that could decide the verdict.
+
+    Assumes the best case for a decision: all of them pass, or all of
+    them fail. Returns ``remaining`` if no smaller batch can decide.
+    """
+    for n in range(1, remaining + 1):
+        if majority_decided(passes + n, votes + n, remaining - n) is True:
+            return n
+        if majority_decided(passes, votes + n, remaining - n) is False:
+            return n
+    return remaining
@@ -0,0 +1,113 @@
+"""Persistent disk cache for judge responses.
+
+Re-running a suite re-invokes the judge on identical inputs. When
+enabled (``judge.cache: true`` in salvo.yaml) and the judge runs at
+temperature 0.0, each sample's response is stored under a key derived
+from everything that determines it, so reruns skip the adapter call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from salvo.adapters.base import AdapterTurnResult, TokenUsage, ToolCallResult
+
+
+def default_cache_dir() -> Path:
+    """Return the judge cache directory.
+
+    Uses ``$XDG_CACHE_HOME/salvo/judge``, falling back to
+    ``~/.cache/salvo/judge``.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "salvo" / "judge"
+
+
+def judge_cache_key(
+    *,
+    judge_adapter: str,
+    judge_model: str,
+    temperature: float,
+    max_tokens: int,
+    system_prompt: str,
+    user_prompt: str,
+    sample_index: int,
+) -> str:
+    """Build a stable cache key for one judge sample.
+
+    The prompts already embed the criteria and the trace context the
+    judge sees, so hashing them (plus the generation parameters and the
+    sample index) identifies the request exactly.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    payload = json.dumps(
+        {
+            "judge_adapter": judge_adapter,
+            "judge_model": judge_model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt,
+            "sample_index": sample_index,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_cached_result(cache_dir: Path, key: str) -> AdapterTurnResult | None:
+    """Load a cached judge response, or None on miss or unreadable entry."""
+    path = cache_dir / f"{key}.json"
+    try:
+        data = json.loads(path.read_bytes())
+        return AdapterTurnResult(
+            content=data["content"],
+            tool_calls=[ToolCallResult(**tc) for tc in data["tool_calls"]],
+            usage=TokenUsage(**data["usage"]),
+            raw_response={},
+            finish_reason=data["finish_reason"],
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def store_cached_result(
+    cache_dir: Path, key: str, result: AdapterTurnResult
+) -> None:
+    """Persist a judge response under key.
+
+    Uses an atomic write (unique temp file, then rename) so concurrent
+    writers never leave a partial entry. The raw provider response is
+    not stored. Write errors are ignored -- the cache is best-effort.
+    """
+    data = {
+        "content": result.content,
+        "tool_calls": [
+            {"id": tc.id, "name": tc.name, "arguments": tc.arguments}
+            for tc in result.tool_calls
+        ],
+        "usage": {
+            "input_tokens": result.usage.input_tokens,
+            "output_tokens": result.usage.output_tokens,
+            "total_tokens": result.usage.total_tokens,
+        },
+        "finish_reason": result.finish_reason,
+    }
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".json.tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_name, cache_dir / f"{key}.json")
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
@@ -14,6 +14,10 @@ if TYPE_CHECKING:
     from salvo.execution.trace import RunTrace
     from salvo.models.scenario import Scenario
 
+# System prompts longer than this are clipped in the judge context.
+_MAX_SYSTEM_PROMPT_CHARS = 2000
+_ELLIPSIS = "..."
+
 
 def build_tool_call_summary(
     trace: RunTrace, max_arg_length: int = 100
@@ -36,7 +40,7 @@ def build_tool_call_summary(
         args = tc.get("arguments", {})
         args_str = json.dumps(args, ensure_ascii=False)
         if len(args_str) > max_arg_length:
-            args_str = args_str[:max_arg_length] + "..."
+            args_str = args_str[:max_arg_length] + _ELLIPSIS
         lines.append(f"{i}. {name}({args_str})")
 
     return "\n".join(lines)
@@ -66,15 +70,15 @@ def build_context(
     # Optionally include system prompt and tools
     if include_system_prompt and scenario is not None:
         sp = scenario.system_prompt or ""
-        if len(sp) > 2000:
-            sp = sp[:2000] + "..."
+        if len(sp) > _MAX_SYSTEM_PROMPT_CHARS:
+            sp = sp[:_MAX_SYSTEM_PROMPT_CHARS] + _ELLIPSIS
         sections.append(f"## Scenario System Prompt\n\n{sp}")
 
         if scenario.tools:
-            tool_lines = []
-            for t in scenario.tools:
-                tool_lines.append(f"- **{t.name}**: {t.description}")
-            sections.append("## Available Tools\n\n" + "\n".join(tool_lines))
+            tool_lines = "\n".join(
+                f"- **{t.name}**: {t.description}" for t in scenario.tools
+            )
+            sections.append(f"## Available Tools\n\n{tool_lines}")
 
     # Always include final response
     final = trace.final_content if trace.final_content else "(empty)"
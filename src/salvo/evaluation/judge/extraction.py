@@ -10,35 +10,54 @@ import json
 import re
 from typing import TYPE_CHECKING
 
+from pydantic_core import from_json
+
 if TYPE_CHECKING:
     from salvo.adapters.base import AdapterTurnResult, ToolCallResult
 
+# Compiled once at module load; used on every text-fallback extraction.
+_CODE_BLOCK_PATTERN = re.compile(r"```json\s*\n(.*?)\n\s*```", re.DOTALL)
+# Whole-string parses use pydantic-core's Rust parser (from_json); the
+# prose scan needs raw_decode, which only the stdlib decoder offers.
+_DECODER = json.JSONDecoder()
+
+
+def criterion_name_set(criteria: list[dict]) -> frozenset[str]:
+    """Return the criterion names, for reuse across k extractions."""
+    return frozenset(c["name"] for c in criteria)
+
 
 def extract_scores_from_tool_call(
     tool_calls: list[ToolCallResult],
     criteria: list[dict],
+    names: frozenset[str] | None = None,
 ) -> dict | None:
     """Extract per-criterion scores from tool call arguments.
 
     Looks for a tool call named 'score_criteria', parses its arguments,
-    and clamps scores to [0.0, 1.0].
+    and clamps each criterion's score to [0.0, 1.0].
 
     Args:
         tool_calls: List of ToolCallResult from the adapter response.
         criteria: List of criterion dicts with name field.
+        names: Precomputed criterion_name_set(criteria), if available.
 
     Returns:
         Parsed dict mapping criterion names to {score, reasoning},
         or None if no matching tool call found.
     """
+    if names is None:
+        names = criterion_name_set(criteria)
+
     for tc in tool_calls:
         if tc.name == "score_criteria":
             args = tc.arguments
             if not isinstance(args, dict):
                 continue
 
-            # Clamp scores to [0.0, 1.0]
-            for key, val in args.items():
+            # Clamp scores to [0.0, 1.0] -- only criteria are read downstream
+            for name in names:
+                val = args.get(name)
                 if isinstance(val, dict) and "score" in val:
                     score = val["score"]
                     if isinstance(score, (int, float)):
@@ -53,9 +72,9 @@ def extract_json_from_text(text: str) -> dict | None:
     """Fallback: extract JSON from text response.
 
     Tries three strategies in order:
-    1. Direct json.loads on the full text
-    2. Brace extraction (first '{' to last '}')
-    3. Markdown code block (```json...```)
+    1. Direct parse of the full text, when it starts with '{'
+    2. Markdown code block (```json...```)
+    3. Scan: raw_decode at each '{' until a JSON object parses
 
     Args:
         text: Raw text content from the LLM response.
@@ -66,71 +85,73 @@ def extract_json_from_text(text: str) -> dict | None:
     if not text:
         return None
 
-    # Strategy 1: direct parse
-    try:
-        result = json.loads(text)
-        if isinstance(result, dict):
-            return result
-    except (json.JSONDecodeError, ValueError):
-        pass
-
-    # Strategy 2: brace extraction
-    first_brace = text.find("{")
-    last_brace = text.rfind("}")
-    if first_brace != -1 and last_brace > first_brace:
+    # Strategy 1: direct parse -- only worth trying when the text is an object
+    stripped = text.lstrip()
+    if stripped.startswith("{"):
         try:
-            result = json.loads(text[first_brace : last_brace + 1])
+            result = from_json(stripped)
             if isinstance(result, dict):
                 return result
-        except (json.JSONDecodeError, ValueError):
+        except ValueError:
             pass
 
-    # Strategy 3: markdown code block
-    match = re.search(r"```json\s*\n(.*?)\n\s*```", text, re.DOTALL)
+    # Strategy 2: markdown code block
+    match = _CODE_BLOCK_PATTERN.search(text)
     if match:
         try:
-            result = json.loads(match.group(1))
+            result = from_json(match.group(1))
             if isinstance(result, dict):
                 return result
-        except (json.JSONDecodeError, ValueError):
+        except ValueError:
             pass
 
+    # Strategy 3: first decodable object, tolerating surrounding prose
+    # and trailing text (including stray braces) after the object.
+    start = text.find("{")
+    while start != -1:
+        try:
+            result, _ = _DECODER.raw_decode(text, start)
+            return result
+        except (json.JSONDecodeError, ValueError):
+            start = text.find("{", start + 1)
+
     return None
 
 
 def extract_scores(
     result: AdapterTurnResult,
     criteria: list[dict],
+    names: frozenset[str] | None = None,
 ) -> dict | None:
     """Main entry point: extract per-criterion scores from adapter result.
 
-    Tries tool_call extraction first, then text-JSON fallback.
+    Tries tool_call extraction first, then text-JSON fallback. The text
+    content is only parsed when no usable tool call is present.
     Validates that the result contains at least one expected criterion name.
 
     Args:
         result: AdapterTurnResult from the judge LLM call.
         criteria: List of criterion dicts with name field.
+        names: Precomputed criterion_name_set(criteria), if available.
 
     Returns:
         Dict mapping criterion names to {score, reasoning},
         or None if extraction fails.
     """
-    criterion_names = {c["name"] for c in criteria}
+    if names is None:
+        names = criterion_name_set(criteria)
 
-    # Try tool call extraction first
+    # Try tool call extraction first -- on success the text is never touched
     if result.tool_calls:
-        scores = extract_scores_from_tool_call(result.tool_calls, criteria)
-        if scores is not None:
-            # Validate at least one expected criterion
-            if any(name in scores for name in criterion_names):
-                return scores
+        scores = extract_scores_from_tool_call(result.tool_calls, criteria, names)
+        if scores is not None and not names.isdisjoint(scores):
+            return scores
 
     # Try text-JSON fallback
     if result.content:
         scores = extract_json_from_text(result.content)
-        if scores is not None:
-            # Validate at least one expected criterion
-            if any(name in scores for name in criterion_names):
-                return scores
+        if scores is not None and not names.isdisjoint(scores):
+            return scores
 
     return None
+
@@ -10,7 +10,10 @@ Sugar types (expanded to jmespath):
 
 from __future__ import annotations
 
-OPERATOR_KEYS = {"eq", "ne", "gt", "gte", "lt", "lte", "contains", "regex"}
+OPERATOR_KEYS = frozenset(
+    {"eq", "ne", "gt", "gte", "lt", "lte", "contains", "regex"}
+)
+_OPERATOR_KEYS_SORTED = sorted(OPERATOR_KEYS)
 
 
 def _expand_tool_called(raw: dict) -> dict:
@@ -62,19 +65,18 @@ def normalize_assertion(raw: dict) -> dict:
 
     found_ops = OPERATOR_KEYS & raw.keys()
 
-    if len(found_ops) > 1:
-        raise ValueError(
-            f"Assertion has multiple operator keys: {sorted(found_ops)}. "
-            "Use exactly one operator per assertion."
-        )
-
-    if len(found_ops) == 0:
+    if len(found_ops) != 1:
+        if found_ops:
+            raise ValueError(
+                f"Assertion has multiple operator keys: {sorted(found_ops)}. "
+                "Use exactly one operator per assertion."
+            )
         raise ValueError(
             f"Assertion has no 'type' and no operator key from "
-            f"{sorted(OPERATOR_KEYS)}. Cannot determine assertion type."
+            f"{_OPERATOR_KEYS_SORTED}. Cannot determine assertion type."
         )
 
-    operator = found_ops.pop()
+    (operator,) = found_ops
     value = raw[operator]
     expression = raw.get("path", "response.content")
     weight = raw.get("weight", 1.0)
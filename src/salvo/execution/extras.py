@@ -8,9 +8,11 @@ credential leakage and oversized payloads.
 from __future__ import annotations
 
 import json
+import re
 
 # Keys that are blocked from extras to prevent accidental credential leakage.
-# Matching is case-insensitive.
+# Matching is case-insensitive, and any ``<prefix>_`` variant of a blocked
+# key (e.g. ``stripe_token``, ``db_password``) is blocked as well.
 BLOCKED_KEYS: frozenset[str] = frozenset({
     "api_key",
     "api_secret",
@@ -23,6 +25,14 @@ BLOCKED_KEYS: frozenset[str] = frozenset({
     "refresh_token",
 })
 
+# Single pattern (used with fullmatch) covering BLOCKED_KEYS and their prefixed variants.
+_BLOCKED_RE = re.compile(
+    r"(?:\w*_)?(?:"
+    + "|".join(sorted(map(re.escape, BLOCKED_KEYS), key=len, reverse=True))
+    + r")",
+    re.IGNORECASE,
+)
+
 # Maximum number of keys allowed in extras.
 MAX_EXTRAS_KEYS: int = 10
 
@@ -34,7 +44,8 @@ def validate_extras(extras: dict) -> dict:
     """Validate an extras dict for security and size constraints.
 
     Checks:
-    1. No keys match the blocked keys list (case-insensitive).
+    1. No keys match the blocked keys list, with or without a
+       ``<prefix>_`` qualifier (case-insensitive).
     2. Number of keys does not exceed MAX_EXTRAS_KEYS.
     3. JSON-serialized size does not exceed MAX_EXTRAS_SIZE bytes.
 
@@ -49,7 +60,7 @@ def validate_extras(extras: dict) -> dict:
     """
     # Check for blocked keys (case-insensitive)
     for key in extras:
-        if key.lower() in BLOCKED_KEYS:
+        if _BLOCKED_RE.fullmatch(key):
             raise ValueError(
                 f"Extras key '{key}' is blocked because it looks like a secret or credential. "
                 f"Secrets should be configured via environment variables, not passed in extras."
@@ -6,6 +6,7 @@ content and enforces size limits to prevent oversized trace files.
 
 from __future__ import annotations
 
+import copy
 import json
 import re
 from typing import TYPE_CHECKING
@@ -32,7 +33,22 @@ _COMPILED_PATTERNS: list[re.Pattern[str]] = [
     re.compile(p) for p in REDACTION_PATTERNS
 ]
 
+
+def _scoped(pattern: str) -> str:
+    """Wrap a pattern as a group, turning a leading (?i) into a scoped flag."""
+    if pattern.startswith("(?i)"):
+        return f"(?i:{pattern[4:]})"
+    return f"(?:{pattern})"
+
+
+# Union of all patterns, used as a single-pass prefilter: if nothing
+# matches, none of the sequential substitutions can change the content.
+_ANY_SECRET_PATTERN: re.Pattern[str] = re.compile(
+    "|".join(_scoped(p) for p in REDACTION_PATTERNS)
+)
+
 REDACTED_PLACEHOLDER = "[REDACTED]"
+TRUNCATION_SUFFIX = "... [truncated]"
 
 # Size limits for trace storage.
 MAX_MESSAGE_CONTENT_SIZE: int = 50_000  # 50KB per message
@@ -43,8 +59,8 @@ MAX_TRACE_TOTAL_SIZE: int = 5_000_000  # 5MB total trace
 def redact_content(content: str) -> str:
     """Replace secret patterns in content with [REDACTED].
 
-    Applies all REDACTION_PATTERNS sequentially. Patterns that
-    don't match are skipped (content passes through unchanged).
+    Applies all REDACTION_PATTERNS sequentially. Content with no
+    match for any pattern is returned as-is after a single scan.
 
     Args:
         content: The string to redact.
@@ -52,6 +68,8 @@ def redact_content(content: str) -> str:
     Returns:
         Content with matching secret patterns replaced.
     """
+    if not _ANY_SECRET_PATTERN.search(content):
+        return content
     for pattern in _COMPILED_PATTERNS:
         content = pattern.sub(REDACTED_PLACEHOLDER, content)
     return content
@@ -70,7 +88,7 @@ def truncate_content(content: str, max_size: int) -> str:
     """
     if len(content) <= max_size:
         return content
-    return content[:max_size] + "... [truncated]"
+    return content[:max_size] + TRUNCATION_SUFFIX
 
 
 def apply_trace_limits(trace: "RunTrace") -> "RunTrace":
@@ -84,10 +102,14 @@ def apply_trace_limits(trace: "RunTrace") -> "RunTrace":
         trace: The RunTrace to sanitize.
 
     Returns:
-        A new RunTrace with redacted and truncated content.
+        A new RunTrace with redacted and truncated content. It shares no
+        mutable containers with the input trace.
     """
-    from salvo.execution.trace import RunTrace, TraceMessage
+    from salvo.execution.trace import TraceMessage
 
+    # model_copy skips validation: every field here comes from an
+    # already-validated trace. It copies shallowly, so containers that
+    # are carried over are deep-copied to keep the two traces apart.
     sanitized_messages: list[TraceMessage] = []
     for msg in trace.messages:
         new_content = msg.content
@@ -101,32 +123,19 @@ def apply_trace_limits(trace: "RunTrace") -> "RunTrace":
             serialized = json.dumps(new_tool_calls)
             if len(serialized) > MAX_RAW_RESPONSE_SIZE:
                 new_tool_calls = [{"truncated": True, "original_count": len(new_tool_calls)}]
+            else:
+                new_tool_calls = copy.deepcopy(new_tool_calls)
 
         sanitized_messages.append(
-            TraceMessage(
-                role=msg.role,
-                content=new_content,
-                tool_calls=new_tool_calls,
-                tool_call_id=msg.tool_call_id,
-                tool_name=msg.tool_name,
+            msg.model_copy(
+                update={"content": new_content, "tool_calls": new_tool_calls}
             )
         )
 
-    return RunTrace(
-        messages=sanitized_messages,
-        tool_calls_made=trace.tool_calls_made,
-        turn_count=trace.turn_count,
-        input_tokens=trace.input_tokens,
-        output_tokens=trace.output_tokens,
-        total_tokens=trace.total_tokens,
-        latency_seconds=trace.latency_seconds,
-        final_content=trace.final_content,
-        finish_reason=trace.finish_reason,
-        model=trace.model,
-        provider=trace.provider,
-        timestamp=trace.timestamp,
-        scenario_hash=trace.scenario_hash,
-        cost_usd=trace.cost_usd,
-        extras_resolved=trace.extras_resolved,
-        max_turns_hit=trace.max_turns_hit,
+    return trace.model_copy(
+        update={
+            "messages": sanitized_messages,
+            "tool_calls_made": copy.deepcopy(trace.tool_calls_made),
+            "extras_resolved": copy.deepcopy(trace.extras_resolved),
+        }
     )
@@ -7,6 +7,7 @@ calls) or the max turns safety net is hit.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import time
@@ -18,7 +19,6 @@ from salvo.adapters.base import (
     AdapterTurnResult,
     BaseAdapter,
     Message,
-    TokenUsage,
     ToolCallResult,
 )
 from salvo.execution.cost import estimate_cost
@@ -72,6 +72,46 @@ class ScenarioRunner:
     def __init__(self, adapter: BaseAdapter) -> None:
         self.adapter = adapter
 
+    async def _resolve_tool(
+        self,
+        tc: ToolCallResult,
+        mock_by_name: dict[str, str | dict[str, Any]],
+        mock_by_lower: dict[str, str | dict[str, Any]],
+    ) -> Message:
+        """Resolve a single tool call to its mock tool_result message.
+
+        Async so tool handlers that perform I/O can run concurrently
+        when the model issues parallel tool calls. An exact name match
+        wins; otherwise the name is matched case-insensitively, since
+        providers do not always echo tool names in their original case.
+
+        Raises:
+            ToolMockNotFoundError: If the tool has no mock_response.
+        """
+        # None entries are filtered out when the map is built, so a
+        # single .get() doubles as the membership check.
+        mock = mock_by_name.get(tc.name)
+        if mock is None:
+            mock = mock_by_lower.get(tc.name.lower())
+        if mock is None:
+            raise ToolMockNotFoundError(
+                tool_name=tc.name,
+                available_mocks=set(mock_by_name),
+            )
+
+        # Serialize mock response
+        if isinstance(mock, dict):
+            mock_content = json.dumps(mock)
+        else:
+            mock_content = str(mock)
+
+        return Message(
+            role="tool_result",
+            content=mock_content,
+            tool_call_id=tc.id,
+            tool_name=tc.name,
+        )
+
     async def run(self, scenario: Scenario, config: AdapterConfig) -> RunTrace:
         """Execute a scenario and return the full run trace.
 
@@ -87,7 +127,9 @@ class ScenarioRunner:
         """
         max_turns = scenario.max_turns
 
-        # Build initial messages
+        # Build initial messages. This is the live conversation handed to
+        # send_turn() every turn, so it must only ever hold real messages
+        # (no preallocated placeholder slots).
         messages: list[Message] = []
         if scenario.system_prompt:
             messages.append(Message(role="system", content=scenario.system_prompt))
@@ -105,17 +147,17 @@ class ScenarioRunner:
                 for tool in scenario.tools
             ]
 
-        # Build mock_responses map
-        mock_responses: dict[str, str | dict[str, Any]] = {
-            tool.name: tool.mock_response
-            for tool in scenario.tools
-            if tool.mock_response is not None
-        }
+        # Tool mock maps are built lazily on the first turn with tool calls,
+        # so single-turn text responses skip the setup entirely.
+        mock_by_name: dict[str, str | dict[str, Any]] | None = None
+        mock_by_lower: dict[str, str | dict[str, Any]] = {}
 
         # Initialize tracking
-        total_usage = TokenUsage()
+        input_tokens = 0
+        output_tokens = 0
+        total_tokens = 0
         all_tool_calls: list[dict[str, Any]] = []
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
         turn_count = 0
         result: AdapterTurnResult | None = None
 
@@ -126,9 +168,10 @@ class ScenarioRunner:
             result = await self.adapter.send_turn(messages, tool_defs, config)
 
             # Accumulate token usage
-            total_usage.input_tokens += result.usage.input_tokens
-            total_usage.output_tokens += result.usage.output_tokens
-            total_usage.total_tokens += result.usage.total_tokens
+            usage = result.usage
+            input_tokens += usage.input_tokens
+            output_tokens += usage.output_tokens
+            total_tokens += usage.total_tokens
 
             # Append assistant message to conversation
             messages.append(
@@ -143,30 +186,28 @@ class ScenarioRunner:
             if not result.tool_calls:
                 break
 
-            # Process ALL tool calls (handles parallel tool calls)
-            for tc in result.tool_calls:
-                if tc.name not in mock_responses:
-                    raise ToolMockNotFoundError(
-                        tool_name=tc.name,
-                        available_mocks=set(mock_responses.keys()),
-                    )
-
-                # Serialize mock response
-                mock = mock_responses[tc.name]
-                if isinstance(mock, dict):
-                    mock_content = json.dumps(mock)
-                else:
-                    mock_content = str(mock)
-
-                # Append tool result message
-                messages.append(
-                    Message(
-                        role="tool_result",
-                        content=mock_content,
-                        tool_call_id=tc.id,
-                        tool_name=tc.name,
-                    )
+            if mock_by_name is None:
+                # Build the tool name -> mock_response map once per run
+                mock_by_name = {
+                    tool.name: tool.mock_response
+                    for tool in scenario.tools
+                    if tool.mock_response is not None
+                }
+                # Lowercased mirror for case-insensitive fallback lookups
+                mock_by_lower = {
+                    name.lower(): mock for name, mock in mock_by_name.items()
+                }
+
+            # Process ALL tool calls (handles parallel tool calls).
+            # gather() preserves call order, so tool_result messages line
+            # up with the assistant's tool_calls.
+            tool_results = await asyncio.gather(
+                *(
+                    self._resolve_tool(tc, mock_by_name, mock_by_lower)
+                    for tc in result.tool_calls
                 )
+            )
+            messages.extend(tool_results)
 
             # Record tool calls
             all_tool_calls.extend(
@@ -174,7 +215,7 @@ class ScenarioRunner:
                 for tc in result.tool_calls
             )
 
-        elapsed = time.perf_counter() - start_time
+        elapsed = (time.perf_counter_ns() - start_ns) / 1e9
 
         # Determine if max turns was hit (still had pending tool calls)
         max_turns_hit = (
@@ -184,15 +225,13 @@ class ScenarioRunner:
         )
 
         # Compute scenario hash
-        scenario_hash = hashlib.sha256(
-            scenario.model_dump_json().encode()
-        ).hexdigest()
+        scenario_hash = hashlib.sha256(scenario.json_bytes).hexdigest()
 
         # Estimate cost
         cost_usd = estimate_cost(
             model=config.model,
-            input_tokens=total_usage.input_tokens,
-            output_tokens=total_usage.output_tokens,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
         )
 
         # Build trace messages from conversation history
@@ -206,9 +245,9 @@ class ScenarioRunner:
             messages=trace_messages,
             tool_calls_made=all_tool_calls,
             turn_count=turn_count,
-            input_tokens=total_usage.input_tokens,
-            output_tokens=total_usage.output_tokens,
-            total_tokens=total_usage.total_tokens,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=total_tokens,
             latency_seconds=elapsed,
             final_content=final_content,
             finish_reason=finish_reason,
@@ -8,29 +8,32 @@ with source positions and collected for batch reporting.
 from __future__ import annotations
 
 import difflib
+import functools
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from pydantic import ValidationError
+from pydantic_core import from_json
 
-from salvo.evaluation.normalizer import normalize_assertions
 from salvo.loader.yaml_parser import (
     YAMLParseError,
-    parse_yaml_file,
     parse_yaml_with_lines,
 )
 from salvo.models.scenario import Scenario
 
 
 # All valid top-level fields on the Scenario model, used for typo suggestions
-VALID_SCENARIO_FIELDS: list[str] = list(Scenario.model_fields.keys())
+VALID_SCENARIO_FIELDS: tuple[str, ...] = tuple(Scenario.model_fields)
+_KNOWN_SCENARIO_FIELDS: frozenset[str] = frozenset(VALID_SCENARIO_FIELDS)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationErrorDetail:
     """A single validation error with source position and context.
 
+    Immutable, so cached validation results can be shared between callers.
+
     Attributes:
         field: The field name or dotted path that caused the error.
         message: Human-readable error description.
@@ -63,23 +66,26 @@ def _find_line_for_field(
 
     Tries exact match first, then progressively shorter prefixes.
     """
-    # Exact match
-    if field_path in line_map:
-        return line_map[field_path]
-
-    # Try progressively shorter prefixes
-    parts = field_path.split(".")
-    while parts:
-        prefix = ".".join(parts)
+    # Exact match, then progressively shorter prefixes
+    prefix = field_path
+    while prefix:
         if prefix in line_map:
             return line_map[prefix]
-        parts.pop()
+        prefix = prefix.rpartition(".")[0]
 
     return None, None
 
 
+@functools.lru_cache(maxsize=512)
 def _get_suggestion(field_name: str) -> str | None:
-    """Get a 'did you mean?' suggestion for a mistyped field name."""
+    """Get a 'did you mean?' suggestion for a mistyped field name.
+
+    Memoized: the same typo tends to recur across a suite's files.
+    Known fields get no suggestion -- an extra key nested under one
+    (e.g. ``tools.0.bogus``) is not a misspelling of the parent.
+    """
+    if field_name in _KNOWN_SCENARIO_FIELDS:
+        return None
     matches = difflib.get_close_matches(
         field_name, VALID_SCENARIO_FIELDS, n=1, cutoff=0.6
     )
@@ -107,12 +113,16 @@ def validate_scenario(
     """
     # Normalize operator-key-style assertions before Pydantic validation
     if isinstance(raw_data.get("assertions"), list):
+        # Deferred: importing salvo.evaluation loads every evaluator and
+        # the execution stack, which validation-only callers never use.
+        from salvo.evaluation.normalizer import normalize_assertion
+
         normalized: list[dict] = []
         norm_errors: list[ValidationErrorDetail] = []
         for idx, raw_assertion in enumerate(raw_data["assertions"]):
             if isinstance(raw_assertion, dict):
                 try:
-                    normalized.append(normalize_assertions([raw_assertion])[0])
+                    normalized.append(normalize_assertion(raw_assertion))
                 except ValueError as ve:
                     norm_errors.append(
                         ValidationErrorDetail(
@@ -132,7 +142,7 @@ def validate_scenario(
         return scenario, []
     except ValidationError as e:
         errors: list[ValidationErrorDetail] = []
-        for err in e.errors():
+        for err in e.errors(include_url=False):
             loc = err.get("loc", ())
             field_path = _loc_to_field_path(loc)
             error_type = err.get("type", "unknown")
@@ -145,7 +155,8 @@ def validate_scenario(
 
             # Generate suggestion for unknown/extra fields
             suggestion = None
-            if "extra" in error_type.lower() or "forbidden" in error_type.lower():
+            lowered_type = error_type.lower()
+            if "extra" in lowered_type or "forbidden" in lowered_type:
                 top_field = str(loc[0]) if loc else field_path
                 suggestion = _get_suggestion(top_field)
 
@@ -164,6 +175,30 @@ def validate_scenario(
         return None, errors
 
 
+def _validate_json_source(
+    source: str,
+    filename: str,
+) -> Scenario | None:
+    """Validate a JSON-syntax scenario without the YAML loader.
+
+    JSON is (practically) a subset of YAML, and generated scenarios are
+    often written as JSON objects; pydantic-core's parser handles those
+    far faster than the line-tracking loader. Only clean successes are
+    returned -- on anything else the caller takes the YAML path, which
+    supplies the line numbers for error reports.
+    """
+    if not source.lstrip().startswith("{"):
+        return None
+    try:
+        raw_data = from_json(source)
+    except ValueError:
+        return None
+    if not isinstance(raw_data, dict):
+        return None
+    scenario, _ = validate_scenario(raw_data, {}, source, filename=filename)
+    return scenario
+
+
 def validate_scenario_file(
     filepath: Path,
 ) -> tuple[Scenario | None, list[ValidationErrorDetail]]:
@@ -178,8 +213,15 @@ def validate_scenario_file(
     Returns:
         Tuple of (Scenario, []) on success, or (None, errors) on failure.
     """
+    source = filepath.read_text(encoding="utf-8")
+    scenario = _validate_json_source(source, str(filepath))
+    if scenario is not None:
+        return scenario, []
+
     try:
-        raw_data, line_map = parse_yaml_file(filepath)
+        raw_data, line_map = parse_yaml_with_lines(
+            source, filename=str(filepath), base_dir=filepath.parent
+        )
     except YAMLParseError as e:
         return None, [
             ValidationErrorDetail(
@@ -200,45 +242,74 @@ def validate_scenario_file(
             )
         ]
 
-    source = filepath.read_text(encoding="utf-8")
     return validate_scenario(raw_data, line_map, source, filename=str(filepath))
 
 
-def validate_scenario_string(
+def _validate_string(
     source: str,
-    filename: str = "<string>",
-) -> tuple[Scenario | None, list[ValidationErrorDetail]]:
-    """Validate a scenario from a YAML string.
+    filename: str,
+) -> tuple[Scenario | None, tuple[ValidationErrorDetail, ...]]:
+    """Parse and validate source; see validate_scenario_string.
 
-    Parses YAML with line tracking and validates against the Scenario model.
-
-    Args:
-        source: YAML content as a string.
-        filename: Filename for error messages.
-
-    Returns:
-        Tuple of (Scenario, []) on success, or (None, errors) on failure.
+    Memoized results are shared between callers; validate_scenario_string
+    hands out a copy of the (mutable) scenario so it stays pristine.
     """
+    scenario = _validate_json_source(source, filename)
+    if scenario is not None:
+        return scenario, ()
+
     try:
         raw_data, line_map = parse_yaml_with_lines(source, filename=filename)
     except YAMLParseError as e:
-        return None, [
+        return None, (
             ValidationErrorDetail(
                 field="<yaml>",
                 message=e.message,
                 type="yaml_syntax_error",
                 line=e.line,
                 col=e.column,
-            )
-        ]
+            ),
+        )
 
     if raw_data is None:
-        return None, [
+        return None, (
             ValidationErrorDetail(
                 field="<yaml>",
                 message="Input is empty or contains only comments",
                 type="empty_input",
-            )
-        ]
+            ),
+        )
+
+    scenario, errors = validate_scenario(raw_data, line_map, source, filename=filename)
+    return scenario, tuple(errors)
 
-    return validate_scenario(raw_data, line_map, source, filename=filename)
+
+_validate_string_cached = functools.lru_cache(maxsize=2048)(_validate_string)
+
+
+def validate_scenario_string(
+    source: str,
+    filename: str = "<string>",
+) -> tuple[Scenario | None, list[ValidationErrorDetail]]:
+    """Validate a scenario from a YAML string.
+
+    Parses YAML with line tracking and validates against the Scenario model.
+    Results are cached per (source, filename) for the life of the process,
+    except for sources using !include, whose result depends on the working
+    directory and the included files; each call returns its own copy of the
+    scenario and error list.
+
+    Args:
+        source: YAML content as a string.
+        filename: Filename for error messages.
+
+    Returns:
+        Tuple of (Scenario, []) on success, or (None, errors) on failure.
+    """
+    if "!include" in source:
+        scenario, errors = _validate_string(source, filename)
+    else:
+        scenario, errors = _validate_string_cached(source, filename)
+    if scenario is not None:
+        scenario = scenario.model_copy(deep=True)
+    return scenario, list(errors)
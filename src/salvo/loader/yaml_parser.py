@@ -7,11 +7,24 @@ point to the exact location in the user's YAML file.
 
 from __future__ import annotations
 
+import re
+import sys
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# libyaml's C parser does the scanning and composing when PyYAML was
+# built with it; node marks (and so line tracking) are identical.
+if yaml.__with_libyaml__:
+    _SafeLoaderBase = yaml.CSafeLoader
+else:
+    _SafeLoaderBase = yaml.SafeLoader
+
+# Sources made only of blank and comment lines parse to None; matching
+# them up front skips building a loader at all.
+_BLANK_OR_COMMENTS_RE = re.compile(r"(?:[^\S\n]*(?:#[^\n]*)?\n)*[^\S\n]*(?:#[^\n]*)?")
+
 
 class YAMLParseError(Exception):
     """Raised when YAML syntax cannot be parsed.
@@ -37,7 +50,7 @@ class YAMLParseError(Exception):
         super().__init__(message)
 
 
-class LineTrackingLoader(yaml.SafeLoader):
+class LineTrackingLoader(_SafeLoaderBase):
     """YAML SafeLoader subclass that captures line numbers for all keys.
 
     Builds a hierarchical line_map dict mapping dotted key paths to
@@ -49,38 +62,48 @@ class LineTrackingLoader(yaml.SafeLoader):
         self.line_map: dict[str, tuple[int, int]] = {}
         self._filename = filename
         self._base_dir: Path | None = None
+        # Full dotted path of each enclosing container, innermost last,
+        # so a key's path is one concatenation rather than a join.
         self._prefix_stack: list[str] = []
 
+    def _child_path(self, key: str) -> str:
+        """Return the dotted path of key within the current container."""
+        if self._prefix_stack:
+            return f"{self._prefix_stack[-1]}.{key}"
+        return key
+
     def construct_mapping(self, node: yaml.MappingNode, deep: bool = False) -> dict[str, Any]:
         """Override to capture line numbers for every key in the mapping."""
         self.flatten_mapping(node)
-        pairs = []
+        mapping: dict[Any, Any] = {}
         for key_node, value_node in node.value:
             key = self.construct_object(key_node, deep=deep)
 
-            if isinstance(key, str) and key_node.start_mark is not None:
+            # Interned so keys repeated across list items (tools.N.name)
+            # share one string object.
+            full_key = None
+            if isinstance(key, str):
+                key = sys.intern(key)
+                full_key = self._child_path(key)
+            if full_key is not None and key_node.start_mark is not None:
                 line = key_node.start_mark.line + 1  # 1-indexed
                 col = key_node.start_mark.column + 1  # 1-indexed
-                if self._prefix_stack:
-                    full_key = ".".join(self._prefix_stack) + "." + key
-                else:
-                    full_key = key
                 self.line_map[full_key] = (line, col)
 
             # Push key onto prefix stack before constructing the value
             # so nested mappings/sequences get the correct path prefix
-            if isinstance(key, str) and isinstance(
+            if full_key is not None and isinstance(
                 value_node, (yaml.MappingNode, yaml.SequenceNode)
             ):
-                self._prefix_stack.append(key)
+                self._prefix_stack.append(full_key)
                 value = self.construct_object(value_node, deep=deep)
                 self._prefix_stack.pop()
             else:
                 value = self.construct_object(value_node, deep=deep)
 
-            pairs.append((key, value))
+            mapping[key] = value
 
-        return dict(pairs)
+        return mapping
 
     def construct_sequence(self, node: yaml.SequenceNode, deep: bool = False) -> list[Any]:
         """Override to track list item indices in the key path."""
@@ -88,10 +111,7 @@ class LineTrackingLoader(yaml.SafeLoader):
         for idx, child_node in enumerate(node.value):
             if isinstance(child_node, yaml.MappingNode):
                 # Push index prefix for nested mapping keys
-                if self._prefix_stack:
-                    self._prefix_stack.append(str(idx))
-                else:
-                    self._prefix_stack.append(str(idx))
+                self._prefix_stack.append(self._child_path(str(idx)))
                 item = self.construct_mapping(child_node, deep=deep)
                 self._prefix_stack.pop()
                 result.append(item)
@@ -135,7 +155,7 @@ def _include_constructor(loader: LineTrackingLoader, node: yaml.ScalarNode) -> A
         filepath = Path(relative_path)
 
     with open(filepath) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_SafeLoaderBase)
 
 
 LineTrackingLoader.add_constructor("!include", _include_constructor)
@@ -161,6 +181,9 @@ def parse_yaml_with_lines(
     Raises:
         YAMLParseError: If the YAML contains syntax errors.
     """
+    if _BLANK_OR_COMMENTS_RE.fullmatch(source):
+        return None, {}
+
     try:
         loader = LineTrackingLoader(source, filename=filename)
         if base_dir is not None:
@@ -11,6 +11,8 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
+from salvo.models.scenario import InternedStr
+
 
 class RecordingConfig(BaseModel):
     """Configuration for trace recording behavior.
@@ -19,7 +21,7 @@ class RecordingConfig(BaseModel):
     redaction patterns that extend the built-in set.
     """
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "defer_build": True}
 
     mode: Literal["full", "metadata_only"] = "full"
     custom_redaction_patterns: list[str] = Field(default_factory=list)
@@ -32,23 +34,26 @@ class JudgeConfig(BaseModel):
     used for judge assertions. Per-assertion overrides take precedence.
     """
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "defer_build": True}
 
-    adapter: str = "openai"
-    model: str = "gpt-4o-mini"
+    adapter: InternedStr = "openai"
+    model: InternedStr = "gpt-4o-mini"
     k: int = Field(default=3, ge=1, le=21)
     temperature: float = 0.0
     max_tokens: int = 1024
     default_threshold: float = Field(default=0.8, ge=0.0, le=1.0)
+    cache: bool = False  # Reuse judge responses across runs (temperature 0.0 only)
+    early_stop: bool = False  # Stop sampling once the majority verdict is decided
+    max_concurrency: int = Field(default=16, ge=1)  # In-flight judge calls per run
 
 
 class ProjectConfig(BaseModel):
     """Project-level configuration loaded from salvo.yaml."""
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "defer_build": True}
 
-    default_adapter: str = "openai"
-    default_model: str = "gpt-4o"
+    default_adapter: InternedStr = "openai"
+    default_model: InternedStr = "gpt-4o"
     scenarios_dir: str = "scenarios"
     ci_mode: bool = False
     storage_dir: str = ".salvo"
@@ -76,9 +81,16 @@ def find_project_root(start: Path | None = None) -> Path:
     return Path.cwd()
 
 
+# Resolved salvo.yaml path -> (mtime_ns, size, parsed config).
+_LOADED_CONFIGS: dict[Path, tuple[int, int, ProjectConfig]] = {}
+
+
 def load_project_config(project_root: Path | None = None) -> ProjectConfig:
     """Load ProjectConfig from salvo.yaml. Returns defaults if not found.
 
+    Parsed configs are cached per file and reused while its mtime and
+    size are unchanged, so repeat loads cost a single stat().
+
     Args:
         project_root: Path to the project root directory. If None,
             uses find_project_root() to locate it.
@@ -88,12 +100,24 @@ def load_project_config(project_root: Path | None = None) -> ProjectConfig:
     """
     if project_root is None:
         project_root = find_project_root()
-    config_path = project_root / "salvo.yaml"
-    if not config_path.exists():
+    config_path = (project_root / "salvo.yaml").resolve()
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
         return ProjectConfig()
+
+    cached = _LOADED_CONFIGS.get(config_path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2].model_copy(deep=True)
+
     import yaml
 
-    raw = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    # libyaml's C loader when PyYAML was built with it
+    loader = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+    raw = yaml.load(config_path.read_text(encoding="utf-8"), Loader=loader)
     if raw is None:
-        return ProjectConfig()
-    return ProjectConfig.model_validate(raw)
+        config = ProjectConfig()
+    else:
+        config = ProjectConfig.model_validate(raw)
+    _LOADED_CONFIGS[config_path] = (st.st_mtime_ns, st.st_size, config)
+    return config.model_copy(deep=True)
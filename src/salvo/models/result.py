@@ -15,6 +15,8 @@ from pydantic import BaseModel
 class RunMetadata(BaseModel):
     """Metadata about a single scenario run."""
 
+    model_config = {"defer_build": True}
+
     scenario_name: str
     scenario_file: str
     scenario_hash: str
@@ -31,6 +33,8 @@ class RunMetadata(BaseModel):
 class EvalResult(BaseModel):
     """Result of evaluating a single assertion against a run."""
 
+    model_config = {"defer_build": True}
+
     assertion_type: str
     score: float
     passed: bool
@@ -47,6 +51,8 @@ class RunResult(BaseModel):
     Designed for JSON serialization and lossless round-trip deserialization.
     """
 
+    model_config = {"defer_build": True}
+
     run_id: str
     metadata: RunMetadata
     eval_results: list[EvalResult] = []
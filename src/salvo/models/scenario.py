@@ -6,15 +6,22 @@ agent test scenarios, including tool definitions and assertions.
 
 from __future__ import annotations
 
-from typing import Any, Literal
+import sys
+from functools import cached_property
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
+from pydantic_core import to_json
+
+# Adapter and model names come from a small vocabulary repeated across
+# every loaded scenario and config; interning shares one string each.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
 
 
 class ToolParameter(BaseModel):
     """Parameters schema for a tool definition (JSON Schema subset)."""
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "defer_build": True}
 
     type: Literal["object"] = "object"
     properties: dict[str, Any] = Field(default_factory=dict)
@@ -24,7 +31,7 @@ class ToolParameter(BaseModel):
 class ToolDef(BaseModel):
     """Definition of a tool available to the agent during a scenario run."""
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "defer_build": True}
 
     name: str
     description: str
@@ -35,9 +42,9 @@ class ToolDef(BaseModel):
 class Assertion(BaseModel):
     """A single assertion to evaluate against an agent run."""
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "defer_build": True}
 
-    type: str
+    type: InternedStr
     weight: float = 1.0
     required: bool = False
     tool: str | None = None
@@ -45,12 +52,12 @@ class Assertion(BaseModel):
     sequence: list[str] | None = None
     value: Any = None
     expression: str | None = None
-    operator: str | None = None
+    operator: InternedStr | None = None
     max_usd: float | None = None
     max_seconds: float | None = None
     # Judge-specific optional fields
     criteria: list[dict[str, Any]] | None = None
-    judge_model: str | None = None
+    judge_model: InternedStr | None = None
     k: int | None = None
     include_system_prompt: bool = False
     custom_prompt: str | None = None
@@ -65,12 +72,12 @@ class Scenario(BaseModel):
     tools, and evaluation assertions.
     """
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "defer_build": True}
 
     description: str = ""
     tags: dict[str, str] = Field(default_factory=dict)
-    adapter: str = "openai"
-    model: str
+    adapter: InternedStr = "openai"
+    model: InternedStr
     system_prompt: str = ""
     prompt: str
     tools: list[ToolDef] = Field(default_factory=list)
@@ -80,3 +87,24 @@ class Scenario(BaseModel):
     temperature: float | None = None
     seed: int | None = None
     extras: dict[str, Any] = Field(default_factory=dict)
+
+    @cached_property
+    def json_bytes(self) -> bytes:
+        """Compact JSON serialization, computed once per instance.
+
+        Used for the scenario hash, which every trial of a run needs.
+        The cache is dropped on attribute assignment and model_copy;
+        in-place mutation of nested fields is not tracked.
+        """
+        return to_json(self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self.__dict__.pop("json_bytes", None)
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> Scenario:
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("json_bytes", None)
+        return copied
@@ -30,7 +30,7 @@ class TrialResult(BaseModel):
     information, and individual assertion evaluation results.
     """
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "defer_build": True}
 
     trial_number: int
     status: TrialStatus
@@ -63,7 +63,7 @@ class TrialSuiteResult(BaseModel):
     cross-trial assertion failure rankings.
     """
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "defer_build": True}
 
     run_id: str
     scenario_name: str
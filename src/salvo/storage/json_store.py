@@ -13,6 +13,8 @@ import os
 from pathlib import Path
 from uuid import uuid7
 
+from pydantic_core import to_json
+
 from salvo.execution.trace import RunTrace
 from salvo.models.result import RunResult
 from salvo.models.trial import TrialSuiteResult
@@ -63,13 +65,12 @@ class RunStore:
             run_result = run_result.model_copy(update={"run_id": run_id})
 
         # Serialize to JSON
-        data = run_result.model_dump(mode="json")
-        content = json.dumps(data, indent=2, ensure_ascii=False)
+        content = to_json(run_result, indent=2)
 
         # Atomic write: write to .tmp then rename
         run_file = self.runs_dir / f"{run_id}.json"
         tmp_file = self.runs_dir / f"{run_id}.json.tmp"
-        tmp_file.write_text(content, encoding="utf-8")
+        tmp_file.write_bytes(content)
         tmp_file.rename(run_file)
 
         # Update index
@@ -91,7 +92,7 @@ class RunStore:
             FileNotFoundError: If no run with that ID exists.
         """
         run_file = self.runs_dir / f"{run_id}.json"
-        content = run_file.read_text(encoding="utf-8")
+        content = run_file.read_bytes()
         return RunResult.model_validate_json(content)
 
     def list_runs(self, scenario_name: str | None = None) -> list[str]:
@@ -140,12 +141,12 @@ class RunStore:
         """
         self.traces_dir.mkdir(parents=True, exist_ok=True)
 
-        content = trace.model_dump_json(indent=2)
+        content = to_json(trace, indent=2)
 
         # Atomic write
         trace_file = self.traces_dir / f"{run_id}.json"
         tmp_file = self.traces_dir / f"{run_id}.json.tmp"
-        tmp_file.write_text(content, encoding="utf-8")
+        tmp_file.write_bytes(content)
         tmp_file.rename(trace_file)
 
     def load_trace(self, run_id: str) -> RunTrace | None:
@@ -160,7 +161,7 @@ class RunStore:
         trace_file = self.traces_dir / f"{run_id}.json"
         if not trace_file.exists():
             return None
-        content = trace_file.read_text(encoding="utf-8")
+        content = trace_file.read_bytes()
         return RunTrace.model_validate_json(content)
 
     def save_suite_result(self, suite: TrialSuiteResult) -> str:
@@ -178,12 +179,12 @@ class RunStore:
         self.ensure_dirs()
 
         run_id = suite.run_id
-        content = suite.model_dump_json(indent=2)
+        content = to_json(suite, indent=2)
 
         # Atomic write
         run_file = self.runs_dir / f"{run_id}.json"
         tmp_file = self.runs_dir / f"{run_id}.json.tmp"
-        tmp_file.write_text(content, encoding="utf-8")
+        tmp_file.write_bytes(content)
         tmp_file.rename(run_file)
 
         # Update index under scenario_name
@@ -230,7 +231,7 @@ class RunStore:
             FileNotFoundError: If no suite with that ID exists.
         """
         run_file = self.runs_dir / f"{run_id}.json"
-        content = run_file.read_text(encoding="utf-8")
+        content = run_file.read_bytes()
         return TrialSuiteResult.model_validate_json(content)
 
     def load_latest_suite(self) -> TrialSuiteResult | None:
@@ -275,12 +276,12 @@ class RunStore:
         """
         self.traces_dir.mkdir(parents=True, exist_ok=True)
 
-        content = recorded.model_dump_json(indent=2)
+        content = to_json(recorded, indent=2)
 
         # Atomic write
         trace_file = self.traces_dir / f"{run_id}.recorded.json"
         tmp_file = self.traces_dir / f"{run_id}.recorded.json.tmp"
-        tmp_file.write_text(content, encoding="utf-8")
+        tmp_file.write_bytes(content)
         tmp_file.rename(trace_file)
 
     def load_recorded_trace(self, run_id: str) -> RecordedTrace | None:
@@ -298,7 +299,7 @@ class RunStore:
         trace_file = self.traces_dir / f"{run_id}.recorded.json"
         if not trace_file.exists():
             return None
-        content = trace_file.read_text(encoding="utf-8")
+        content = trace_file.read_bytes()
         recorded = RecordedTrace.model_validate_json(content)
         validate_trace_version(recorded.metadata)
         return recorded
@@ -380,12 +381,12 @@ class RunStore:
         """
         self.revals_dir.mkdir(parents=True, exist_ok=True)
 
-        content = result.model_dump_json(indent=2)
+        content = to_json(result, indent=2)
 
         # Atomic write
         result_file = self.revals_dir / f"{result.reeval_id}.json"
         tmp_file = self.revals_dir / f"{result.reeval_id}.json.tmp"
-        tmp_file.write_text(content, encoding="utf-8")
+        tmp_file.write_bytes(content)
         tmp_file.rename(result_file)
 
     # -- Trace manifest methods --
@@ -399,8 +400,7 @@ class RunStore:
         """
         manifest_path = self.traces_dir / "manifest.json"
         if manifest_path.exists():
-            content = manifest_path.read_text(encoding="utf-8")
-            return json.loads(content)
+            return json.loads(manifest_path.read_bytes())
         return {"schema_version": 1, "runs": {}}
 
     def update_trace_manifest(
@@ -499,8 +499,7 @@ class RunStore:
             Dict mapping scenario names to lists of run IDs.
         """
         if self.index_path.exists():
-            content = self.index_path.read_text(encoding="utf-8")
-            return json.loads(content)
+            return json.loads(self.index_path.read_bytes())
         return {}
 
     def _update_index(self, scenario_name: str, run_id: str) -> None:
@@ -8,8 +8,6 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
-
 from salvo.adapters.base import (
     AdapterConfig,
     Message,
@@ -179,7 +177,6 @@ class TestAnthropicSendTurn:
 
         return mock_response
 
-    @pytest.mark.asyncio
     async def test_anthropic_send_turn_text_response(self):
         """Text response extracts content from text blocks."""
         adapter = AnthropicAdapter()
@@ -200,7 +197,6 @@ class TestAnthropicSendTurn:
         assert result.tool_calls == []
         assert result.finish_reason == "end_turn"
 
-    @pytest.mark.asyncio
     async def test_anthropic_send_turn_tool_use_response(self):
         """Tool use response extracts tool calls (arguments already dict)."""
         adapter = AnthropicAdapter()
@@ -231,7 +227,6 @@ class TestAnthropicSendTurn:
         assert result.tool_calls[0].arguments == {"path": "/tmp/test.py"}
         assert result.finish_reason == "tool_use"
 
-    @pytest.mark.asyncio
     async def test_anthropic_send_turn_usage_extraction(self):
         """Usage fields are correctly mapped from Anthropic response."""
         adapter = AnthropicAdapter()
@@ -253,7 +248,6 @@ class TestAnthropicSendTurn:
         assert result.usage.output_tokens == 50
         assert result.usage.total_tokens == 150
 
-    @pytest.mark.asyncio
     async def test_anthropic_send_turn_max_tokens_default(self):
         """Default max_tokens is 4096 when config.max_tokens is None."""
         adapter = AnthropicAdapter()
@@ -271,7 +265,6 @@ class TestAnthropicSendTurn:
         call_kwargs = mock_client.messages.create.call_args[1]
         assert call_kwargs["max_tokens"] == 4096
 
-    @pytest.mark.asyncio
     async def test_anthropic_send_turn_max_tokens_custom(self):
         """Custom max_tokens overrides the default."""
         adapter = AnthropicAdapter()
@@ -289,7 +282,6 @@ class TestAnthropicSendTurn:
         call_kwargs = mock_client.messages.create.call_args[1]
         assert call_kwargs["max_tokens"] == 2048
 
-    @pytest.mark.asyncio
     async def test_anthropic_send_turn_extras_passed_through(self):
         """Extras from config are passed through to the API call."""
         adapter = AnthropicAdapter()
@@ -310,7 +302,6 @@ class TestAnthropicSendTurn:
         call_kwargs = mock_client.messages.create.call_args[1]
         assert call_kwargs["top_k"] == 40
 
-    @pytest.mark.asyncio
     async def test_anthropic_send_turn_system_as_param(self):
         """System message is passed as separate 'system' param, not in messages."""
         adapter = AnthropicAdapter()
@@ -344,7 +335,6 @@ class TestAnthropicSendTurn:
         adapter = AnthropicAdapter()
         assert adapter._client is None
 
-    @pytest.mark.asyncio
     async def test_anthropic_send_turn_with_tools(self):
         """Tools are converted and passed to the API call."""
         adapter = AnthropicAdapter()
@@ -374,7 +364,6 @@ class TestAnthropicSendTurn:
         assert "input_schema" in call_kwargs["tools"][0]
         assert "parameters" not in call_kwargs["tools"][0]
 
-    @pytest.mark.asyncio
     async def test_anthropic_send_turn_mixed_content(self):
         """Response with both text and tool_use blocks is correctly parsed."""
         adapter = AnthropicAdapter()
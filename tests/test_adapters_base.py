@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
 
 from salvo.adapters.base import (
     AdapterConfig,
     AdapterTurnResult,
     BaseAdapter,
+    BatchRequest,
     Message,
     TokenUsage,
     ToolCallResult,
@@ -66,6 +69,19 @@ class TestBaseAdapterABC:
         adapter = MyCustomAdapter()
         assert adapter.provider_name() == "MyCustomAdapter"
 
+    async def test_send_batch_not_supported_by_default(self) -> None:
+        """Adapters report no batch support and send_batch() raises."""
+
+        class TurnOnlyAdapter(BaseAdapter):
+            async def send_turn(self, messages, tools=None, config=None):
+                raise AssertionError("not called")
+
+        assert TurnOnlyAdapter.supports_batch is False
+        with pytest.raises(NotImplementedError):
+            await TurnOnlyAdapter().send_batch(
+                [BatchRequest(messages=[Message(role="user", content="hi")])]
+            )
+
 
 # --- Dataclass tests ---
 
@@ -95,6 +111,11 @@ class TestTokenUsage:
         assert usage.output_tokens == 50
         assert usage.total_tokens == 150
 
+    def test_frozen(self) -> None:
+        usage = TokenUsage()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            usage.input_tokens = 1
+
 
 class TestAdapterTurnResult:
     """Test AdapterTurnResult dataclass."""
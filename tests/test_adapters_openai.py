@@ -13,8 +13,10 @@ import pytest
 
 from salvo.adapters.base import (
     AdapterConfig,
+    BatchRequest,
     Message,
     ToolCallResult,
+    ZERO_USAGE,
 )
 from salvo.adapters.openai_adapter import OpenAIAdapter
 
@@ -164,7 +166,6 @@ class TestOpenAISendTurn:
         mock_tc.function.arguments = json.dumps(arguments)
         return mock_tc
 
-    @pytest.mark.asyncio
     async def test_openai_send_turn_text_response(self):
         """Text response extracts content, empty tool_calls, and usage."""
         adapter = OpenAIAdapter()
@@ -187,7 +188,6 @@ class TestOpenAISendTurn:
         assert result.usage.total_tokens == 15
         assert result.raw_response == {"id": "chatcmpl-123", "object": "chat.completion"}
 
-    @pytest.mark.asyncio
     async def test_openai_send_turn_tool_call_response(self):
         """Tool call response extracts tool calls with parsed arguments."""
         adapter = OpenAIAdapter()
@@ -218,7 +218,6 @@ class TestOpenAISendTurn:
         assert result.tool_calls[0].arguments == {"path": "/tmp/test.py"}
         assert result.finish_reason == "tool_calls"
 
-    @pytest.mark.asyncio
     async def test_openai_send_turn_usage_extraction(self):
         """Usage fields are correctly mapped from OpenAI response."""
         adapter = OpenAIAdapter()
@@ -241,7 +240,23 @@ class TestOpenAISendTurn:
         assert result.usage.output_tokens == 50
         assert result.usage.total_tokens == 150
 
-    @pytest.mark.asyncio
+    async def test_openai_send_turn_missing_usage(self):
+        """A response without usage metadata maps to the shared zero usage."""
+        adapter = OpenAIAdapter()
+        response = self._mock_response()
+        response.usage = None
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(return_value=response)
+        adapter._client = mock_client
+
+        result = await adapter.send_turn(
+            messages=[Message(role="user", content="test")],
+            config=AdapterConfig(model="gpt-4o"),
+        )
+
+        assert result.usage is ZERO_USAGE
+        assert result.usage.total_tokens == 0
+
     async def test_openai_send_turn_extras_passed_through(self):
         """Extras from config are passed through to the API call."""
         adapter = OpenAIAdapter()
@@ -264,7 +279,6 @@ class TestOpenAISendTurn:
         assert call_kwargs["top_p"] == 0.9
         assert call_kwargs["presence_penalty"] == 0.5
 
-    @pytest.mark.asyncio
     async def test_openai_send_turn_temperature_and_seed(self):
         """Temperature and seed from config are passed to the API call."""
         adapter = OpenAIAdapter()
@@ -293,7 +307,6 @@ class TestOpenAISendTurn:
         adapter = OpenAIAdapter()
         assert adapter._client is None
 
-    @pytest.mark.asyncio
     async def test_openai_send_turn_with_tools(self):
         """Tools are converted and passed to the API call."""
         adapter = OpenAIAdapter()
@@ -321,3 +334,124 @@ class TestOpenAISendTurn:
         assert "tools" in call_kwargs
         assert call_kwargs["tools"][0]["type"] == "function"
         assert call_kwargs["tools"][0]["function"]["name"] == "file_read"
+
+
+class TestOpenAISendBatch:
+    """Test send_batch against a mocked OpenAI Batch API."""
+
+    def _body(self, content: str) -> dict:
+        return {
+            "choices": [
+                {
+                    "message": {
+                        "content": None,
+                        "tool_calls": [
+                            {
+                                "id": "call_1",
+                                "type": "function",
+                                "function": {
+                                    "name": "score_criteria",
+                                    "arguments": json.dumps({"note": content}),
+                                },
+                            }
+                        ],
+                    },
+                    "finish_reason": "tool_calls",
+                }
+            ],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        }
+
+    def _mock_client(
+        self, statuses: list[str], output_lines: list[dict | str]
+    ) -> MagicMock:
+        batches = [
+            MagicMock(id="batch_1", status=status, output_file_id="file_out")
+            for status in statuses
+        ]
+        mock_client = MagicMock()
+        mock_client.files.create = AsyncMock(return_value=MagicMock(id="file_in"))
+        mock_client.batches.create = AsyncMock(return_value=batches[0])
+        mock_client.batches.retrieve = AsyncMock(side_effect=batches[1:])
+        mock_client.files.content = AsyncMock(
+            return_value=MagicMock(
+                text="\n".join(
+                    l if isinstance(l, str) else json.dumps(l) for l in output_lines
+                )
+            )
+        )
+        return mock_client
+
+    async def test_openai_send_batch_maps_results_by_custom_id(self):
+        """Output lines (in any order) map back to their requests; errors surface."""
+        adapter = OpenAIAdapter()
+        adapter._client = self._mock_client(
+            ["validating", "in_progress", "completed"],
+            [
+                {"custom_id": "2", "response": {"status_code": 200, "body": self._body("c")}},
+                {"custom_id": "0", "response": {"status_code": 200, "body": self._body("a")}},
+                {"custom_id": "1", "response": None, "error": {"code": "server_error"}},
+            ],
+        )
+        requests = [
+            BatchRequest(
+                messages=[Message(role="user", content=str(i))],
+                config=AdapterConfig(model="gpt-4o-mini", temperature=0.0),
+            )
+            for i in range(3)
+        ]
+
+        results = await adapter.send_batch(requests, poll_interval=0)
+
+        assert adapter.supports_batch is True
+        assert results[0].tool_calls[0].arguments == {"note": "a"}
+        assert results[0].usage.total_tokens == 15
+        assert isinstance(results[1], RuntimeError)
+        assert results[2].tool_calls[0].arguments == {"note": "c"}
+        assert adapter._client.batches.retrieve.await_count == 2
+
+        upload = adapter._client.files.create.call_args.kwargs
+        assert upload["purpose"] == "batch"
+        first_line = json.loads(upload["file"][1].decode().splitlines()[0])
+        assert first_line["custom_id"] == "0"
+        assert first_line["url"] == "/v1/chat/completions"
+        assert first_line["body"]["model"] == "gpt-4o-mini"
+        assert first_line["body"]["temperature"] == 0.0
+
+    async def test_openai_send_batch_malformed_lines_stay_per_request(self):
+        """A bad output line fails only its own request, not the batch."""
+        bad_arguments = self._body("b")
+        bad_arguments["choices"][0]["message"]["tool_calls"][0]["function"][
+            "arguments"
+        ] = "{not json"
+        adapter = OpenAIAdapter()
+        adapter._client = self._mock_client(
+            ["completed"],
+            [
+                "not a json line",
+                {"custom_id": "0", "response": {"status_code": 200, "body": self._body("a")}},
+                {"custom_id": "1", "response": {"status_code": 200, "body": bad_arguments}},
+                {"custom_id": "2", "response": {"status_code": 200, "body": {}}},
+            ],
+        )
+        requests = [
+            BatchRequest(messages=[Message(role="user", content=str(i))])
+            for i in range(4)
+        ]
+
+        results = await adapter.send_batch(requests, poll_interval=0)
+
+        assert results[0].tool_calls[0].arguments == {"note": "a"}
+        assert isinstance(results[1], ValueError)
+        assert isinstance(results[2], KeyError)
+        assert isinstance(results[3], RuntimeError)
+
+    async def test_openai_send_batch_failed_batch_raises(self):
+        adapter = OpenAIAdapter()
+        adapter._client = self._mock_client(["failed"], [])
+
+        with pytest.raises(RuntimeError, match="failed"):
+            await adapter.send_batch(
+                [BatchRequest(messages=[Message(role="user", content="hi")])],
+                poll_interval=0,
+            )
@@ -237,7 +237,6 @@ class TestEvaluateTrace:
 class TestEvaluateTraceAsync:
     """Test the async evaluate_trace_async orchestration function."""
 
-    @pytest.mark.asyncio
     async def test_evaluate_trace_async_same_as_sync(self) -> None:
         """Verify async produces same results as sync for standard evaluators."""
         trace = _make_trace(final_content="Hello World")
@@ -265,7 +264,6 @@ class TestEvaluateTraceAsync:
         assert async_results[0].passed == sync_results[0].passed
         assert async_results[0].score == sync_results[0].score
 
-    @pytest.mark.asyncio
     async def test_evaluate_trace_async_with_mock_judge(self) -> None:
         """Mock a judge evaluator returning known EvalResult, verify included."""
         trace = _make_trace(final_content="Hello World")
@@ -311,7 +309,6 @@ class TestEvaluateTraceAsync:
         assert results[0].passed is True
         assert results[0].metadata["judge_model"] == "gpt-4o-mini"
 
-    @pytest.mark.asyncio
     async def test_evaluate_trace_async_mixed_standard_and_judge(self) -> None:
         """Mixed standard + mocked judge assertions produce correct weighted score."""
         trace = _make_trace(final_content="Hello World")
@@ -72,6 +72,22 @@ class TestValidateExtrasBlockedKeys:
         with pytest.raises(ValueError, match="(?i)password"):
             validate_extras({"PASSWORD": "abc"})
 
+    def test_validate_extras_blocks_prefixed_variants(self) -> None:
+        """Any ``<prefix>_`` variant of a blocked key is rejected."""
+        with pytest.raises(ValueError, match="stripe_token"):
+            validate_extras({"stripe_token": "xxx"})
+
+        with pytest.raises(ValueError, match="DB_PASSWORD"):
+            validate_extras({"DB_PASSWORD": "xxx"})
+
+        with pytest.raises(ValueError, match="openai_api_key"):
+            validate_extras({"openai_api_key": "sk-xxx"})
+
+    def test_validate_extras_allows_similar_non_secret_keys(self) -> None:
+        """Keys that only contain a blocked word mid-name are allowed."""
+        extras = {"max_tokens": 100, "token_budget": 5, "monkey": "x"}
+        assert validate_extras(extras) == extras
+
 
 class TestValidateExtrasLimits:
     """Test key count and size limits."""
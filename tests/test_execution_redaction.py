@@ -4,6 +4,8 @@ from datetime import datetime, timezone
 
 from salvo.execution.redaction import (
     MAX_MESSAGE_CONTENT_SIZE,
+    REDACTION_PATTERNS,
+    _ANY_SECRET_PATTERN,
     apply_trace_limits,
     redact_content,
     truncate_content,
@@ -42,6 +44,25 @@ def test_redact_no_match_passthrough():
     assert result == text
 
 
+def test_any_secret_prefilter_covers_every_pattern():
+    """The union prefilter matches whatever any individual pattern matches."""
+    samples = [
+        "BEARER abc.def",
+        "sk-" + "a" * 24,
+        "PASSWORD = hunter2",
+        "Cookie: session=1",
+        "set-cookie: id=2",
+        "X-API-KEY: abc",
+        "sk-ant-" + "b" * 24,
+        "ghp_" + "c" * 36,
+        "gho_" + "d" * 36,
+    ]
+    assert len(samples) == len(REDACTION_PATTERNS)
+    for sample in samples:
+        assert _ANY_SECRET_PATTERN.search(sample)
+        assert redact_content(sample) != sample
+
+
 def test_truncate_within_limit():
     """Content within limit is returned unchanged."""
     text = "short content"
@@ -106,3 +127,44 @@ def test_apply_trace_limits_redacts_messages():
     assert sanitized.turn_count == 1
     assert sanitized.model == "gpt-4o"
     assert sanitized.scenario_hash == "abc"
+
+    # Input trace is left untouched
+    assert sanitized is not trace
+    assert "super_secret_value" in trace.messages[1].content
+    assert sanitized.messages[2].tool_call_id == "tc1"
+    assert sanitized.messages[2].tool_name == "lookup"
+
+
+def test_apply_trace_limits_result_shares_no_containers():
+    """Mutating the sanitized trace leaves the input trace unchanged."""
+    trace = RunTrace(
+        messages=[
+            TraceMessage(
+                role="assistant",
+                content=None,
+                tool_calls=[{"id": "tc1", "name": "lookup", "arguments": {"q": "x"}}],
+            ),
+        ],
+        tool_calls_made=[{"id": "tc1", "name": "lookup", "arguments": {"q": "x"}}],
+        turn_count=1,
+        input_tokens=5,
+        output_tokens=5,
+        total_tokens=10,
+        latency_seconds=0.1,
+        final_content=None,
+        finish_reason="tool_calls",
+        model="gpt-4o",
+        provider="OpenAIAdapter",
+        timestamp=datetime.now(timezone.utc),
+        scenario_hash="abc",
+        extras_resolved={"headers": {"x-env": "test"}},
+    )
+
+    sanitized = apply_trace_limits(trace)
+    sanitized.messages[0].tool_calls[0]["arguments"]["q"] = "changed"
+    sanitized.tool_calls_made.append({"id": "tc2"})
+    sanitized.extras_resolved["headers"]["x-env"] = "changed"
+
+    assert trace.messages[0].tool_calls[0]["arguments"] == {"q": "x"}
+    assert len(trace.tool_calls_made) == 1
+    assert trace.extras_resolved == {"headers": {"x-env": "test"}}
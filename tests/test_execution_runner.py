@@ -60,7 +60,6 @@ def _make_config(model: str = "gpt-4o") -> AdapterConfig:
     return AdapterConfig(model=model)
 
 
-@pytest.mark.asyncio
 async def test_runner_single_turn_text_response():
     """Adapter returns text (no tool calls), runner stops, trace has 1 turn."""
     adapter = MockAdapter([
@@ -91,7 +90,6 @@ async def test_runner_single_turn_text_response():
     assert trace.provider == "MockAdapter"
 
 
-@pytest.mark.asyncio
 async def test_runner_multi_turn_with_mock_tools():
     """Adapter returns tool_call, runner injects mock, then adapter returns text."""
     adapter = MockAdapter([
@@ -134,7 +132,6 @@ async def test_runner_multi_turn_with_mock_tools():
     assert trace.max_turns_hit is False
 
 
-@pytest.mark.asyncio
 async def test_runner_tool_mock_not_found():
     """Model calls a tool with no mock_response defined -- raises ToolMockNotFoundError."""
     adapter = MockAdapter([
@@ -166,7 +163,38 @@ async def test_runner_tool_mock_not_found():
     assert "search" in exc_info.value.available_mocks
 
 
-@pytest.mark.asyncio
+async def test_runner_tool_mock_case_insensitive():
+    """Tool names echoed in a different case still resolve to their mock."""
+    adapter = MockAdapter([
+        AdapterTurnResult(
+            content=None,
+            tool_calls=[ToolCallResult(id="tc1", name="Search", arguments={})],
+            usage=TokenUsage(input_tokens=10, output_tokens=5, total_tokens=15),
+            raw_response={},
+            finish_reason="tool_calls",
+        ),
+        AdapterTurnResult(
+            content="Done.",
+            tool_calls=[],
+            usage=TokenUsage(input_tokens=10, output_tokens=5, total_tokens=15),
+            raw_response={},
+            finish_reason="stop",
+        ),
+    ])
+
+    runner = ScenarioRunner(adapter)
+    scenario = _make_scenario(
+        tools=[ToolDef(name="search", description="Search", mock_response="data")],
+    )
+
+    trace = await runner.run(scenario, _make_config())
+
+    tool_results = [m for m in trace.messages if m.role == "tool_result"]
+    assert len(tool_results) == 1
+    assert tool_results[0].content == "data"
+    assert tool_results[0].tool_name == "Search"
+
+
 async def test_runner_max_turns_safety_net():
     """Adapter always returns tool_calls, runner stops at max_turns."""
     # Create responses that always have tool calls
@@ -198,7 +226,6 @@ async def test_runner_max_turns_safety_net():
     assert len(trace.tool_calls_made) == 3  # One tool call per turn
 
 
-@pytest.mark.asyncio
 async def test_runner_parallel_tool_calls():
     """Adapter returns 2 tool_calls at once, both get mock responses."""
     adapter = MockAdapter([
@@ -240,8 +267,13 @@ async def test_runner_parallel_tool_calls():
     assert trace.tool_calls_made[1]["name"] == "lookup"
     assert trace.max_turns_hit is False
 
+    # Tool results are appended in the same order as the tool calls
+    tool_results = [m for m in trace.messages if m.role == "tool_result"]
+    assert [m.tool_call_id for m in tool_results] == ["tc1", "tc2"]
+    assert tool_results[0].content == "result A"
+    assert tool_results[1].content == '{"data": "B"}'
+
 
-@pytest.mark.asyncio
 async def test_runner_accumulates_usage():
     """Multi-turn execution accumulates token usage across all turns."""
     adapter = MockAdapter([
@@ -275,7 +307,6 @@ async def test_runner_accumulates_usage():
     assert trace.total_tokens == 450  # 150 + 300
 
 
-@pytest.mark.asyncio
 async def test_runner_scenario_hash_deterministic():
     """Same scenario produces the same hash."""
     adapter = MockAdapter([
@@ -304,7 +335,6 @@ async def test_runner_scenario_hash_deterministic():
     assert trace1.scenario_hash == expected
 
 
-@pytest.mark.asyncio
 async def test_runner_cost_estimation():
     """Cost is estimated for known models."""
     adapter = MockAdapter([
@@ -2,6 +2,8 @@
 
 from datetime import datetime, timezone
 
+from pydantic_core import to_json
+
 from salvo.execution.trace import RunTrace, TraceMessage
 
 
@@ -87,3 +89,27 @@ def test_run_trace_defaults():
     assert trace.extras_resolved == {}
     assert trace.max_turns_hit is False
     assert trace.final_content is None
+
+
+def test_run_trace_json_bytes_round_trip():
+    """RunTrace round-trips through pydantic-core JSON bytes, as stored."""
+    now = datetime.now(timezone.utc)
+    trace = RunTrace(
+        messages=[TraceMessage(role="user", content="café")],
+        tool_calls_made=[{"id": "tc1", "name": "search", "arguments": {"q": "x"}}],
+        turn_count=1,
+        input_tokens=3,
+        output_tokens=2,
+        total_tokens=5,
+        latency_seconds=0.25,
+        final_content=None,
+        finish_reason="stop",
+        model="gpt-4o",
+        provider="OpenAIAdapter",
+        timestamp=now,
+        scenario_hash="abc123",
+    )
+
+    assert to_json(trace, indent=2) == trace.model_dump_json(indent=2).encode()
+    restored = RunTrace.model_validate_json(to_json(trace, indent=2))
+    assert restored == trace
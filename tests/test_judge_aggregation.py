@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
-from salvo.evaluation.judge.aggregation import aggregate_k_votes
+import itertools
+import statistics
+
+from salvo.evaluation.judge.aggregation import (
+    _fast_median,
+    aggregate_k_votes,
+    majority_decided,
+    samples_needed,
+    vote_passes,
+)
 
 
 CRITERIA_TWO = [
@@ -97,3 +106,48 @@ class TestAggregateKVotes:
         )
         assert score == 0.0
         assert passed is False
+
+
+class TestFastMedian:
+    def test_fast_median_matches_statistics_median(self):
+        values = [0.0, 0.1, 0.5, 0.7, 1.0]
+        for n in range(1, 6):
+            for combo in itertools.permutations(values, n):
+                scores = list(combo)
+                assert _fast_median(scores) == statistics.median(scores)
+
+    def test_fast_median_with_ties(self):
+        assert _fast_median([0.5, 0.5, 0.9]) == 0.5
+        assert _fast_median([0.9, 0.2, 0.9]) == 0.9
+
+
+class TestEarlyStopHelpers:
+    def test_vote_passes_uses_weighted_average(self):
+        vote = _make_vote({"accuracy": 0.9, "clarity": 0.3})
+        # (0.9*1.0 + 0.3*0.5) / 1.5 = 0.7
+        assert vote_passes(vote, CRITERIA_TWO, threshold=0.7) is True
+        assert vote_passes(vote, CRITERIA_TWO, threshold=0.75) is False
+
+    def test_majority_decided_pass(self):
+        # 2 of 3 passed, 1 left: even a failing third vote cannot flip it
+        assert majority_decided(passes=2, votes=2, remaining=1) is True
+
+    def test_majority_decided_fail(self):
+        assert majority_decided(passes=0, votes=2, remaining=1) is False
+
+    def test_majority_undecided_on_split(self):
+        assert majority_decided(passes=1, votes=2, remaining=1) is None
+
+    def test_majority_decided_matches_aggregate_when_complete(self):
+        passing = _make_vote({"accuracy": 0.9, "clarity": 0.9})
+        failing = _make_vote({"accuracy": 0.1, "clarity": 0.1})
+        for votes in ([passing, failing], [passing, passing, failing], [failing]):
+            passes = sum(vote_passes(v, CRITERIA_TWO, 0.8) for v in votes)
+            _, passed, _ = aggregate_k_votes(votes, CRITERIA_TWO, threshold=0.8)
+            assert majority_decided(passes, len(votes), 0) is passed
+
+    def test_samples_needed_is_strict_majority(self):
+        assert samples_needed(0, 0, 1) == 1
+        assert samples_needed(0, 0, 3) == 2
+        assert samples_needed(0, 0, 5) == 3
+        assert samples_needed(1, 2, 1) == 1
@@ -0,0 +1,81 @@
+"""Tests for the persistent judge response cache."""
+
+from __future__ import annotations
+
+from salvo.adapters.base import AdapterTurnResult, TokenUsage, ToolCallResult
+from salvo.evaluation.judge.cache import (
+    default_cache_dir,
+    judge_cache_key,
+    load_cached_result,
+    store_cached_result,
+)
+
+
+def _key(**overrides) -> str:
+    params = {
+        "judge_adapter": "openai",
+        "judge_model": "gpt-4o-mini",
+        "temperature": 0.0,
+        "max_tokens": 1024,
+        "system_prompt": "Judge this.",
+        "user_prompt": "## Agent's Final Response\n\nHello",
+        "sample_index": 0,
+    }
+    params.update(overrides)
+    return judge_cache_key(**params)
+
+
+def _result() -> AdapterTurnResult:
+    return AdapterTurnResult(
+        content=None,
+        tool_calls=[
+            ToolCallResult(
+                id="call_1",
+                name="score_criteria",
+                arguments={"accuracy": {"score": 0.9, "reasoning": "Good"}},
+            )
+        ],
+        usage=TokenUsage(input_tokens=200, output_tokens=100, total_tokens=300),
+        raw_response={"id": "resp_1"},
+        finish_reason="stop",
+    )
+
+
+class TestJudgeCacheKey:
+    def test_key_is_deterministic(self):
+        assert _key() == _key()
+
+    def test_key_varies_with_inputs(self):
+        base = _key()
+        assert _key(sample_index=1) != base
+        assert _key(judge_model="gpt-4o") != base
+        assert _key(user_prompt="## Agent's Final Response\n\nBye") != base
+        assert _key(system_prompt="Other rubric") != base
+
+
+class TestJudgeCacheStorage:
+    def test_round_trip(self, tmp_path):
+        store_cached_result(tmp_path, "abc", _result())
+        loaded = load_cached_result(tmp_path, "abc")
+
+        assert loaded is not None
+        assert loaded.tool_calls[0].name == "score_criteria"
+        assert loaded.tool_calls[0].arguments["accuracy"]["score"] == 0.9
+        assert loaded.usage.total_tokens == 300
+        assert loaded.finish_reason == "stop"
+        assert loaded.raw_response == {}
+
+    def test_miss_returns_none(self, tmp_path):
+        assert load_cached_result(tmp_path, "missing") is None
+
+    def test_corrupt_entry_returns_none(self, tmp_path):
+        (tmp_path / "bad.json").write_text("{not json", encoding="utf-8")
+        assert load_cached_result(tmp_path, "bad") is None
+
+    def test_store_leaves_no_temp_files(self, tmp_path):
+        store_cached_result(tmp_path / "judge", "abc", _result())
+        assert [p.name for p in (tmp_path / "judge").iterdir()] == ["abc.json"]
+
+    def test_default_cache_dir_honors_xdg(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "salvo" / "judge"
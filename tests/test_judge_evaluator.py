@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 
-from salvo.adapters.base import AdapterTurnResult, TokenUsage, ToolCallResult
+from salvo.adapters.base import (
+    AdapterTurnResult,
+    BaseAdapter,
+    BatchRequest,
+    TokenUsage,
+    ToolCallResult,
+)
 from salvo.evaluation.evaluators import get_evaluator
 from salvo.evaluation.evaluators.judge import JudgeEvaluator, resolve_judge_config
 from salvo.execution.trace import RunTrace
@@ -49,6 +56,14 @@ def _make_adapter_result(scores: dict, tool_name: str = "score_criteria") -> Ada
     )
 
 
+_GOOD_RESULT = _make_adapter_result(
+    {
+        "accuracy": {"score": 0.9, "reasoning": "Good"},
+        "clarity": {"score": 0.8, "reasoning": "Clear"},
+    }
+)
+
+
 SAMPLE_ASSERTION = {
     "type": "judge",
     "criteria": [
@@ -59,6 +74,62 @@ SAMPLE_ASSERTION = {
     "required": False,
 }
 
+_TEXT_SCORES_GOOD = json.dumps({
+    "accuracy": {"score": 0.9, "reasoning": "Good"},
+    "clarity": {"score": 0.8, "reasoning": "Clear"},
+})
+
+_EVALUATOR = JudgeEvaluator()
+
+
+class StubAdapter(BaseAdapter):
+    """Lightweight judge adapter double -- far cheaper to build than a mock.
+
+    send_turn returns queued results in order (exceptions are raised),
+    then the fixed result; calls and the last tools list are recorded.
+    """
+
+    def __init__(self) -> None:
+        self.result: AdapterTurnResult | None = None
+        self.queue: list[AdapterTurnResult | Exception] = []
+        self.calls = 0
+        self.last_tools: list[dict] | None = None
+
+    def set_result(self, result: AdapterTurnResult) -> None:
+        self.result = result
+
+    def set_results(self, results: list[AdapterTurnResult | Exception]) -> None:
+        self.queue = list(results)
+
+    async def send_turn(self, messages, tools=None, config=None):
+        self.calls += 1
+        self.last_tools = tools
+        item = self.queue.pop(0) if self.queue else self.result
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def provider_name(self) -> str:
+        return "openai"
+
+
+@pytest.fixture
+def judge_adapter(monkeypatch):
+    """Route the judge's adapter lookup to a fresh StubAdapter.
+
+    Also fixes the per-call cost estimate at $0.001.
+    """
+    adapter = StubAdapter()
+    monkeypatch.setattr(
+        "salvo.evaluation.evaluators.judge.get_adapter",
+        lambda *args, **kwargs: adapter,
+    )
+    monkeypatch.setattr(
+        "salvo.evaluation.evaluators.judge.estimate_cost",
+        lambda *args, **kwargs: 0.001,
+    )
+    return adapter
+
 
 class TestJudgeEvaluatorRegistered:
     def test_judge_evaluator_registered(self):
@@ -67,125 +138,73 @@ class TestJudgeEvaluatorRegistered:
 
 
 class TestEvaluateAsync:
-    @pytest.mark.asyncio
-    async def test_evaluate_async_pass(self):
-        """Mock adapter returns valid scores above threshold for 3 calls."""
-        mock_adapter = MagicMock()
-        mock_adapter.provider_name.return_value = "openai"
-        mock_adapter.send_turn = AsyncMock(
-            return_value=_make_adapter_result(
+    @pytest.mark.parametrize(
+        ("accuracy", "clarity", "expect_pass"),
+        [(0.9, 0.85, True), (0.3, 0.2, False)],
+        ids=["pass", "fail"],
+    )
+    async def test_evaluate_async_verdict(
+        self, judge_adapter, accuracy, clarity, expect_pass
+    ):
+        """Scores above/below threshold across all 3 calls pass/fail."""
+        judge_adapter.set_result(
+            _make_adapter_result(
                 {
-                    "accuracy": {"score": 0.9, "reasoning": "Good"},
-                    "clarity": {"score": 0.85, "reasoning": "Clear"},
+                    "accuracy": {"score": accuracy, "reasoning": "r"},
+                    "clarity": {"score": clarity, "reasoning": "r"},
                 }
             )
         )
 
-        evaluator = JudgeEvaluator()
-        with patch(
-            "salvo.evaluation.evaluators.judge.get_adapter", return_value=mock_adapter
-        ), patch(
-            "salvo.evaluation.evaluators.judge.estimate_cost", return_value=0.001
-        ):
-            result = await evaluator.evaluate_async(_make_trace(), SAMPLE_ASSERTION)
+        result = await _EVALUATOR.evaluate_async(_make_trace(), SAMPLE_ASSERTION)
 
-        assert result.passed is True
-        assert result.score > 0.8
+        assert result.passed is expect_pass
         assert result.assertion_type == "judge"
         assert "judge=" in result.details
+        if expect_pass:
+            assert result.score > 0.8
+        else:
+            assert result.score < 0.8
 
-    @pytest.mark.asyncio
-    async def test_evaluate_async_fail(self):
-        """Mock adapter returns scores below threshold."""
-        mock_adapter = MagicMock()
-        mock_adapter.provider_name.return_value = "openai"
-        mock_adapter.send_turn = AsyncMock(
-            return_value=_make_adapter_result(
-                {
-                    "accuracy": {"score": 0.3, "reasoning": "Bad"},
-                    "clarity": {"score": 0.2, "reasoning": "Unclear"},
-                }
-            )
-        )
-
-        evaluator = JudgeEvaluator()
-        with patch(
-            "salvo.evaluation.evaluators.judge.get_adapter", return_value=mock_adapter
-        ), patch(
-            "salvo.evaluation.evaluators.judge.estimate_cost", return_value=0.001
-        ):
-            result = await evaluator.evaluate_async(_make_trace(), SAMPLE_ASSERTION)
-
-        assert result.passed is False
-        assert result.score < 0.8
-
-    @pytest.mark.asyncio
-    async def test_evaluate_async_parse_failure_fallback(self):
+    async def test_evaluate_async_parse_failure_fallback(self, judge_adapter):
         """First call returns no tool calls but text JSON -- text fallback works."""
-        import json
-
-        text_scores = json.dumps({
-            "accuracy": {"score": 0.9, "reasoning": "Good"},
-            "clarity": {"score": 0.8, "reasoning": "Clear"},
-        })
-
-        text_result = AdapterTurnResult(
-            content=text_scores,
-            tool_calls=[],
-            usage=TokenUsage(input_tokens=200, output_tokens=100, total_tokens=300),
-            raw_response={},
-            finish_reason="stop",
+        judge_adapter.set_result(
+            AdapterTurnResult(
+                content=_TEXT_SCORES_GOOD,
+                tool_calls=[],
+                usage=TokenUsage(input_tokens=200, output_tokens=100, total_tokens=300),
+                raw_response={},
+                finish_reason="stop",
+            )
         )
 
-        mock_adapter = MagicMock()
-        mock_adapter.provider_name.return_value = "openai"
-        mock_adapter.send_turn = AsyncMock(return_value=text_result)
-
-        evaluator = JudgeEvaluator()
-        with patch(
-            "salvo.evaluation.evaluators.judge.get_adapter", return_value=mock_adapter
-        ), patch(
-            "salvo.evaluation.evaluators.judge.estimate_cost", return_value=0.001
-        ):
-            result = await evaluator.evaluate_async(_make_trace(), SAMPLE_ASSERTION)
+        result = await _EVALUATOR.evaluate_async(_make_trace(), SAMPLE_ASSERTION)
 
         assert result.passed is True
         assert result.score > 0.0
 
-    @pytest.mark.asyncio
-    async def test_evaluate_async_all_parse_failures(self):
+    async def test_evaluate_async_all_parse_failures(self, judge_adapter):
         """All k calls return garbage -- verify judge_parse_failed in details."""
-        garbage_result = AdapterTurnResult(
-            content="I can't evaluate this",
-            tool_calls=[],
-            usage=TokenUsage(input_tokens=200, output_tokens=100, total_tokens=300),
-            raw_response={},
-            finish_reason="stop",
+        judge_adapter.set_result(
+            AdapterTurnResult(
+                content="I can't evaluate this",
+                tool_calls=[],
+                usage=TokenUsage(input_tokens=200, output_tokens=100, total_tokens=300),
+                raw_response={},
+                finish_reason="stop",
+            )
         )
 
-        mock_adapter = MagicMock()
-        mock_adapter.provider_name.return_value = "openai"
-        mock_adapter.send_turn = AsyncMock(return_value=garbage_result)
-
-        evaluator = JudgeEvaluator()
-        with patch(
-            "salvo.evaluation.evaluators.judge.get_adapter", return_value=mock_adapter
-        ), patch(
-            "salvo.evaluation.evaluators.judge.estimate_cost", return_value=0.001
-        ):
-            result = await evaluator.evaluate_async(_make_trace(), SAMPLE_ASSERTION)
+        result = await _EVALUATOR.evaluate_async(_make_trace(), SAMPLE_ASSERTION)
 
         assert result.passed is False
         assert result.score == 0.0
         assert "judge_parse_failed" in result.details
 
-    @pytest.mark.asyncio
-    async def test_evaluate_async_cost_tracked(self):
+    async def test_evaluate_async_cost_tracked(self, judge_adapter):
         """Verify judge cost accumulated in details string."""
-        mock_adapter = MagicMock()
-        mock_adapter.provider_name.return_value = "openai"
-        mock_adapter.send_turn = AsyncMock(
-            return_value=_make_adapter_result(
+        judge_adapter.set_result(
+            _make_adapter_result(
                 {
                     "accuracy": {"score": 0.9, "reasoning": "Good"},
                     "clarity": {"score": 0.8, "reasoning": "Clear"},
@@ -193,17 +212,310 @@ class TestEvaluateAsync:
             )
         )
 
-        evaluator = JudgeEvaluator()
-        with patch(
-            "salvo.evaluation.evaluators.judge.get_adapter", return_value=mock_adapter
-        ), patch(
-            "salvo.evaluation.evaluators.judge.estimate_cost", return_value=0.001
-        ):
-            result = await evaluator.evaluate_async(_make_trace(), SAMPLE_ASSERTION)
+        result = await _EVALUATOR.evaluate_async(_make_trace(), SAMPLE_ASSERTION)
 
         # 3 calls * 0.001 = 0.003
         assert "judge_cost=$0.003000" in result.details
 
+    async def test_evaluate_async_samples_run_concurrently(self, judge_adapter):
+        """All k judge calls are in flight at the same time."""
+        result_obj = _make_adapter_result(
+            {
+                "accuracy": {"score": 0.9, "reasoning": "Good"},
+                "clarity": {"score": 0.8, "reasoning": "Clear"},
+            }
+        )
+        in_flight = 0
+        max_in_flight = 0
+
+        async def send_turn(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return result_obj
+
+        judge_adapter.send_turn = send_turn
+
+        result = await _EVALUATOR.evaluate_async(_make_trace(), SAMPLE_ASSERTION)
+
+        assert max_in_flight == 3
+        assert result.passed is True
+
+    async def test_evaluate_async_one_call_raises(self, judge_adapter):
+        """A failing call counts as a parse failure; other votes still count."""
+        good = _make_adapter_result(
+            {
+                "accuracy": {"score": 0.9, "reasoning": "Good"},
+                "clarity": {"score": 0.8, "reasoning": "Clear"},
+            }
+        )
+        judge_adapter.set_results([good, RuntimeError("rate limited"), good])
+
+        result = await _EVALUATOR.evaluate_async(_make_trace(), SAMPLE_ASSERTION)
+
+        assert "votes=2/3" in result.details
+        assert "judge_cost=$0.002000" in result.details
+        assert result.passed is True
+
+
+class TestJudgeAdapterReuse:
+    """Test that judge adapters (and their SDK clients) are reused."""
+
+    async def test_adapter_shared_across_evaluations(self, monkeypatch):
+        """Repeated evaluations on one loop resolve the adapter only once."""
+        created: list[StubAdapter] = []
+
+        def fake_get_adapter(name):
+            adapter = StubAdapter()
+            adapter.set_result(_GOOD_RESULT)
+            created.append(adapter)
+            return adapter
+
+        monkeypatch.setattr(
+            "salvo.evaluation.evaluators.judge.get_adapter", fake_get_adapter
+        )
+        monkeypatch.setattr(
+            "salvo.evaluation.evaluators.judge.estimate_cost",
+            lambda *args, **kwargs: 0.001,
+        )
+
+        await _EVALUATOR.evaluate_async(_make_trace(), SAMPLE_ASSERTION)
+        await _EVALUATOR.evaluate_async(_make_trace(), SAMPLE_ASSERTION)
+
+        assert len(created) == 1
+        assert created[0].calls == 6
+
+    def test_adapter_not_shared_across_loops(self, monkeypatch):
+        """Each event loop resolves its own adapter instance."""
+        from salvo.evaluation.evaluators.judge import _get_judge_adapter
+
+        monkeypatch.setattr(
+            "salvo.evaluation.evaluators.judge.get_adapter",
+            lambda name: StubAdapter(),
+        )
+
+        async def resolve_twice():
+            return _get_judge_adapter("openai"), _get_judge_adapter("openai")
+
+        first_a, first_b = asyncio.run(resolve_twice())
+        second_a, _ = asyncio.run(resolve_twice())
+
+        assert first_a is first_b
+        assert second_a is not first_a
+
+
+class TestJudgeConcurrencyLimit:
+    """Test the shared cap on in-flight judge calls."""
+
+    async def test_concurrent_evaluations_respect_limit(self, judge_adapter):
+        """5 concurrent evaluations x k=3 never exceed max_concurrency=2."""
+        result_obj = _make_adapter_result(
+            {
+                "accuracy": {"score": 0.9, "reasoning": "Good"},
+                "clarity": {"score": 0.8, "reasoning": "Clear"},
+            }
+        )
+        in_flight = 0
+        max_in_flight = 0
+
+        async def send_turn(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return result_obj
+
+        judge_adapter.send_turn = send_turn
+        assertion = {
+            **SAMPLE_ASSERTION,
+            "_project_judge_config": {"k": 3, "max_concurrency": 2},
+        }
+
+        results = await asyncio.gather(
+            *(
+                _EVALUATOR.evaluate_async(_make_trace(), dict(assertion))
+                for _ in range(5)
+            )
+        )
+
+        assert max_in_flight == 2
+        assert all(r.passed for r in results)
+
+
+class TestEvaluateAsyncBatch:
+    """Test grading several assertions with shared judge calls."""
+
+    def _assertions(self) -> list[dict]:
+        return [
+            {**SAMPLE_ASSERTION, "name": "first"},
+            {
+                "type": "judge",
+                "name": "second",
+                "criteria": [
+                    {"name": "tone", "description": "Polite", "weight": 1.0},
+                ],
+                "weight": 1.0,
+                "required": False,
+            },
+        ]
+
+    async def test_batch_shares_k_calls(self, judge_adapter):
+        """Two assertions are graded by k calls with namespaced criteria."""
+        judge_adapter.set_result(
+            _make_adapter_result(
+                {
+                    "a0.accuracy": {"score": 0.9, "reasoning": "Good"},
+                    "a0.clarity": {"score": 0.85, "reasoning": "Clear"},
+                    "a1.tone": {"score": 0.2, "reasoning": "Rude"},
+                }
+            )
+        )
+
+        first, second = await _EVALUATOR.evaluate_async_batch(
+            _make_trace(), self._assertions()
+        )
+
+        assert judge_adapter.calls == 3
+        tool = judge_adapter.last_tools[0]
+        assert set(tool["parameters"]["properties"]) == {
+            "a0.accuracy", "a0.clarity", "a1.tone",
+        }
+        assert first.passed is True
+        assert "accuracy=0.90" in first.details
+        assert second.passed is False
+        assert "tone=0.20" in second.details
+        # Batch cost (3 * 0.001) is split evenly across the two assertions
+        assert first.metadata["judge_cost_usd"] == pytest.approx(0.0015)
+
+    async def test_batch_missing_scores_fail_only_that_assertion(self, judge_adapter):
+        judge_adapter.set_result(
+            _make_adapter_result(
+                {
+                    "a0.accuracy": {"score": 0.9, "reasoning": "Good"},
+                    "a0.clarity": {"score": 0.85, "reasoning": "Clear"},
+                }
+            )
+        )
+
+        first, second = await _EVALUATOR.evaluate_async_batch(
+            _make_trace(), self._assertions()
+        )
+
+        assert first.passed is True
+        assert second.passed is False
+        assert "judge_parse_failed: 3/3" in second.details
+
+    async def test_custom_prompt_and_mismatched_config_run_alone(self, judge_adapter):
+        """Assertions that cannot share a prompt fall back to evaluate_async."""
+        judge_adapter.set_result(
+            _make_adapter_result(
+                {
+                    "accuracy": {"score": 0.9, "reasoning": "Good"},
+                    "clarity": {"score": 0.85, "reasoning": "Clear"},
+                }
+            )
+        )
+        assertions = [
+            {**SAMPLE_ASSERTION, "custom_prompt": "Grade strictly."},
+            {**SAMPLE_ASSERTION, "k": 1},
+        ]
+
+        results = await _EVALUATOR.evaluate_async_batch(_make_trace(), assertions)
+
+        assert judge_adapter.calls == 4
+        assert [r.passed for r in results] == [True, True]
+        assert "k=3" in results[0].details
+        assert "k=1" in results[1].details
+
+
+class TestEvaluateBatchApiAsync:
+    """Test routing judge requests through a provider batch API."""
+
+    def _item(self, use_batch_api: bool = True, k: int = 3) -> tuple[RunTrace, dict]:
+        return _make_trace(), {
+            **SAMPLE_ASSERTION,
+            "_project_judge_config": {"k": k, "use_batch_api": use_batch_api},
+        }
+
+    async def test_items_submitted_as_one_batch(self, judge_adapter):
+        good = _make_adapter_result(
+            {
+                "accuracy": {"score": 0.9, "reasoning": "Good"},
+                "clarity": {"score": 0.8, "reasoning": "Clear"},
+            }
+        )
+        bad = _make_adapter_result(
+            {
+                "accuracy": {"score": 0.1, "reasoning": "Bad"},
+                "clarity": {"score": 0.1, "reasoning": "Bad"},
+            }
+        )
+        submitted: list[list[BatchRequest]] = []
+
+        async def send_batch(requests, *, poll_interval):
+            submitted.append(requests)
+            return [good] * 3 + [bad, bad, RuntimeError("expired")]
+
+        judge_adapter.supports_batch = True
+        judge_adapter.send_batch = send_batch
+
+        first, second = await _EVALUATOR.evaluate_batch_api_async(
+            [self._item(), self._item()], poll_interval=0
+        )
+
+        assert len(submitted) == 1
+        assert len(submitted[0]) == 6
+        assert submitted[0][0].tools[0]["name"] == "score_criteria"
+        assert judge_adapter.calls == 0
+        assert first.passed is True
+        assert second.passed is False
+        assert "votes=2/3" in second.details
+        # 3 calls * 0.001 at the batch discount
+        assert first.metadata["judge_cost_usd"] == pytest.approx(0.0015)
+
+    async def test_not_opted_in_uses_send_turn(self, judge_adapter):
+        judge_adapter.set_result(_GOOD_RESULT)
+        judge_adapter.send_batch = AsyncMock()
+
+        (result,) = await _EVALUATOR.evaluate_batch_api_async(
+            [self._item(use_batch_api=False)]
+        )
+
+        judge_adapter.send_batch.assert_not_called()
+        assert judge_adapter.calls == 3
+        assert result.passed is True
+
+    async def test_adapter_without_batch_support_falls_back(self, judge_adapter):
+        # StubAdapter keeps BaseAdapter's supports_batch = False
+        judge_adapter.set_result(_GOOD_RESULT)
+        judge_adapter.send_batch = AsyncMock()
+
+        (result,) = await _EVALUATOR.evaluate_batch_api_async([self._item()])
+
+        judge_adapter.send_batch.assert_not_called()
+        assert judge_adapter.calls == 3
+        assert result.passed is True
+
+    async def test_failed_batch_fails_only_its_items(self, judge_adapter):
+        judge_adapter.set_result(_GOOD_RESULT)
+        judge_adapter.supports_batch = True
+        judge_adapter.send_batch = AsyncMock(
+            side_effect=RuntimeError("OpenAI batch b1 ended with status 'expired'")
+        )
+
+        batched, direct = await _EVALUATOR.evaluate_batch_api_async(
+            [self._item(), self._item(use_batch_api=False)], poll_interval=0
+        )
+
+        assert batched.passed is False
+        assert batched.score == 0.0
+        assert "judge_batch_failed" in batched.details
+        assert "expired" in batched.details
+        assert direct.passed is True
+
 
 class TestResolveJudgeConfig:
     def test_resolve_judge_config_defaults(self):
@@ -252,17 +564,51 @@ class TestResolveJudgeConfig:
         # Project-level for unoverridden
         assert result["judge_adapter"] == "anthropic"
 
+    def test_resolve_judge_config_returns_independent_dicts(self):
+        """Memoized results are copied, so callers can mutate them freely."""
+        first = resolve_judge_config({"k": 5})
+        first["k"] = 99
+        second = resolve_judge_config({"k": 5})
+        assert second["k"] == 5
+        assert first is not second
+
+    def test_resolve_judge_config_ignores_unrelated_keys(self):
+        """Keys outside the resolver set (e.g. criteria lists) don't matter."""
+        assertion = {"judge_model": "gpt-4o", "criteria": [{"name": "a"}]}
+        result = resolve_judge_config(assertion)
+        assert result["judge_model"] == "gpt-4o"
+
+    def test_resolve_judge_config_unhashable_override(self):
+        """Unhashable override values fall back to uncached resolution."""
+        result = resolve_judge_config({"judge_model": ["not", "hashable"]})
+        assert result["judge_model"] == ["not", "hashable"]
+
+    def test_resolve_judge_config_cache_keeps_value_types(self):
+        """Equal values of different types (True/1, 0/0.0) resolve separately."""
+        resolve_judge_config({"k": True, "temperature": 0})
+        result = resolve_judge_config({"k": 1, "temperature": 0.0})
+        assert type(result["k"]) is int
+        assert type(result["temperature"]) is float
+
 
 class TestDefaultThresholdFromProject:
     """Test that default_threshold from project config flows through."""
 
-    @pytest.mark.asyncio
-    async def test_project_default_threshold_used(self):
-        """JudgeEvaluator uses default_threshold from project config when assertion lacks threshold."""
-        mock_adapter = MagicMock()
-        mock_adapter.provider_name.return_value = "openai"
-        mock_adapter.send_turn = AsyncMock(
-            return_value=_make_adapter_result(
+    @pytest.mark.parametrize(
+        ("assertion_threshold", "expect_pass"),
+        [(None, True), (0.9, False)],
+        ids=["project_default_used", "assertion_overrides_project"],
+    )
+    async def test_default_threshold_resolution(
+        self, judge_adapter, assertion_threshold, expect_pass
+    ):
+        """Project default_threshold (0.5) applies unless the assertion sets one.
+
+        Scores of 0.65/0.6 pass the project default but fail an
+        assertion-level threshold of 0.9.
+        """
+        judge_adapter.set_result(
+            _make_adapter_result(
                 {
                     "accuracy": {"score": 0.65, "reasoning": "Decent"},
                     "clarity": {"score": 0.6, "reasoning": "OK"},
@@ -278,90 +624,143 @@ class TestDefaultThresholdFromProject:
             ],
             "weight": 1.0,
             "required": False,
-            # No threshold set -- should use default from project config
             "_project_judge_config": {
                 "adapter": "openai",
                 "model": "gpt-4o-mini",
                 "k": 3,
                 "temperature": 0.0,
                 "max_tokens": 1024,
-                "default_threshold": 0.5,  # Lower threshold
+                "default_threshold": 0.5,  # Lower project default
             },
         }
+        if assertion_threshold is not None:
+            assertion["threshold"] = assertion_threshold
 
-        evaluator = JudgeEvaluator()
-        with patch(
-            "salvo.evaluation.evaluators.judge.get_adapter", return_value=mock_adapter
-        ), patch(
-            "salvo.evaluation.evaluators.judge.estimate_cost", return_value=0.001
-        ):
-            result = await evaluator.evaluate_async(_make_trace(), assertion)
+        result = await _EVALUATOR.evaluate_async(_make_trace(), assertion)
 
-        # With default_threshold=0.5, scores of 0.65/0.6 should pass
-        assert result.passed is True
+        assert result.passed is expect_pass
 
-    @pytest.mark.asyncio
-    async def test_assertion_threshold_overrides_project(self):
-        """Assertion-level threshold takes precedence over project default_threshold."""
-        mock_adapter = MagicMock()
-        mock_adapter.provider_name.return_value = "openai"
-        mock_adapter.send_turn = AsyncMock(
-            return_value=_make_adapter_result(
-                {
-                    "accuracy": {"score": 0.65, "reasoning": "Decent"},
-                    "clarity": {"score": 0.6, "reasoning": "OK"},
-                }
-            )
-        )
 
-        assertion = {
-            "type": "judge",
-            "criteria": [
-                {"name": "accuracy", "description": "Factually correct", "weight": 1.0},
-                {"name": "clarity", "description": "Easy to understand", "weight": 0.5},
-            ],
-            "weight": 1.0,
-            "required": False,
-            "threshold": 0.9,  # High threshold set on assertion
+class TestJudgeResponseCache:
+    """Test the opt-in persistent judge response cache."""
+
+    def _assertion(self, **project_overrides) -> dict:
+        project = {
+            "adapter": "openai",
+            "model": "gpt-4o-mini",
+            "k": 3,
+            "temperature": 0.0,
+            "max_tokens": 1024,
+            "default_threshold": 0.8,
+            "cache": True,
+        }
+        project.update(project_overrides)
+        return {**SAMPLE_ASSERTION, "_project_judge_config": project}
+
+    async def test_rerun_served_from_cache(self, judge_adapter, tmp_path, monkeypatch):
+        """A second identical evaluation makes no adapter calls and costs nothing."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        judge_adapter.set_result(_GOOD_RESULT)
+
+        first = await _EVALUATOR.evaluate_async(_make_trace(), self._assertion())
+        assert judge_adapter.calls == 3
+
+        judge_adapter.calls = 0
+        second = await _EVALUATOR.evaluate_async(_make_trace(), self._assertion())
+
+        assert judge_adapter.calls == 0
+        assert second.score == first.score
+        assert second.passed is True
+        assert "judge_cost=$0.000000" in second.details
+
+    async def test_cache_disabled_by_default(self, judge_adapter, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        judge_adapter.set_result(_GOOD_RESULT)
+
+        await _EVALUATOR.evaluate_async(_make_trace(), self._assertion(cache=False))
+
+        assert not (tmp_path / "salvo").exists()
+
+    async def test_cache_skipped_for_nonzero_temperature(
+        self, judge_adapter, tmp_path, monkeypatch
+    ):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        judge_adapter.set_result(_GOOD_RESULT)
+
+        await _EVALUATOR.evaluate_async(_make_trace(), self._assertion(temperature=0.7))
+        judge_adapter.calls = 0
+        await _EVALUATOR.evaluate_async(_make_trace(), self._assertion(temperature=0.7))
+
+        assert judge_adapter.calls == 3
+
+
+class TestJudgeEarlyStop:
+    """Test the opt-in self-consistency early exit."""
+
+    def _assertion(self, k: int, early_stop: bool = True) -> dict:
+        return {
+            **SAMPLE_ASSERTION,
+            "threshold": 0.5,
             "_project_judge_config": {
                 "adapter": "openai",
                 "model": "gpt-4o-mini",
-                "k": 3,
+                "k": k,
                 "temperature": 0.0,
                 "max_tokens": 1024,
-                "default_threshold": 0.5,  # Lower project default
+                "early_stop": early_stop,
             },
         }
 
-        evaluator = JudgeEvaluator()
-        with patch(
-            "salvo.evaluation.evaluators.judge.get_adapter", return_value=mock_adapter
-        ), patch(
-            "salvo.evaluation.evaluators.judge.estimate_cost", return_value=0.001
-        ):
-            result = await evaluator.evaluate_async(_make_trace(), assertion)
+    async def test_unanimous_pass_stops_after_majority(self, judge_adapter):
+        high = _make_adapter_result(
+            {
+                "accuracy": {"score": 0.99, "reasoning": "Good"},
+                "clarity": {"score": 0.99, "reasoning": "Clear"},
+            }
+        )
+        judge_adapter.set_result(high)
 
-        # Assertion threshold 0.9 overrides project 0.5; scores 0.65/0.6 should fail
-        assert result.passed is False
+        result = await _EVALUATOR.evaluate_async(_make_trace(), self._assertion(k=5))
 
+        assert judge_adapter.calls <= 3
+        assert result.passed is True
+        assert "votes=3/5" in result.details
+
+    async def test_split_vote_samples_more(self, judge_adapter):
+        high = _make_adapter_result(
+            {
+                "accuracy": {"score": 0.9, "reasoning": "Good"},
+                "clarity": {"score": 0.9, "reasoning": "Clear"},
+            }
+        )
+        low = _make_adapter_result(
+            {
+                "accuracy": {"score": 0.1, "reasoning": "Bad"},
+                "clarity": {"score": 0.1, "reasoning": "Unclear"},
+            }
+        )
+        judge_adapter.set_results([high, low, high])
 
-class TestK1VerboseWarning:
-    """Test that k=1 emits a warning when verbose is active."""
-
-    @pytest.mark.asyncio
-    async def test_k1_verbose_warning_emitted(self, capsys):
-        """k=1 with _verbose=True emits a warning to stderr."""
-        mock_adapter = MagicMock()
-        mock_adapter.provider_name.return_value = "openai"
-        mock_adapter.send_turn = AsyncMock(
-            return_value=_make_adapter_result(
-                {
-                    "accuracy": {"score": 0.9, "reasoning": "Good"},
-                }
-            )
+        result = await _EVALUATOR.evaluate_async(_make_trace(), self._assertion(k=3))
+
+        assert judge_adapter.calls == 3
+        assert result.passed is True
+
+    async def test_disabled_runs_all_samples(self, judge_adapter):
+        judge_adapter.set_result(_GOOD_RESULT)
+
+        await _EVALUATOR.evaluate_async(
+            _make_trace(), self._assertion(k=5, early_stop=False)
         )
 
-        assertion = {
+        assert judge_adapter.calls == 5
+
+
+class TestK1VerboseWarning:
+    """Test that k=1 prints a warning when verbose is active."""
+
+    def _assertion(self, **extra) -> dict:
+        return {
             "type": "judge",
             "criteria": [
                 {"name": "accuracy", "description": "Factually correct", "weight": 1.0},
@@ -369,52 +768,35 @@ class TestK1VerboseWarning:
             "weight": 1.0,
             "required": False,
             "k": 1,
-            "_verbose": True,
+            **extra,
         }
 
-        evaluator = JudgeEvaluator()
-        with patch(
-            "salvo.evaluation.evaluators.judge.get_adapter", return_value=mock_adapter
-        ), patch(
-            "salvo.evaluation.evaluators.judge.estimate_cost", return_value=0.001
-        ):
-            await evaluator.evaluate_async(_make_trace(), assertion)
+    @pytest.fixture(autouse=True)
+    def _fresh_notices(self, monkeypatch):
+        monkeypatch.setattr("salvo.evaluation.evaluators.judge._K1_NOTICED", set())
 
-        captured = capsys.readouterr()
-        assert "k=1" in captured.err
-        assert "majority voting is disabled" in captured.err
+    async def test_k1_verbose_warning_emitted(self, judge_adapter, capsys):
+        """k=1 with _verbose=True prints a named warning to stderr, once."""
+        judge_adapter.set_result(
+            _make_adapter_result({"accuracy": {"score": 0.9, "reasoning": "Good"}})
+        )
 
-    @pytest.mark.asyncio
-    async def test_k1_no_verbose_no_warning(self, capsys):
-        """k=1 without _verbose does NOT emit a warning."""
-        mock_adapter = MagicMock()
-        mock_adapter.provider_name.return_value = "openai"
-        mock_adapter.send_turn = AsyncMock(
-            return_value=_make_adapter_result(
-                {
-                    "accuracy": {"score": 0.9, "reasoning": "Good"},
-                }
+        for _ in range(2):
+            await _EVALUATOR.evaluate_async(
+                _make_trace(), self._assertion(name="quality", _verbose=True)
             )
-        )
 
-        assertion = {
-            "type": "judge",
-            "criteria": [
-                {"name": "accuracy", "description": "Factually correct", "weight": 1.0},
-            ],
-            "weight": 1.0,
-            "required": False,
-            "k": 1,
-            # No _verbose flag
-        }
+        err = capsys.readouterr().err
+        assert "k=1 for judge assertion 'quality'" in err
+        assert err.count("majority voting is disabled") == 1
+
+    async def test_k1_no_verbose_no_warning(self, judge_adapter, capsys):
+        """k=1 without _verbose does NOT emit a warning."""
+        judge_adapter.set_result(
+            _make_adapter_result({"accuracy": {"score": 0.9, "reasoning": "Good"}})
+        )
 
-        evaluator = JudgeEvaluator()
-        with patch(
-            "salvo.evaluation.evaluators.judge.get_adapter", return_value=mock_adapter
-        ), patch(
-            "salvo.evaluation.evaluators.judge.estimate_cost", return_value=0.001
-        ):
-            await evaluator.evaluate_async(_make_trace(), assertion)
+        # No _verbose flag
+        await _EVALUATOR.evaluate_async(_make_trace(), self._assertion())
 
-        captured = capsys.readouterr()
-        assert "majority voting is disabled" not in captured.err
+        assert "majority voting is disabled" not in capsys.readouterr().err
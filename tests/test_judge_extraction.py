@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import json
+from unittest.mock import patch
 
 from salvo.adapters.base import AdapterTurnResult, TokenUsage, ToolCallResult
 from salvo.evaluation.judge.extraction import (
+    criterion_name_set,
     extract_json_from_text,
     extract_scores,
     extract_scores_from_tool_call,
@@ -17,6 +19,18 @@ SAMPLE_CRITERIA = [
     {"name": "clarity", "description": "Easy to understand", "weight": 0.5},
 ]
 
+_TEXT_SCORES_SINGLE = json.dumps({"accuracy": {"score": 0.8, "reasoning": "ok"}})
+
+_TEXT_SCORES_BAD = json.dumps({
+    "accuracy": {"score": 0.1, "reasoning": "Bad"},
+    "clarity": {"score": 0.1, "reasoning": "Bad"},
+})
+
+_TEXT_SCORES_DECENT = json.dumps({
+    "accuracy": {"score": 0.7, "reasoning": "Decent"},
+    "clarity": {"score": 0.6, "reasoning": "OK"},
+})
+
 
 def _make_tool_call(name: str, arguments: dict) -> ToolCallResult:
     return ToolCallResult(id="call_123", name=name, arguments=arguments)
@@ -76,11 +90,22 @@ class TestExtractFromToolCall:
 
 class TestExtractJsonFromText:
     def test_extract_json_from_text_direct(self):
-        text = json.dumps({"accuracy": {"score": 0.8, "reasoning": "ok"}})
-        result = extract_json_from_text(text)
+        result = extract_json_from_text(_TEXT_SCORES_SINGLE)
         assert result is not None
         assert result["accuracy"]["score"] == 0.8
 
+    def test_extract_json_from_text_direct_with_leading_whitespace(self):
+        result = extract_json_from_text("\n  " + _TEXT_SCORES_SINGLE + "\n")
+        assert result is not None
+        assert result["accuracy"]["score"] == 0.8
+
+    def test_extract_json_from_text_prose_skips_direct_parse(self):
+        text = 'Here are my scores: {"accuracy": {"score": 0.8, "reasoning": "ok"}}'
+        with patch("salvo.evaluation.judge.extraction.from_json") as mock_parse:
+            result = extract_json_from_text(text)
+        mock_parse.assert_not_called()
+        assert result["accuracy"]["score"] == 0.8
+
     def test_extract_json_from_text_brace(self):
         text = 'Here are my scores: {"accuracy": {"score": 0.8, "reasoning": "ok"}} done.'
         result = extract_json_from_text(text)
@@ -93,6 +118,22 @@ class TestExtractJsonFromText:
         assert result is not None
         assert result["accuracy"]["score"] == 0.8
 
+    def test_extract_json_from_text_brace_with_trailing_braces(self):
+        """An object followed by more brace-y prose is still found."""
+        text = (
+            'Scores: {"accuracy": {"score": 0.8, "reasoning": "ok"}} '
+            "(note: use {placeholders} next time)"
+        )
+        result = extract_json_from_text(text)
+        assert result is not None
+        assert result["accuracy"]["score"] == 0.8
+
+    def test_extract_json_from_text_skips_invalid_leading_brace(self):
+        text = 'Format {name: score}. Result: {"accuracy": {"score": 0.6, "reasoning": "ok"}}'
+        result = extract_json_from_text(text)
+        assert result is not None
+        assert result["accuracy"]["score"] == 0.6
+
     def test_extract_json_from_text_invalid(self):
         result = extract_json_from_text("This is not JSON at all")
         assert result is None
@@ -110,21 +151,41 @@ class TestExtractScores:
             )
         ]
         # Also provide text JSON -- tool call should win
-        text = json.dumps({
-            "accuracy": {"score": 0.1, "reasoning": "Bad"},
-            "clarity": {"score": 0.1, "reasoning": "Bad"},
-        })
-        result_obj = _make_result(content=text, tool_calls=tool_calls)
+        result_obj = _make_result(content=_TEXT_SCORES_BAD, tool_calls=tool_calls)
         result = extract_scores(result_obj, SAMPLE_CRITERIA)
         assert result is not None
         assert result["accuracy"]["score"] == 0.9  # from tool call, not text
 
+    def test_extract_scores_tool_call_skips_text_parse(self):
+        tool_calls = [
+            _make_tool_call(
+                "score_criteria",
+                {"accuracy": {"score": 0.9, "reasoning": "Good"}},
+            )
+        ]
+        result_obj = _make_result(content=_TEXT_SCORES_BAD, tool_calls=tool_calls)
+        with patch(
+            "salvo.evaluation.judge.extraction.extract_json_from_text"
+        ) as mock_text:
+            result = extract_scores(result_obj, SAMPLE_CRITERIA)
+        mock_text.assert_not_called()
+        assert result["accuracy"]["score"] == 0.9
+
+    def test_extract_scores_with_precomputed_names(self):
+        names = criterion_name_set(SAMPLE_CRITERIA)
+        assert names == frozenset({"accuracy", "clarity"})
+        tool_calls = [
+            _make_tool_call(
+                "score_criteria",
+                {"accuracy": {"score": 1.4, "reasoning": "Over"}},
+            )
+        ]
+        result_obj = _make_result(tool_calls=tool_calls)
+        result = extract_scores(result_obj, SAMPLE_CRITERIA, names)
+        assert result["accuracy"]["score"] == 1.0
+
     def test_extract_scores_falls_back_to_text(self):
-        text = json.dumps({
-            "accuracy": {"score": 0.7, "reasoning": "Decent"},
-            "clarity": {"score": 0.6, "reasoning": "OK"},
-        })
-        result_obj = _make_result(content=text, tool_calls=[])
+        result_obj = _make_result(content=_TEXT_SCORES_DECENT, tool_calls=[])
         result = extract_scores(result_obj, SAMPLE_CRITERIA)
         assert result is not None
         assert result["accuracy"]["score"] == 0.7
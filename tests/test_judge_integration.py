@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import types
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -23,49 +25,57 @@ from salvo.models.scenario import Assertion, Scenario, ToolDef
 from salvo.models.trial import TrialStatus
 
 
-def _make_scenario(
-    *,
-    assertions: list[dict] | None = None,
-    system_prompt: str = "You are a helpful assistant.",
-    prompt: str = "Say hello",
-) -> Scenario:
-    """Build a minimal Scenario for testing."""
-    assertion_objs = []
-    for a in (assertions or []):
-        assertion_objs.append(Assertion(**a))
-
+@pytest.fixture(scope="session")
+def base_scenario() -> Scenario:
+    """Validated once; tests derive variants via model_copy."""
     return Scenario(
         description="Test scenario",
         adapter="openai",
         model="gpt-4o-mini",
-        system_prompt=system_prompt,
-        prompt=prompt,
-        assertions=assertion_objs,
+        system_prompt="You are a helpful assistant.",
+        prompt="Say hello",
+        assertions=[],
         threshold=0.8,
     )
 
 
-def _make_agent_trace() -> RunTrace:
-    """Create a realistic agent trace for integration tests."""
-    return RunTrace(
-        messages=[
-            TraceMessage(role="user", content="Say hello"),
-            TraceMessage(role="assistant", content="Hello! How can I help you?"),
-        ],
-        tool_calls_made=[],
-        turn_count=1,
-        input_tokens=50,
-        output_tokens=30,
-        total_tokens=80,
-        latency_seconds=0.8,
-        final_content="Hello! How can I help you?",
-        finish_reason="stop",
-        model="gpt-4o-mini",
-        provider="openai",
-        timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
-        scenario_hash="abc123",
-        cost_usd=0.001,
-    )
+@pytest.fixture
+def make_scenario(base_scenario):
+    """Return a builder for base_scenario with the given assertions.
+
+    model_copy skips revalidating the unchanged fields; only the new
+    assertions are validated.
+    """
+
+    def _make(*, assertions: list[dict]) -> Scenario:
+        return base_scenario.model_copy(
+            update={"assertions": [Assertion.model_validate(a) for a in assertions]}
+        )
+
+    return _make
+
+
+# Realistic agent trace, validated once at import. Tests treat it as
+# read-only: it is only handed back by the mocked ScenarioRunner.
+_SAMPLE_TRACE = RunTrace(
+    messages=[
+        TraceMessage(role="user", content="Say hello"),
+        TraceMessage(role="assistant", content="Hello! How can I help you?"),
+    ],
+    tool_calls_made=[],
+    turn_count=1,
+    input_tokens=50,
+    output_tokens=30,
+    total_tokens=80,
+    latency_seconds=0.8,
+    final_content="Hello! How can I help you?",
+    finish_reason="stop",
+    model="gpt-4o-mini",
+    provider="openai",
+    timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    scenario_hash="abc123",
+    cost_usd=0.001,
+)
 
 
 def _make_judge_adapter_result(scores: dict) -> AdapterTurnResult:
@@ -85,258 +95,198 @@ def _make_judge_adapter_result(scores: dict) -> AdapterTurnResult:
     )
 
 
-class TestE2EJudgeAssertionInTrial:
-    """Test that a judge assertion flows through the full TrialRunner pipeline."""
-
-    @pytest.mark.asyncio
-    async def test_e2e_judge_assertion_in_trial(self) -> None:
-        """Create a Scenario with a judge assertion, mock both agent and judge,
-        run through TrialRunner, verify judge assertion appears in eval_results."""
-        scenario = _make_scenario(
-            assertions=[
-                {
-                    "type": "judge",
-                    "criteria": [
-                        {"name": "helpfulness", "description": "Response is helpful", "weight": 1.0},
-                    ],
-                    "weight": 1.0,
-                    "required": False,
-                },
-            ]
-        )
+@pytest.fixture
+def adapter_config() -> AdapterConfig:
+    return AdapterConfig(model="gpt-4o-mini")
 
-        config = AdapterConfig(model="gpt-4o-mini")
 
-        # Mock agent adapter -- returns simple response via ScenarioRunner
-        agent_trace = _make_agent_trace()
+def _done(value) -> asyncio.Future:
+    """Return an already-resolved future holding value.
 
-        mock_agent_runner = AsyncMock(return_value=agent_trace)
+    Awaiting it completes immediately, without AsyncMock's call
+    bookkeeping or a fresh coroutine frame per call.
+    """
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return future
 
-        # Mock judge adapter -- returns scores via tool call
-        mock_judge_adapter = MagicMock()
-        mock_judge_adapter.provider_name.return_value = "openai"
-        mock_judge_adapter.send_turn = AsyncMock(
-            return_value=_make_judge_adapter_result(
-                {"helpfulness": {"score": 0.9, "reasoning": "Very helpful"}}
-            )
-        )
 
-        def mock_adapter_factory():
-            adapter = MagicMock(spec=BaseAdapter)
-            return adapter
-
-        runner = TrialRunner(
-            adapter_factory=mock_adapter_factory,
-            scenario=scenario,
-            config=config,
-            n_trials=1,
-            max_parallel=1,
-            threshold=0.8,
-        )
+class _StubAdapter(BaseAdapter):
+    """Minimal adapter: send_turn returns the preset result.
 
-        # Patch ScenarioRunner.run to return our trace
-        # Patch judge's get_adapter to return our mock judge adapter
-        with patch(
-            "salvo.execution.runner.ScenarioRunner"
-        ) as mock_sr_cls, patch(
-            "salvo.evaluation.evaluators.judge.get_adapter",
-            return_value=mock_judge_adapter,
-        ), patch(
-            "salvo.evaluation.evaluators.judge.estimate_cost",
-            return_value=0.001,
-        ):
-            mock_sr_instance = MagicMock()
-            mock_sr_instance.run = mock_agent_runner
-            mock_sr_cls.return_value = mock_sr_instance
-
-            # Also patch retry_with_backoff to call the factory directly
-            async def mock_retry(coro_factory, **kwargs):
-                result = await coro_factory()
-                return (result, 0, [])
-
-            with patch(
-                "salvo.execution.trial_runner.retry_with_backoff",
-                side_effect=mock_retry,
-            ):
-                suite = await runner.run_all()
-
-        assert suite.trials_total == 1
-        trial = suite.trials[0]
-        assert trial.status == TrialStatus.passed
-        assert len(trial.eval_results) == 1
-
-        judge_result = trial.eval_results[0]
-        assert judge_result.assertion_type == "judge"
-        assert judge_result.passed is True
-        assert judge_result.score > 0.8
-        assert judge_result.metadata is not None
-        assert judge_result.metadata["judge_model"] == "gpt-4o-mini"
-
-
-class TestE2EMixedAssertions:
-    """Test scenario with both standard JMESPath and judge assertions."""
-
-    @pytest.mark.asyncio
-    async def test_e2e_mixed_assertions(self) -> None:
-        """Scenario with JMESPath + judge assertions, verify both evaluated correctly."""
-        scenario = _make_scenario(
-            assertions=[
-                {
-                    "type": "jmespath",
-                    "expression": "response.content",
-                    "operator": "contains",
-                    "value": "Hello",
-                    "weight": 1.0,
-                    "required": False,
-                },
-                {
-                    "type": "judge",
-                    "criteria": [
-                        {"name": "helpfulness", "description": "Response is helpful", "weight": 1.0},
-                    ],
-                    "weight": 1.0,
-                    "required": False,
-                },
-            ]
-        )
+    Used both as the agent adapter factory (whose calls ScenarioRunner's
+    patch bypasses) and as the judge adapter; much cheaper to construct
+    than MagicMock(spec=BaseAdapter).
+    """
 
-        config = AdapterConfig(model="gpt-4o-mini")
-        agent_trace = _make_agent_trace()
-        mock_agent_runner = AsyncMock(return_value=agent_trace)
+    def __init__(self) -> None:
+        self.result: AdapterTurnResult | None = None
 
-        mock_judge_adapter = MagicMock()
-        mock_judge_adapter.provider_name.return_value = "openai"
-        mock_judge_adapter.send_turn = AsyncMock(
-            return_value=_make_judge_adapter_result(
-                {"helpfulness": {"score": 0.85, "reasoning": "Good"}}
-            )
-        )
+    def send_turn(self, messages, tools=None, config=None):
+        return _done(self.result)
 
-        def mock_adapter_factory():
-            return MagicMock(spec=BaseAdapter)
+    def provider_name(self) -> str:
+        return "openai"
 
-        runner = TrialRunner(
-            adapter_factory=mock_adapter_factory,
-            scenario=scenario,
-            config=config,
-            n_trials=1,
-            max_parallel=1,
-            threshold=0.8,
-        )
 
-        with patch(
-            "salvo.execution.runner.ScenarioRunner"
-        ) as mock_sr_cls, patch(
-            "salvo.evaluation.evaluators.judge.get_adapter",
-            return_value=mock_judge_adapter,
-        ), patch(
-            "salvo.evaluation.evaluators.judge.estimate_cost",
-            return_value=0.001,
-        ):
-            mock_sr_instance = MagicMock()
-            mock_sr_instance.run = mock_agent_runner
-            mock_sr_cls.return_value = mock_sr_instance
-
-            async def mock_retry(coro_factory, **kwargs):
-                result = await coro_factory()
-                return (result, 0, [])
-
-            with patch(
-                "salvo.execution.trial_runner.retry_with_backoff",
-                side_effect=mock_retry,
-            ):
-                suite = await runner.run_all()
-
-        assert suite.trials_total == 1
-        trial = suite.trials[0]
-        assert len(trial.eval_results) == 2
-
-        jmespath_result = trial.eval_results[0]
-        assert jmespath_result.assertion_type == "jmespath"
-        assert jmespath_result.passed is True
-
-        judge_result = trial.eval_results[1]
-        assert judge_result.assertion_type == "judge"
-        assert judge_result.passed is True
-
-        # Both pass so weighted score should be high
-        assert suite.score_avg > 0.8
-        assert suite.verdict.value == "PASS"
+@pytest.fixture(scope="module")
+def judge_adapter() -> _StubAdapter:
+    """Judge adapter shared by the module; tests set its result."""
+    return _StubAdapter()
 
 
-class TestE2EJudgeCostTracked:
-    """Test that judge costs are tracked in the TrialSuiteResult."""
-
-    @pytest.mark.asyncio
-    async def test_e2e_judge_cost_tracked_in_suite(self) -> None:
-        """Verify judge_cost_total populated in TrialSuiteResult."""
-        scenario = _make_scenario(
-            assertions=[
-                {
-                    "type": "judge",
-                    "criteria": [
-                        {"name": "accuracy", "description": "Factually correct", "weight": 1.0},
-                    ],
-                    "weight": 1.0,
-                    "required": False,
-                },
-            ]
-        )
+async def _mock_retry(coro_factory, **kwargs):
+    """Stand-in for retry_with_backoff: call the factory once, no retries."""
+    result = await coro_factory()
+    return (result, 0, [])
 
-        config = AdapterConfig(model="gpt-4o-mini")
-        agent_trace = _make_agent_trace()
-        mock_agent_runner = AsyncMock(return_value=agent_trace)
 
-        mock_judge_adapter = MagicMock()
-        mock_judge_adapter.provider_name.return_value = "openai"
-        mock_judge_adapter.send_turn = AsyncMock(
-            return_value=_make_judge_adapter_result(
-                {"accuracy": {"score": 0.9, "reasoning": "Accurate"}}
-            )
-        )
+@pytest.fixture(autouse=True, scope="module")
+def _patch_retry():
+    """Rebind retry_with_backoff to _mock_retry once for the whole module.
+
+    A direct rebinding avoids a MagicMock side_effect dispatch on every
+    trial.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("salvo.execution.trial_runner.retry_with_backoff", _mock_retry)
+        yield
+
 
-        def mock_adapter_factory():
-            return MagicMock(spec=BaseAdapter)
+@pytest.fixture(autouse=True)
+def judge_patches(judge_adapter):
+    """Mock out the agent run, judge adapter lookup and cost.
 
-        runner = TrialRunner(
-            adapter_factory=mock_adapter_factory,
-            scenario=scenario,
-            config=config,
-            n_trials=2,
-            max_parallel=1,
-            threshold=0.8,
+    ScenarioRunner.run returns _SAMPLE_TRACE and the judge's get_adapter
+    returns judge_adapter. Yields the patched mocks by name.
+    """
+    with contextlib.ExitStack() as stack:
+        scenario_runner = stack.enter_context(
+            patch("salvo.execution.runner.ScenarioRunner")
         )
+        scenario_runner.return_value = types.SimpleNamespace(
+            run=lambda *args, **kwargs: _done(_SAMPLE_TRACE)
+        )
+        stack.enter_context(
+            patch(
+                "salvo.evaluation.evaluators.judge.get_adapter",
+                return_value=judge_adapter,
+            )
+        )
+        stack.enter_context(
+            patch("salvo.evaluation.evaluators.judge.estimate_cost", return_value=0.001)
+        )
+        yield {"scenario_runner": scenario_runner}
 
-        with patch(
-            "salvo.execution.runner.ScenarioRunner"
-        ) as mock_sr_cls, patch(
-            "salvo.evaluation.evaluators.judge.get_adapter",
-            return_value=mock_judge_adapter,
-        ), patch(
-            "salvo.evaluation.evaluators.judge.estimate_cost",
-            return_value=0.001,
-        ):
-            mock_sr_instance = MagicMock()
-            mock_sr_instance.run = mock_agent_runner
-            mock_sr_cls.return_value = mock_sr_instance
-
-            async def mock_retry(coro_factory, **kwargs):
-                result = await coro_factory()
-                return (result, 0, [])
-
-            with patch(
-                "salvo.execution.trial_runner.retry_with_backoff",
-                side_effect=mock_retry,
-            ):
-                suite = await runner.run_all()
-
-        # 2 trials * 3 judge calls each * $0.001/call = $0.006 total judge cost
-        assert suite.judge_cost_total is not None
-        assert suite.judge_cost_total == pytest.approx(0.006, abs=1e-6)
 
-        # Verify individual trial eval results have metadata
+async def _run_trials(scenario: Scenario, config: AdapterConfig, n_trials: int = 1):
+    """Run scenario through TrialRunner (agent and judge mocked by judge_patches)."""
+    runner = TrialRunner(
+        adapter_factory=_StubAdapter,
+        scenario=scenario,
+        config=config,
+        n_trials=n_trials,
+        max_parallel=1,
+        threshold=0.8,
+    )
+    return await runner.run_all()
+
+
+_HELPFULNESS_JUDGE = {
+    "type": "judge",
+    "criteria": [
+        {"name": "helpfulness", "description": "Response is helpful", "weight": 1.0},
+    ],
+    "weight": 1.0,
+    "required": False,
+}
+
+_ACCURACY_JUDGE = {
+    "type": "judge",
+    "criteria": [
+        {"name": "accuracy", "description": "Factually correct", "weight": 1.0},
+    ],
+    "weight": 1.0,
+    "required": False,
+}
+
+_CONTAINS_HELLO = {
+    "type": "jmespath",
+    "expression": "response.content",
+    "operator": "contains",
+    "value": "Hello",
+    "weight": 1.0,
+    "required": False,
+}
+
+
+@pytest.fixture
+def scenario(request, make_scenario) -> Scenario:
+    """Scenario built from the assertion list given via indirect parametrization."""
+    return make_scenario(assertions=request.param)
+
+
+class TestE2EJudgePipeline:
+    """Judge assertions flow through the full TrialRunner pipeline."""
+
+    @pytest.mark.parametrize(
+        ("scenario", "judge_scores", "n_trials", "expected_types"),
+        [
+            pytest.param(
+                [_HELPFULNESS_JUDGE],
+                {"helpfulness": {"score": 0.9, "reasoning": "Very helpful"}},
+                1,
+                ["judge"],
+                id="judge_assertion_in_trial",
+            ),
+            pytest.param(
+                [_CONTAINS_HELLO, _HELPFULNESS_JUDGE],
+                {"helpfulness": {"score": 0.85, "reasoning": "Good"}},
+                1,
+                ["jmespath", "judge"],
+                id="mixed_assertions",
+            ),
+            pytest.param(
+                [_ACCURACY_JUDGE],
+                {"accuracy": {"score": 0.9, "reasoning": "Accurate"}},
+                2,
+                ["judge"],
+                id="judge_cost_tracked_in_suite",
+            ),
+        ],
+        indirect=["scenario"],
+    )
+    async def test_e2e_judge_pipeline(
+        self,
+        scenario,
+        judge_scores,
+        n_trials,
+        expected_types,
+        adapter_config,
+        judge_adapter,
+    ) -> None:
+        """Mock both agent and judge, run through TrialRunner, and verify
+        every assertion is evaluated, passes, and judge cost is tracked."""
+        judge_adapter.result = _make_judge_adapter_result(judge_scores)
+
+        suite = await _run_trials(scenario, adapter_config, n_trials=n_trials)
+
+        assert suite.trials_total == n_trials
         for trial in suite.trials:
+            assert trial.status == TrialStatus.passed
+            assert [er.assertion_type for er in trial.eval_results] == expected_types
             for er in trial.eval_results:
+                assert er.passed is True
                 if er.assertion_type == "judge":
+                    assert er.score > 0.8
                     assert er.metadata is not None
+                    assert er.metadata["judge_model"] == "gpt-4o-mini"
                     assert "judge_cost_usd" in er.metadata
+
+        # All assertions pass so weighted score should be high
+        assert suite.score_avg > 0.8
+        assert suite.verdict.value == "PASS"
+
+        # n_trials * 3 judge calls each * $0.001/call
+        assert suite.judge_cost_total is not None
+        assert suite.judge_cost_total == pytest.approx(0.003 * n_trials, abs=1e-6)
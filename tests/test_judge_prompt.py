@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+
+import pytest
+
 from salvo.evaluation.judge.prompt import (
     build_criteria_block,
     build_judge_prompt,
@@ -10,50 +14,71 @@ from salvo.evaluation.judge.prompt import (
 )
 
 
-SAMPLE_CRITERIA = [
-    {"name": "accuracy", "description": "Factually correct response", "weight": 1.0},
-    {"name": "completeness", "description": "Covers all required points", "weight": 0.8},
-    {"name": "clarity", "description": "Easy to understand", "weight": 0.5},
-]
+# Read-only so any builder that tried to mutate its input would fail loudly.
+SAMPLE_CRITERIA = tuple(
+    MappingProxyType(c)
+    for c in (
+        {"name": "accuracy", "description": "Factually correct response", "weight": 1.0},
+        {"name": "completeness", "description": "Covers all required points", "weight": 0.8},
+        {"name": "clarity", "description": "Easy to understand", "weight": 0.5},
+    )
+)
+
+# Every name, weight and description must appear in the criteria block.
+CRITERIA_BLOCK_REQUIRED = (
+    "accuracy",
+    "completeness",
+    "clarity",
+    "weight: 1.0",
+    "weight: 0.8",
+    "weight: 0.5",
+    "Factually correct response",
+    "Covers all required points",
+    "Easy to understand",
+)
+
+
+@pytest.fixture(scope="module")
+def criteria_block() -> str:
+    return build_criteria_block(SAMPLE_CRITERIA)
+
+
+@pytest.fixture(scope="module")
+def judge_prompt() -> str:
+    return build_judge_prompt(SAMPLE_CRITERIA)
+
+
+@pytest.fixture(scope="module")
+def scoring_tool() -> dict:
+    return build_scoring_tool(SAMPLE_CRITERIA)
 
 
 class TestBuildCriteriaBlock:
-    def test_build_criteria_block_formats_all_criteria(self):
-        result = build_criteria_block(SAMPLE_CRITERIA)
-        assert "accuracy" in result
-        assert "completeness" in result
-        assert "clarity" in result
-        assert "weight: 1.0" in result
-        assert "weight: 0.8" in result
-        assert "weight: 0.5" in result
-        assert "Factually correct response" in result
-        assert "Covers all required points" in result
-        assert "Easy to understand" in result
+    def test_build_criteria_block_formats_all_criteria(self, criteria_block):
+        missing = [s for s in CRITERIA_BLOCK_REQUIRED if s not in criteria_block]
+        assert not missing
 
 
 class TestBuildJudgePrompt:
-    def test_build_judge_prompt_contains_scale(self):
-        result = build_judge_prompt(SAMPLE_CRITERIA)
-        assert "0.0" in result
-        assert "1.0" in result
+    def test_build_judge_prompt_contains_scale(self, judge_prompt):
+        assert "0.0" in judge_prompt
+        assert "1.0" in judge_prompt
         # Check for the 5-point anchoring
-        assert "0.25" in result
-        assert "0.5" in result
-        assert "0.75" in result
+        assert "0.25" in judge_prompt
+        assert "0.5" in judge_prompt
+        assert "0.75" in judge_prompt
 
-    def test_build_judge_prompt_contains_criteria(self):
-        result = build_judge_prompt(SAMPLE_CRITERIA)
-        assert "accuracy" in result
-        assert "completeness" in result
-        assert "clarity" in result
+    def test_build_judge_prompt_contains_criteria(self, judge_prompt):
+        assert "accuracy" in judge_prompt
+        assert "completeness" in judge_prompt
+        assert "clarity" in judge_prompt
 
 
 class TestBuildScoringTool:
-    def test_build_scoring_tool_schema(self):
-        tool = build_scoring_tool(SAMPLE_CRITERIA)
-        assert tool["name"] == "score_criteria"
-        assert "description" in tool
-        params = tool["parameters"]
+    def test_build_scoring_tool_schema(self, scoring_tool):
+        assert scoring_tool["name"] == "score_criteria"
+        assert "description" in scoring_tool
+        params = scoring_tool["parameters"]
         assert params["type"] == "object"
         # Each criterion should be a property
         props = params["properties"]
@@ -73,21 +98,26 @@ class TestBuildScoringTool:
 
 
 class TestFormatToolChoice:
-    def test_format_tool_choice_openai(self):
-        result = format_tool_choice("openai", "score_criteria")
-        assert result == {
-            "tool_choice": {
-                "type": "function",
-                "function": {"name": "score_criteria"},
-            }
-        }
-
-    def test_format_tool_choice_anthropic(self):
-        result = format_tool_choice("anthropic", "score_criteria")
-        assert result == {
-            "tool_choice": {"type": "tool", "name": "score_criteria"}
-        }
-
-    def test_format_tool_choice_unknown(self):
-        result = format_tool_choice("some_other_provider", "score_criteria")
-        assert result == {}
+    @pytest.mark.parametrize(
+        ("provider", "expected"),
+        [
+            (
+                "openai",
+                {
+                    "tool_choice": {
+                        "type": "function",
+                        "function": {"name": "score_criteria"},
+                    }
+                },
+            ),
+            (
+                "anthropic",
+                {"tool_choice": {"type": "tool", "name": "score_criteria"}},
+            ),
+            # Unknown providers get no tool_choice directive
+            ("some_other_provider", {}),
+        ],
+        ids=["openai", "anthropic", "unknown"],
+    )
+    def test_format_tool_choice(self, provider, expected):
+        assert format_tool_choice(provider, "score_criteria") == expected
@@ -1,59 +1,55 @@
 """Tests for the rich error formatter."""
 
+import pytest
+
 from salvo.loader.errors import ErrorFormatter
 from salvo.loader.validator import ValidationErrorDetail
 
 
+@pytest.fixture(scope="module")
+def rich_formatter() -> ErrorFormatter:
+    return ErrorFormatter(ci_mode=False)
+
+
+@pytest.fixture(scope="module")
+def ci_formatter() -> ErrorFormatter:
+    return ErrorFormatter(ci_mode=True)
+
+
+@pytest.fixture(scope="module")
+def rich_output(rich_formatter) -> str:
+    """Rich rendering of one canonical extra-field error with a suggestion."""
+    error = ValidationErrorDetail(
+        field="modle",
+        message="Extra inputs are not permitted",
+        type="extra_forbidden",
+        line=1,
+        col=1,
+        suggestion="Did you mean 'model'?",
+    )
+    source_lines = ["modle: gpt-4", "prompt: hello"]
+    return rich_formatter.format_error(error, source_lines, "test.yaml")
+
+
 class TestErrorFormatterRichMode:
     """Tests for human-readable rich error formatting."""
 
-    def test_format_error_includes_line_and_snippet(self):
-        """Rich format includes line number, source snippet, and arrow."""
-        error = ValidationErrorDetail(
-            field="modle",
-            message="Extra inputs are not permitted",
-            type="extra_forbidden",
-            line=1,
-            col=1,
-            suggestion="Did you mean 'model'?",
-        )
-        source_lines = ["modle: gpt-4", "prompt: hello"]
-        formatter = ErrorFormatter(ci_mode=False)
-        result = formatter.format_error(error, source_lines, "test.yaml")
-        assert "1" in result  # line number
-        assert "modle" in result  # source snippet
-        assert "test.yaml" in result  # filename
-
-    def test_format_error_includes_error_code(self):
-        """Rich format includes an error code identifier like error[E001]."""
-        error = ValidationErrorDetail(
-            field="modle",
-            message="Extra inputs are not permitted",
-            type="extra_forbidden",
-            line=1,
-            col=1,
-        )
-        source_lines = ["modle: gpt-4"]
-        formatter = ErrorFormatter(ci_mode=False)
-        result = formatter.format_error(error, source_lines, "test.yaml")
-        assert "error[E" in result
-
-    def test_format_error_shows_suggestion_in_rich_mode(self):
-        """Rich format shows 'did you mean' suggestion when present."""
-        error = ValidationErrorDetail(
-            field="modle",
-            message="Extra inputs are not permitted",
-            type="extra_forbidden",
-            line=1,
-            col=1,
-            suggestion="Did you mean 'model'?",
-        )
-        source_lines = ["modle: gpt-4"]
-        formatter = ErrorFormatter(ci_mode=False)
-        result = formatter.format_error(error, source_lines, "test.yaml")
-        assert "model" in result.lower()
+    @pytest.mark.parametrize(
+        "expected",
+        [
+            "1",  # line number
+            "modle",  # source snippet
+            "test.yaml",  # filename
+            "error[E",  # error code identifier like error[E001]
+            "Did you mean 'model'?",  # suggestion
+        ],
+        ids=["line_number", "snippet", "filename", "error_code", "suggestion"],
+    )
+    def test_format_error_rich_contents(self, rich_output, expected):
+        """Rich format includes location, snippet, error code and suggestion."""
+        assert expected in rich_output
 
-    def test_format_error_handles_none_line_number(self):
+    def test_format_error_handles_none_line_number(self, rich_formatter):
         """Formatter produces useful output when line number is None."""
         error = ValidationErrorDetail(
             field="model",
@@ -63,8 +59,7 @@ class TestErrorFormatterRichMode:
             col=None,
         )
         source_lines = ["prompt: hello"]
-        formatter = ErrorFormatter(ci_mode=False)
-        result = formatter.format_error(error, source_lines, "test.yaml")
+        result = rich_formatter.format_error(error, source_lines, "test.yaml")
         assert "model" in result
         assert "required" in result.lower() or "missing" in result.lower()
 
@@ -72,7 +67,7 @@ class TestErrorFormatterRichMode:
 class TestErrorFormatterCIMode:
     """Tests for CI-friendly concise error formatting."""
 
-    def test_ci_format_is_concise(self):
+    def test_ci_format_is_concise(self, ci_formatter):
         """CI format produces file:line:col -- message format."""
         error = ValidationErrorDetail(
             field="modle",
@@ -83,13 +78,12 @@ class TestErrorFormatterCIMode:
             suggestion="Did you mean 'model'?",
         )
         source_lines = ["modle: gpt-4"]
-        formatter = ErrorFormatter(ci_mode=True)
-        result = formatter.format_error(error, source_lines, "test.yaml")
+        result = ci_formatter.format_error(error, source_lines, "test.yaml")
         assert "test.yaml" in result
         assert "1" in result
         assert "--" in result
 
-    def test_ci_format_includes_suggestion(self):
+    def test_ci_format_includes_suggestion(self, ci_formatter):
         """CI format includes suggestion when present."""
         error = ValidationErrorDetail(
             field="modle",
@@ -100,15 +94,14 @@ class TestErrorFormatterCIMode:
             suggestion="Did you mean 'model'?",
         )
         source_lines = ["modle: gpt-4"]
-        formatter = ErrorFormatter(ci_mode=True)
-        result = formatter.format_error(error, source_lines, "test.yaml")
+        result = ci_formatter.format_error(error, source_lines, "test.yaml")
         assert "model" in result.lower()
 
 
 class TestErrorFormatterFormatAll:
     """Tests for formatting multiple errors."""
 
-    def test_format_all_formats_all_errors(self):
+    def test_format_all_formats_all_errors(self, rich_formatter):
         """format_all with multiple errors formats all of them."""
         errors = [
             ValidationErrorDetail(
@@ -127,7 +120,6 @@ class TestErrorFormatterFormatAll:
             ),
         ]
         source = "modle: gpt-4\n"
-        formatter = ErrorFormatter(ci_mode=False)
-        result = formatter.format_all(errors, source, "test.yaml")
+        result = rich_formatter.format_all(errors, source, "test.yaml")
         assert "modle" in result
         assert "prompt" in result
@@ -1,10 +1,12 @@
 """Tests for scenario validation pipeline."""
 
-import tempfile
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 
+from salvo.loader import validator
 from salvo.loader.validator import (
     ValidationErrorDetail,
     validate_scenario,
@@ -13,6 +15,28 @@ from salvo.loader.validator import (
 )
 
 
+@pytest.fixture(scope="session")
+def scenarios_dir(tmp_path_factory):
+    """Read-only scenario files shared by every file-based test.
+
+    Written once per session; tests must not modify them.
+    """
+    root = tmp_path_factory.mktemp("scenarios")
+    (root / "valid.yaml").write_text("model: gpt-4\nprompt: hello\n")
+    (root / "invalid.yaml").write_text("modle: gpt-4\n")
+    (root / "tools").mkdir()
+    (root / "tools" / "search.yaml").write_text(
+        "name: search\ndescription: search the web\n"
+    )
+    (root / "with_include.yaml").write_text(
+        "model: gpt-4\n"
+        "prompt: hello\n"
+        "tools:\n"
+        "  - !include tools/search.yaml\n"
+    )
+    return root
+
+
 class TestValidateScenarioString:
     """Tests for validate_scenario_string function."""
 
@@ -55,6 +79,25 @@ class TestValidateScenarioString:
         assert modle_errors[0].suggestion is not None
         assert "model" in modle_errors[0].suggestion.lower()
 
+    def test_transposed_field_gets_suggestion(self):
+        """Transposed letters in a field name still suggest the right field."""
+        source = "model: gpt-4\npromtp: hello\n"
+        scenario, errors = validate_scenario_string(source)
+        assert scenario is None
+        extra = [e for e in errors if e.field == "promtp"]
+        assert extra[0].suggestion == "Did you mean 'prompt'?"
+
+    def test_nested_unknown_field_has_no_parent_suggestion(self):
+        """An extra key inside a known field is not 'corrected' to the parent."""
+        source = (
+            "model: gpt-4\nprompt: hello\ntools:\n"
+            "  - name: x\n    description: y\n    bogus: 1\n"
+        )
+        scenario, errors = validate_scenario_string(source)
+        assert scenario is None
+        extra = [e for e in errors if e.field == "tools.0.bogus"]
+        assert extra[0].suggestion is None
+
     def test_wrong_type_returns_type_error_with_line(self):
         """Wrong type (threshold: 'high') returns type error with line number."""
         source = "model: gpt-4\nprompt: hello\nthreshold: high\n"
@@ -106,53 +149,127 @@ class TestValidateScenarioString:
         assert threshold_errors[0].line == 3
 
 
+class TestValidateScenarioStringCache:
+    """Tests for memoization of validate_scenario_string."""
+
+    def test_repeated_source_parses_once(self, monkeypatch):
+        """Identical sources are parsed and validated only once."""
+        validator._validate_string_cached.cache_clear()
+        calls = []
+        real_parse = validator.parse_yaml_with_lines
+
+        def counting_parse(source, filename="<string>"):
+            calls.append(source)
+            return real_parse(source, filename=filename)
+
+        monkeypatch.setattr(validator, "parse_yaml_with_lines", counting_parse)
+        source = "model: gpt-4\nprompt: cached\n"
+        first, _ = validate_scenario_string(source)
+        second, _ = validate_scenario_string(source)
+        assert len(calls) == 1
+        assert first == second
+
+    def test_cached_scenario_is_copied_per_call(self):
+        """Mutating a returned scenario does not leak into later calls."""
+        source = "model: gpt-4\nprompt: isolated\n"
+        first, _ = validate_scenario_string(source)
+        first.tags["mutated"] = "yes"
+        second, _ = validate_scenario_string(source)
+        assert second is not first
+        assert second.tags == {}
+
+    def test_cached_errors_are_copied_per_call(self):
+        """Each call gets its own error list."""
+        source = "model: gpt-4\n"
+        _, first = validate_scenario_string(source)
+        first.clear()
+        _, second = validate_scenario_string(source)
+        assert len(second) >= 1
+
+    def test_include_source_is_not_memoized(self, tmp_path, monkeypatch):
+        """!include sources re-read the included file on every call."""
+        monkeypatch.chdir(tmp_path)
+        included = tmp_path / "tool.yaml"
+        included.write_text("name: search\ndescription: first\n")
+        source = "model: gpt-4\nprompt: hi\ntools:\n  - !include tool.yaml\n"
+        first, _ = validate_scenario_string(source)
+        included.write_text("name: search\ndescription: second\n")
+        second, _ = validate_scenario_string(source)
+        assert first.tools[0].description == "first"
+        assert second.tools[0].description == "second"
+
+
+class TestValidateJsonScenario:
+    """Tests for the JSON-syntax fast path."""
+
+    def test_json_scenario_skips_yaml_loader(self, monkeypatch):
+        """A valid JSON object validates without the YAML loader."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML loader should not run")
+
+        monkeypatch.setattr(validator, "parse_yaml_with_lines", fail)
+        source = '{"model": "gpt-4", "prompt": "json fast path"}'
+        scenario, errors = validate_scenario_string(source)
+        assert errors == []
+        assert scenario.prompt == "json fast path"
+
+    def test_invalid_json_scenario_reports_line_numbers(self):
+        """Validation errors in JSON input still carry source positions."""
+        source = (
+            '{\n  "model": "gpt-4",\n  "prompt": "hi",\n'
+            '  "threshold": "high"\n}\n'
+        )
+        scenario, errors = validate_scenario_string(source)
+        assert scenario is None
+        threshold_errors = [e for e in errors if e.field == "threshold"]
+        assert threshold_errors[0].line == 4
+
+    def test_yaml_flow_mapping_falls_back_to_yaml(self):
+        """Flow-style YAML that is not valid JSON still parses."""
+        scenario, errors = validate_scenario_string("{model: gpt-4, prompt: hi}")
+        assert errors == []
+        assert scenario.model == "gpt-4"
+
+
 class TestValidateScenarioFile:
     """Tests for validate_scenario_file function."""
 
-    def test_validate_file_with_valid_scenario(self):
-        """validate_scenario_file with valid temp file returns Scenario and no errors."""
-        with tempfile.NamedTemporaryFile(suffix=".yaml", mode="w", delete=False) as f:
-            f.write("model: gpt-4\nprompt: hello\n")
-            f.flush()
-            scenario, errors = validate_scenario_file(Path(f.name))
+    def test_validate_file_with_valid_scenario(self, scenarios_dir):
+        """validate_scenario_file with a valid file returns Scenario and no errors."""
+        scenario, errors = validate_scenario_file(scenarios_dir / "valid.yaml")
         assert scenario is not None
         assert errors == []
 
-    def test_validate_file_with_invalid_scenario(self):
-        """validate_scenario_file with invalid temp file returns errors."""
-        with tempfile.NamedTemporaryFile(suffix=".yaml", mode="w", delete=False) as f:
-            f.write("modle: gpt-4\n")
-            f.flush()
-            scenario, errors = validate_scenario_file(Path(f.name))
+    def test_validate_file_with_invalid_scenario(self, scenarios_dir):
+        """validate_scenario_file with an invalid file returns errors."""
+        scenario, errors = validate_scenario_file(scenarios_dir / "invalid.yaml")
         assert scenario is None
         assert len(errors) >= 1
 
-    def test_include_tag_resolves_external_file(self):
+    def test_include_tag_resolves_external_file(self, scenarios_dir):
         """!include tag resolves shared tool file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            # Write shared tool file
-            tool_file = tmpdir / "tools" / "search.yaml"
-            tool_file.parent.mkdir(parents=True, exist_ok=True)
-            tool_file.write_text(
-                "name: search\ndescription: search the web\n"
-            )
-
-            # Write scenario that includes the tool
-            scenario_file = tmpdir / "scenario.yaml"
-            scenario_file.write_text(
-                "model: gpt-4\n"
-                "prompt: hello\n"
-                "tools:\n"
-                "  - !include tools/search.yaml\n"
-            )
-
-            scenario, errors = validate_scenario_file(scenario_file)
-            assert scenario is not None
-            assert errors == []
-            assert len(scenario.tools) == 1
-            assert scenario.tools[0].name == "search"
+        scenario, errors = validate_scenario_file(
+            scenarios_dir / "with_include.yaml"
+        )
+        assert scenario is not None
+        assert errors == []
+        assert len(scenario.tools) == 1
+        assert scenario.tools[0].name == "search"
+
+    def test_reads_file_once(self, scenarios_dir, monkeypatch):
+        """The scenario file is read from disk a single time."""
+        scenario_file = scenarios_dir / "valid.yaml"
+        reads = []
+        real_read_text = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            reads.append(self)
+            return real_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        validate_scenario_file(scenario_file)
+        assert reads == [scenario_file]
 
 
 class TestValidateScenarioNormalization:
@@ -264,3 +381,47 @@ class TestValidateScenarioNormalization:
         assert scenario.assertions[0].type == "jmespath"
         assert scenario.assertions[0].operator == "regex"
         assert scenario.assertions[0].value == "hello.*world"
+
+
+class TestValidationErrorDetail:
+    """Tests for the ValidationErrorDetail record."""
+
+    def test_is_immutable(self):
+        """Fields cannot be reassigned after construction."""
+        detail = ValidationErrorDetail(field="model", message="m", type="missing")
+        with pytest.raises(AttributeError):
+            detail.suggestion = "Did you mean 'model'?"
+
+    def test_has_no_instance_dict(self):
+        """Slotted instances carry no per-object __dict__."""
+        detail = ValidationErrorDetail(field="model", message="m", type="missing")
+        assert not hasattr(detail, "__dict__")
+
+
+def test_import_does_not_load_evaluation_stack():
+    """Importing the validator leaves salvo.evaluation unloaded."""
+    code = (
+        "import sys, salvo.loader.validator; "
+        "sys.exit('salvo.evaluation' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+class TestFindLineForField:
+    """Tests for line lookup with prefix fallback."""
+
+    LINE_MAP = {"tools": (3, 1), "tools.0.name": (4, 5)}
+
+    @pytest.mark.parametrize(
+        ("field_path", "expected"),
+        [
+            ("tools.0.name", (4, 5)),
+            ("tools.0.parameters.0.type", (3, 1)),
+            ("tools.1", (3, 1)),
+            ("model", (None, None)),
+            ("", (None, None)),
+        ],
+    )
+    def test_falls_back_to_longest_known_prefix(self, field_path, expected):
+        """The longest dotted prefix present in the map supplies the line."""
+        assert validator._find_line_for_field(field_path, self.LINE_MAP) == expected
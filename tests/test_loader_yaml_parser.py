@@ -2,6 +2,7 @@
 
 import pytest
 
+from salvo.loader import yaml_parser
 from salvo.loader.yaml_parser import YAMLParseError, parse_yaml_with_lines
 
 
@@ -40,6 +41,33 @@ class TestParseYamlWithLines:
         assert "tools.0.name" in line_map
         assert "tools.0.description" in line_map
 
+    def test_line_map_tracks_deeply_nested_paths(self):
+        """Paths compose through mappings, list items, and flow collections."""
+        source = (
+            "a:\n"
+            "  b:\n"
+            "    - c: 1\n"
+            "      d:\n"
+            "        e: 2\n"
+            "z: [1, {q: 2}]\n"
+        )
+        _, line_map = parse_yaml_with_lines(source)
+        assert line_map == {
+            "a": (1, 1),
+            "a.b": (2, 3),
+            "a.b.0.c": (3, 7),
+            "a.b.0.d": (4, 7),
+            "a.b.0.d.e": (5, 9),
+            "z": (6, 1),
+            "z.1.q": (6, 9),
+        }
+
+    def test_repeated_keys_share_one_string(self):
+        """Mapping keys repeated across list items are the same object."""
+        data, _ = parse_yaml_with_lines("tools:\n  - name: a\n  - name: b\n")
+        first, second = (next(iter(tool)) for tool in data["tools"])
+        assert first is second
+
     def test_yaml_syntax_error_raises_yaml_parse_error(self):
         """YAML syntax errors raise YAMLParseError with line/column info."""
         source = "model: gpt-4\nprompt: [invalid\n"
@@ -63,6 +91,23 @@ class TestParseYamlWithLines:
         assert data is None
         assert line_map == {}
 
+    @pytest.mark.parametrize(
+        "source",
+        ["   \n\t\n", "  # indented comment\r\n\n# last line without newline"],
+    )
+    def test_blank_or_comment_only_skips_parser(self, source, monkeypatch):
+        """Blank/comment-only sources return early without building a loader."""
+        def fail(*args, **kwargs):
+            raise AssertionError("loader should not be constructed")
+
+        monkeypatch.setattr(yaml_parser, "LineTrackingLoader", fail)
+        assert parse_yaml_with_lines(source) == (None, {})
+
+    def test_comment_after_content_still_parses(self):
+        """A trailing comment does not trigger the blank/comment fast path."""
+        data, _ = parse_yaml_with_lines("# header\nmodel: gpt-4  # inline\n")
+        assert data == {"model": "gpt-4"}
+
     def test_yaml_parse_error_has_filename(self):
         """YAMLParseError includes filename when provided."""
         source = "model: gpt-4\nprompt: [invalid\n"
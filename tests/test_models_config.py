@@ -1,6 +1,7 @@
 """Tests for salvo.models.config - ProjectConfig, find_project_root, load_project_config."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError
@@ -115,6 +116,38 @@ class TestFindProjectRoot:
         result = find_project_root(file_path)
         assert result == tmp_path.resolve()
 
+    def test_nearer_marker_created_later_is_found(self, tmp_path: Path):
+        """A marker added below a previously found root takes over."""
+        from salvo.models.config import find_project_root
+
+        (tmp_path / "salvo.yaml").write_text("default_model: gpt-4o\n")
+        child = tmp_path / "scenarios"
+        child.mkdir()
+        assert find_project_root(child) == tmp_path.resolve()
+        (child / ".salvo").mkdir()
+        assert find_project_root(child) == child.resolve()
+
+    def test_symlinked_start_returns_resolved_root(self, tmp_path: Path):
+        """A start path reached through a symlink yields the real root."""
+        from salvo.models.config import find_project_root
+
+        project = tmp_path / "project"
+        (project / "scenarios").mkdir(parents=True)
+        (project / "salvo.yaml").write_text("default_model: gpt-4o\n")
+        link = tmp_path / "link"
+        link.symlink_to(project, target_is_directory=True)
+        assert find_project_root(link / "scenarios") == project.resolve()
+
+    def test_miss_is_not_memoized(self, tmp_path: Path):
+        """A marker created after a failed lookup is found next time."""
+        from salvo.models.config import find_project_root
+
+        child = tmp_path / "sub"
+        child.mkdir()
+        assert find_project_root(child) == Path.cwd()
+        (tmp_path / ".salvo").mkdir()
+        assert find_project_root(child) == tmp_path.resolve()
+
 
 class TestLoadProjectConfig:
     """Test load_project_config function."""
@@ -161,6 +194,41 @@ class TestLoadProjectConfig:
         assert isinstance(config, ProjectConfig)
         assert config.default_adapter == "openai"
 
+    def test_unchanged_file_is_not_reparsed(self, tmp_path: Path):
+        """A second load of an unchanged salvo.yaml skips reading it."""
+        from salvo.models.config import load_project_config
+
+        (tmp_path / "salvo.yaml").write_text("default_model: gpt-4o-mini\n")
+        load_project_config(tmp_path)
+        with patch.object(Path, "read_text", side_effect=AssertionError("read")):
+            config = load_project_config(tmp_path)
+        assert config.default_model == "gpt-4o-mini"
+
+    def test_edited_file_is_reloaded(self, tmp_path: Path):
+        """Changing salvo.yaml invalidates the cached config."""
+        import os
+
+        from salvo.models.config import load_project_config
+
+        config_file = tmp_path / "salvo.yaml"
+        config_file.write_text("default_model: gpt-4o-mini\n")
+        load_project_config(tmp_path)
+        config_file.write_text("default_model: gpt-4.1\n")
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert load_project_config(tmp_path).default_model == "gpt-4.1"
+
+    def test_cached_config_is_copied_per_call(self, tmp_path: Path):
+        """Mutating a loaded config does not affect later loads."""
+        from salvo.models.config import load_project_config
+
+        (tmp_path / "salvo.yaml").write_text("default_model: gpt-4o-mini\n")
+        first = load_project_config(tmp_path)
+        first.judge.k = 7
+        second = load_project_config(tmp_path)
+        assert second is not first
+        assert second.judge.k != 7
+
 
 class TestRunStoreWithStorageDir:
     """Test RunStore with custom storage_dir."""
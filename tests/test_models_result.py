@@ -3,7 +3,13 @@
 from datetime import datetime, timezone
 
 import pytest
-from pydantic import ValidationError
+from pydantic_core import to_json
+
+from salvo.models import (
+    EvalResult,
+    RunMetadata,
+    RunResult,
+)
 
 
 class TestRunMetadata:
@@ -11,8 +17,6 @@ class TestRunMetadata:
 
     def test_run_metadata_creation(self):
         """RunMetadata with all fields."""
-        from salvo.models import RunMetadata
-
         data = {
             "scenario_name": "fix-tests",
             "scenario_file": "scenarios/fix-tests.yaml",
@@ -35,8 +39,6 @@ class TestRunMetadata:
 
     def test_optional_fields_default_none(self):
         """cost_usd and latency_seconds default to None."""
-        from salvo.models import RunMetadata
-
         data = {
             "scenario_name": "fix-tests",
             "scenario_file": "scenarios/fix-tests.yaml",
@@ -58,8 +60,6 @@ class TestEvalResult:
 
     def test_eval_result_creation(self):
         """EvalResult with all fields."""
-        from salvo.models import EvalResult
-
         data = {
             "assertion_type": "tool_call",
             "score": 1.0,
@@ -77,85 +77,110 @@ class TestEvalResult:
         assert result.details == "Tool file_read was called correctly"
 
 
-class TestRunResult:
-    """Test RunResult model."""
+@pytest.fixture(scope="module")
+def run_result_data():
+    """Valid RunResult input, shared read-only across the module.
 
-    def _make_run_result_data(self):
-        """Helper to create valid RunResult data."""
-        return {
-            "run_id": "run-001",
-            "metadata": {
-                "scenario_name": "fix-tests",
-                "scenario_file": "scenarios/fix-tests.yaml",
-                "scenario_hash": "abc123",
-                "timestamp": "2026-02-17T18:00:00Z",
-                "model": "gpt-4o",
-                "adapter": "openai",
-                "salvo_version": "0.1.0",
-                "passed": True,
-                "score": 0.9,
-            },
-            "eval_results": [
-                {
-                    "assertion_type": "tool_call",
-                    "score": 1.0,
-                    "passed": True,
-                    "weight": 1.0,
-                    "required": False,
-                }
-            ],
+    Nested models are pre-built so validation takes the instance fast
+    path instead of re-validating nested dicts in every test.
+    """
+    metadata = RunMetadata.model_validate(
+        {
+            "scenario_name": "fix-tests",
+            "scenario_file": "scenarios/fix-tests.yaml",
+            "scenario_hash": "abc123",
+            "timestamp": "2026-02-17T18:00:00Z",
+            "model": "gpt-4o",
+            "adapter": "openai",
+            "salvo_version": "0.1.0",
+            "passed": True,
             "score": 0.9,
+        }
+    )
+    eval_result = EvalResult.model_validate(
+        {
+            "assertion_type": "tool_call",
+            "score": 1.0,
             "passed": True,
+            "weight": 1.0,
+            "required": False,
         }
+    )
+    return {
+        "run_id": "run-001",
+        "metadata": metadata,
+        "eval_results": [eval_result],
+        "score": 0.9,
+        "passed": True,
+    }
 
-    def test_run_result_creation(self):
-        """RunResult with run_id, metadata, eval_results, score, passed."""
-        from salvo.models import RunResult
 
-        data = self._make_run_result_data()
-        result = RunResult.model_validate(data)
+@pytest.fixture
+def run_result(run_result_data):
+    """RunResult validated from run_result_data."""
+    return RunResult.model_validate(run_result_data)
+
+
+class TestRunResult:
+    """Test RunResult model."""
+
+    def _make_run_result_obj(self):
+        """Helper to build a trusted RunResult without running validation."""
+        metadata = RunMetadata.model_construct(
+            scenario_name="fix-tests",
+            scenario_file="scenarios/fix-tests.yaml",
+            scenario_hash="abc123",
+            timestamp=datetime(2026, 2, 17, 18, 0, tzinfo=timezone.utc),
+            model="gpt-4o",
+            adapter="openai",
+            salvo_version="0.1.0",
+            passed=True,
+            score=0.9,
+        )
+        eval_result = EvalResult.model_construct(
+            assertion_type="tool_call",
+            score=1.0,
+            passed=True,
+            weight=1.0,
+            required=False,
+        )
+        return RunResult.model_construct(
+            run_id="run-001",
+            metadata=metadata,
+            eval_results=[eval_result],
+            score=0.9,
+            passed=True,
+        )
+
+    def test_run_result_creation(self, run_result_data):
+        """RunResult with run_id, metadata, eval_results, score, passed."""
+        result = RunResult.model_validate(run_result_data)
         assert result.run_id == "run-001"
         assert result.passed is True
         assert result.score == 0.9
         assert len(result.eval_results) == 1
 
-    def test_run_result_json_round_trip(self):
+    def test_run_result_json_round_trip(self, run_result):
         """RunResult survives JSON serialization round-trip."""
-        from salvo.models import RunResult
-
-        data = self._make_run_result_data()
-        original = RunResult.model_validate(data)
-        json_str = original.model_dump_json()
-        restored = RunResult.model_validate_json(json_str)
-        assert restored.run_id == original.run_id
-        assert restored.score == original.score
-        assert restored.passed == original.passed
-        assert len(restored.eval_results) == len(original.eval_results)
-        assert restored.metadata.scenario_name == original.metadata.scenario_name
+        original = run_result
+        restored = RunResult.model_validate_json(to_json(original))
+        assert restored.model_dump() == original.model_dump()
 
     def test_run_result_model_dump_json_mode(self):
         """model_dump(mode='json') serializes datetime correctly."""
-        from salvo.models import RunResult
-
-        data = self._make_run_result_data()
-        result = RunResult.model_validate(data)
-        dumped = result.model_dump(mode="json")
+        result = self._make_run_result_obj()
+        dumped_meta = result.metadata.model_dump(mode="json")
         # timestamp should be a string in JSON mode
-        assert isinstance(dumped["metadata"]["timestamp"], str)
+        assert isinstance(dumped_meta["timestamp"], str)
 
     def test_trace_id_defaults_to_none(self):
         """trace_id is optional and defaults to None."""
-        from salvo.models import RunResult
-
-        data = self._make_run_result_data()
-        result = RunResult.model_validate(data)
+        result = self._make_run_result_obj()
         assert result.trace_id is None
 
-    def test_trace_id_can_be_set(self):
+    def test_trace_id_can_be_set(self, run_result_data):
         """trace_id can be explicitly provided."""
-        from salvo.models import RunResult
-
-        data = self._make_run_result_data()
-        data["trace_id"] = "trace-abc-123"
-        result = RunResult.model_validate(data)
+        result = RunResult.model_validate(
+            {**run_result_data, "trace_id": "trace-abc-123"}
+        )
         assert result.trace_id == "trace-abc-123"
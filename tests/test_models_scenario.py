@@ -1,16 +1,33 @@
 """Tests for salvo.models.scenario - Scenario, ToolDef, ToolParameter, Assertion."""
 
+import re
+import subprocess
+import sys
+from types import MappingProxyType
+
 import pytest
 from pydantic import ValidationError
 
+from salvo.models import (
+    Assertion,
+    ProjectConfig,
+    Scenario,
+    ToolDef,
+    ToolParameter,
+)
+
+_EXTRA_FORBIDDEN = re.compile("extra_forbidden")
+_SCENARIO_MIN_BASE = MappingProxyType({"model": "gpt-4o", "prompt": "test"})
+_SCENARIO_VALID_TEMPLATE = MappingProxyType(
+    {"model": "gpt-4o", "prompt": "test", "tools": [], "assertions": []}
+)
+
 
 class TestScenarioCreation:
     """Test Scenario model creation and validation."""
 
     def test_valid_scenario_from_dict(self):
         """A valid scenario dict creates a Scenario instance."""
-        from salvo.models import Scenario
-
         data = {
             "adapter": "openai",
             "model": "gpt-4o",
@@ -42,80 +59,40 @@ class TestScenarioCreation:
 
     def test_extra_fields_rejected(self):
         """Unknown keys are rejected with extra='forbid'."""
-        from salvo.models import Scenario
-
-        data = {
-            "modle": "gpt-4o",
-            "model": "gpt-4o",
-            "prompt": "test",
-            "tools": [],
-            "assertions": [],
-        }
-        with pytest.raises(ValidationError, match="extra_forbidden"):
+        data = {**_SCENARIO_VALID_TEMPLATE, "modle": "gpt-4o"}
+        with pytest.raises(ValidationError, match=_EXTRA_FORBIDDEN):
             Scenario.model_validate(data)
 
     def test_threshold_below_zero_rejected(self):
         """Threshold must be >= 0.0."""
-        from salvo.models import Scenario
-
-        data = {
-            "model": "gpt-4o",
-            "prompt": "test",
-            "tools": [],
-            "assertions": [],
-            "threshold": -0.1,
-        }
+        data = {**_SCENARIO_VALID_TEMPLATE, "threshold": -0.1}
         with pytest.raises(ValidationError):
             Scenario.model_validate(data)
 
     def test_threshold_above_one_rejected(self):
         """Threshold must be <= 1.0."""
-        from salvo.models import Scenario
-
-        data = {
-            "model": "gpt-4o",
-            "prompt": "test",
-            "tools": [],
-            "assertions": [],
-            "threshold": 1.5,
-        }
+        data = {**_SCENARIO_VALID_TEMPLATE, "threshold": 1.5}
         with pytest.raises(ValidationError):
             Scenario.model_validate(data)
 
     def test_model_required(self):
         """model is a required field."""
-        from salvo.models import Scenario
-
-        data = {
-            "prompt": "test",
-            "tools": [],
-            "assertions": [],
-        }
+        data = {k: v for k, v in _SCENARIO_VALID_TEMPLATE.items() if k != "model"}
         with pytest.raises(ValidationError):
             Scenario.model_validate(data)
 
     def test_prompt_required(self):
         """prompt is a required field."""
-        from salvo.models import Scenario
-
-        data = {
-            "model": "gpt-4o",
-            "tools": [],
-            "assertions": [],
-        }
+        data = {k: v for k, v in _SCENARIO_VALID_TEMPLATE.items() if k != "prompt"}
         with pytest.raises(ValidationError):
             Scenario.model_validate(data)
 
     def test_system_prompt_and_prompt_both_populated(self):
         """Both system_prompt and prompt can be populated (SCEN-03)."""
-        from salvo.models import Scenario
-
         data = {
-            "model": "gpt-4o",
+            **_SCENARIO_VALID_TEMPLATE,
             "system_prompt": "You are a code reviewer.",
             "prompt": "Review this file",
-            "tools": [],
-            "assertions": [],
         }
         scenario = Scenario.model_validate(data)
         assert scenario.system_prompt == "You are a code reviewer."
@@ -123,15 +100,7 @@ class TestScenarioCreation:
 
     def test_empty_tools_and_assertions_valid(self):
         """Scenario with empty tools and assertions lists is valid."""
-        from salvo.models import Scenario
-
-        data = {
-            "model": "gpt-4o",
-            "prompt": "test",
-            "tools": [],
-            "assertions": [],
-        }
-        scenario = Scenario.model_validate(data)
+        scenario = Scenario.model_validate(_SCENARIO_VALID_TEMPLATE)
         assert scenario.tools == []
         assert scenario.assertions == []
 
@@ -141,8 +110,6 @@ class TestToolDef:
 
     def test_tooldef_creation(self):
         """ToolDef with name, description, parameters, mock_response."""
-        from salvo.models import ToolDef
-
         data = {
             "name": "file_read",
             "description": "Read a file from disk",
@@ -160,8 +127,6 @@ class TestToolDef:
 
     def test_tooldef_rejects_unknown_keys(self):
         """ToolDef rejects unknown keys."""
-        from salvo.models import ToolDef
-
         data = {
             "name": "file_read",
             "description": "Read a file",
@@ -172,7 +137,7 @@ class TestToolDef:
             },
             "unknown_field": True,
         }
-        with pytest.raises(ValidationError, match="extra_forbidden"):
+        with pytest.raises(ValidationError, match=_EXTRA_FORBIDDEN):
             ToolDef.model_validate(data)
 
 
@@ -181,8 +146,6 @@ class TestToolParameter:
 
     def test_tool_parameter_with_properties_and_required(self):
         """ToolParameter validates type='object' with properties and required."""
-        from salvo.models import ToolParameter
-
         data = {
             "type": "object",
             "properties": {
@@ -202,8 +165,6 @@ class TestAssertion:
 
     def test_assertion_all_fields(self):
         """Assertion creation with all supported fields."""
-        from salvo.models import Assertion
-
         data = {
             "type": "tool_call",
             "weight": 2.0,
@@ -228,8 +189,6 @@ class TestAssertion:
 
     def test_assertion_defaults(self):
         """Assertion defaults: weight=1.0, required=False."""
-        from salvo.models import Assertion
-
         data = {"type": "tool_call"}
         assertion = Assertion.model_validate(data)
         assert assertion.weight == 1.0
@@ -237,16 +196,12 @@ class TestAssertion:
 
     def test_assertion_rejects_unknown_keys(self):
         """Assertion rejects unknown keys."""
-        from salvo.models import Assertion
-
         data = {"type": "tool_call", "unknown_field": True}
-        with pytest.raises(ValidationError, match="extra_forbidden"):
+        with pytest.raises(ValidationError, match=_EXTRA_FORBIDDEN):
             Assertion.model_validate(data)
 
     def test_assertion_canonical_jmespath_form(self):
         """Assertion accepts canonical jmespath form from normalizer."""
-        from salvo.models import Assertion
-
         data = {
             "type": "jmespath",
             "expression": "response.content",
@@ -261,8 +216,6 @@ class TestAssertion:
 
     def test_assertion_cost_limit_form(self):
         """Assertion accepts cost_limit form with max_usd."""
-        from salvo.models import Assertion
-
         data = {"type": "cost_limit", "max_usd": 0.05}
         assertion = Assertion.model_validate(data)
         assert assertion.type == "cost_limit"
@@ -270,8 +223,6 @@ class TestAssertion:
 
     def test_assertion_latency_limit_form(self):
         """Assertion accepts latency_limit form with max_seconds."""
-        from salvo.models import Assertion
-
         data = {"type": "latency_limit", "max_seconds": 10.0}
         assertion = Assertion.model_validate(data)
         assert assertion.type == "latency_limit"
@@ -279,10 +230,8 @@ class TestAssertion:
 
     def test_assertion_still_rejects_unknown_fields_with_new_fields(self):
         """Assertion extra='forbid' still blocks truly unknown fields."""
-        from salvo.models import Assertion
-
         data = {"type": "jmespath", "bogus_field": True}
-        with pytest.raises(ValidationError, match="extra_forbidden"):
+        with pytest.raises(ValidationError, match=_EXTRA_FORBIDDEN):
             Assertion.model_validate(data)
 
 
@@ -291,94 +240,40 @@ class TestScenarioPhase2Fields:
 
     def _minimal(self, **overrides) -> dict:
         """Return minimal valid scenario dict with overrides applied."""
-        base = {"model": "gpt-4o", "prompt": "test"}
-        base.update(overrides)
-        return base
-
-    def test_scenario_default_max_turns(self):
-        """max_turns defaults to 10."""
-        from salvo.models import Scenario
+        return {**_SCENARIO_MIN_BASE, **overrides}
 
+    def test_scenario_phase2_defaults(self):
+        """max_turns defaults to 10; temperature and seed to None; extras to {}."""
         scenario = Scenario.model_validate(self._minimal())
         assert scenario.max_turns == 10
-
-    def test_scenario_custom_max_turns(self):
-        """max_turns can be set to a custom value."""
-        from salvo.models import Scenario
-
-        scenario = Scenario.model_validate(self._minimal(max_turns=25))
-        assert scenario.max_turns == 25
-
-    def test_scenario_max_turns_validation_ge_1(self):
-        """max_turns rejects values less than 1."""
-        from salvo.models import Scenario
-
-        with pytest.raises(ValidationError):
-            Scenario.model_validate(self._minimal(max_turns=0))
-
-    def test_scenario_max_turns_validation_le_100(self):
-        """max_turns rejects values greater than 100."""
-        from salvo.models import Scenario
-
-        with pytest.raises(ValidationError):
-            Scenario.model_validate(self._minimal(max_turns=101))
-
-    def test_scenario_max_turns_boundary_values(self):
-        """max_turns accepts boundary values 1 and 100."""
-        from salvo.models import Scenario
-
-        s1 = Scenario.model_validate(self._minimal(max_turns=1))
-        assert s1.max_turns == 1
-        s100 = Scenario.model_validate(self._minimal(max_turns=100))
-        assert s100.max_turns == 100
-
-    def test_scenario_temperature_optional(self):
-        """temperature defaults to None."""
-        from salvo.models import Scenario
-
-        scenario = Scenario.model_validate(self._minimal())
         assert scenario.temperature is None
-
-    def test_scenario_temperature_set(self):
-        """temperature can be set to a float value."""
-        from salvo.models import Scenario
-
-        scenario = Scenario.model_validate(self._minimal(temperature=0.7))
-        assert scenario.temperature == 0.7
-
-    def test_scenario_seed_optional(self):
-        """seed defaults to None."""
-        from salvo.models import Scenario
-
-        scenario = Scenario.model_validate(self._minimal())
         assert scenario.seed is None
-
-    def test_scenario_seed_set(self):
-        """seed can be set to an integer value."""
-        from salvo.models import Scenario
-
-        scenario = Scenario.model_validate(self._minimal(seed=42))
-        assert scenario.seed == 42
-
-    def test_scenario_extras_default_empty(self):
-        """extras defaults to an empty dict."""
-        from salvo.models import Scenario
-
-        scenario = Scenario.model_validate(self._minimal())
         assert scenario.extras == {}
 
-    def test_scenario_extras_accepts_dict(self):
-        """extras accepts a dictionary of provider-specific options."""
-        from salvo.models import Scenario
+    @pytest.mark.parametrize("max_turns", [1, 25, 100])
+    def test_scenario_max_turns_accepted(self, max_turns):
+        """max_turns accepts custom values, including the bounds 1 and 100."""
+        scenario = Scenario.model_validate(self._minimal(max_turns=max_turns))
+        assert scenario.max_turns == max_turns
 
+    @pytest.mark.parametrize("max_turns", [0, 101])
+    def test_scenario_max_turns_out_of_range(self, max_turns):
+        """max_turns rejects values below 1 or above 100."""
+        with pytest.raises(ValidationError):
+            Scenario.model_validate(self._minimal(max_turns=max_turns))
+
+    def test_scenario_phase2_custom(self):
+        """temperature, seed and provider extras accept explicit values."""
         extras = {"top_p": 0.9, "presence_penalty": 0.5}
-        scenario = Scenario.model_validate(self._minimal(extras=extras))
+        scenario = Scenario.model_validate(
+            self._minimal(temperature=0.7, seed=42, extras=extras)
+        )
+        assert scenario.temperature == 0.7
+        assert scenario.seed == 42
         assert scenario.extras == {"top_p": 0.9, "presence_penalty": 0.5}
 
     def test_scenario_round_trip_with_new_fields(self):
-        """JSON serialize/deserialize preserves all Phase 2 fields."""
-        from salvo.models import Scenario
-
+        """Snapshot dump/validate (as recorded traces do) preserves Phase 2 fields."""
         data = self._minimal(
             max_turns=50,
             temperature=0.3,
@@ -386,12 +281,81 @@ class TestScenarioPhase2Fields:
             extras={"top_k": 40},
         )
         scenario = Scenario.model_validate(data)
-        json_str = scenario.model_dump_json()
-        restored = Scenario.model_validate_json(json_str)
+        restored = Scenario.model_validate(scenario.model_dump(mode="json"))
 
+        assert restored.model_dump() == scenario.model_dump()
         assert restored.max_turns == 50
-        assert restored.temperature == 0.3
-        assert restored.seed == 123
         assert restored.extras == {"top_k": 40}
-        assert restored.model == "gpt-4o"
-        assert restored.prompt == "test"
+
+
+class TestScenarioJsonBytes:
+    """Test the cached Scenario.json_bytes serialization."""
+
+    def test_json_bytes_matches_model_dump_json(self):
+        """json_bytes is the UTF-8 encoding of model_dump_json()."""
+        scenario = Scenario(model="gpt-4o", prompt="héllo")
+        assert scenario.json_bytes == scenario.model_dump_json().encode()
+        assert scenario.json_bytes is scenario.json_bytes
+
+    def test_json_bytes_not_in_dump(self):
+        """The cached value never leaks into serialized output."""
+        scenario = Scenario(model="gpt-4o", prompt="test")
+        _ = scenario.json_bytes
+        assert "json_bytes" not in scenario.model_dump()
+
+    def test_json_bytes_invalidated_on_assignment(self):
+        """Assigning a field drops the cached serialization."""
+        scenario = Scenario(model="gpt-4o", prompt="before")
+        _ = scenario.json_bytes
+        scenario.prompt = "after"
+        assert b'"prompt":"after"' in scenario.json_bytes
+
+    def test_json_bytes_invalidated_on_model_copy(self):
+        """model_copy(update=...) does not carry over a stale cache."""
+        scenario = Scenario(model="gpt-4o", prompt="test")
+        _ = scenario.json_bytes
+        copied = scenario.model_copy(update={"model": "gpt-4o-mini"})
+        assert copied.json_bytes == copied.model_dump_json().encode()
+
+
+class TestInternedNames:
+    """Test that adapter/model names share one string object."""
+
+    def test_scenario_model_and_adapter_are_interned(self):
+        """Equal names from separate inputs are the same object."""
+        name = "".join(["gpt-", "4o"])
+        first = Scenario(model=name, adapter="".join(["open", "ai"]), prompt="a")
+        second = Scenario(model="gpt-4o", adapter="openai", prompt="b")
+        assert first.model is second.model
+        assert first.adapter is second.adapter
+
+    def test_assertion_operator_is_interned(self):
+        """Assertion operators share one string object; mode is a Literal."""
+        first = Assertion(
+            type="jmespath",
+            mode="".join(["ex", "act"]),
+            operator="".join(["con", "tains"]),
+        )
+        second = Assertion(type="jmespath", mode="exact", operator="contains")
+        assert first.operator is second.operator
+        assert first.mode is second.mode
+
+    def test_project_config_names_are_interned(self):
+        """ProjectConfig adapter and model names are interned too."""
+        config = ProjectConfig.model_validate(
+            {
+                "default_model": "".join(["gpt-", "4o-mini"]),
+                "judge": {"adapter": "".join(["anth", "ropic"])},
+            }
+        )
+        assert config.default_model is sys.intern("gpt-4o-mini")
+        assert config.judge.adapter is sys.intern("anthropic")
+
+
+def test_models_defer_schema_build_until_first_use():
+    """Importing salvo.models builds no validators up front."""
+    code = (
+        "import sys; from salvo.models import RunResult, Scenario; "
+        "sys.exit(RunResult.__pydantic_complete__ or Scenario.__pydantic_complete__)"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import re
 from io import StringIO
 
 import pytest
@@ -27,6 +29,70 @@ from salvo.models.trial import (
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
+def _default_trials(
+    passed: int,
+    failed: int,
+    hard_fail: int,
+    infra_error: int,
+    score: float,
+) -> tuple[TrialResult, ...]:
+    """Build the default trial list for a given status mix.
+
+    Cached because many tests ask for the same mix; the renderers never
+    mutate trials, so the instances are shared between suites. The values
+    are already well-typed, so validation is skipped via model_construct.
+    """
+    trials = [
+        TrialResult.model_construct(
+            trial_number=i + 1,
+            status=TrialStatus.passed,
+            score=score,
+            passed=True,
+            latency_seconds=1.5,
+            cost_usd=0.01,
+        )
+        for i in range(passed)
+    ]
+    # Add failed trials
+    for i in range(failed):
+        trials.append(
+            TrialResult.model_construct(
+                trial_number=passed + i + 1,
+                status=TrialStatus.failed,
+                score=0.0,
+                passed=False,
+                latency_seconds=1.5,
+                cost_usd=0.01,
+            )
+        )
+    # Add hard fail trials
+    for i in range(hard_fail):
+        trials.append(
+            TrialResult.model_construct(
+                trial_number=passed + failed + i + 1,
+                status=TrialStatus.hard_fail,
+                score=0.0,
+                passed=False,
+                latency_seconds=1.5,
+                cost_usd=0.01,
+            )
+        )
+    # Add infra error trials
+    for i in range(infra_error):
+        trials.append(
+            TrialResult.model_construct(
+                trial_number=passed + failed + hard_fail + i + 1,
+                status=TrialStatus.infra_error,
+                score=0.0,
+                passed=False,
+                latency_seconds=0.5,
+                error_message="Connection refused",
+            )
+        )
+    return tuple(trials)
+
+
 def _make_suite(
     verdict: Verdict = Verdict.PASS,
     trials_total: int = 3,
@@ -52,57 +118,23 @@ def _make_suite(
     assertion_failures: list[dict] | None = None,
     trials: list[TrialResult] | None = None,
 ) -> TrialSuiteResult:
-    """Create a TrialSuiteResult with sensible defaults for testing."""
+    """Create a TrialSuiteResult with sensible defaults for testing.
+
+    Uses model_construct: every argument is already type-correct, so
+    running the validators again would only add cost.
+    """
     if trials is None:
-        trials = [
-            TrialResult(
-                trial_number=i + 1,
-                status=TrialStatus.passed,
-                score=score_avg,
-                passed=True,
-                latency_seconds=1.5,
-                cost_usd=0.01,
-            )
-            for i in range(trials_passed)
-        ]
-        # Add failed trials
-        for i in range(trials_failed):
-            trials.append(
-                TrialResult(
-                    trial_number=trials_passed + i + 1,
-                    status=TrialStatus.failed,
-                    score=0.0,
-                    passed=False,
-                    latency_seconds=1.5,
-                    cost_usd=0.01,
-                )
-            )
-        # Add hard fail trials
-        for i in range(trials_hard_fail):
-            trials.append(
-                TrialResult(
-                    trial_number=trials_passed + trials_failed + i + 1,
-                    status=TrialStatus.hard_fail,
-                    score=0.0,
-                    passed=False,
-                    latency_seconds=1.5,
-                    cost_usd=0.01,
-                )
-            )
-        # Add infra error trials
-        for i in range(trials_infra_error):
-            trials.append(
-                TrialResult(
-                    trial_number=trials_passed + trials_failed + trials_hard_fail + i + 1,
-                    status=TrialStatus.infra_error,
-                    score=0.0,
-                    passed=False,
-                    latency_seconds=0.5,
-                    error_message="Connection refused",
-                )
+        trials = list(
+            _default_trials(
+                trials_passed,
+                trials_failed,
+                trials_hard_fail,
+                trials_infra_error,
+                score_avg,
             )
+        )
 
-    return TrialSuiteResult(
+    return TrialSuiteResult.model_construct(
         run_id="test-run-001",
         scenario_name="test-scenario",
         scenario_file="test.yaml",
@@ -134,13 +166,61 @@ def _make_suite(
     )
 
 
-def _capture_console() -> tuple[Console, StringIO]:
-    """Create a Console that captures output to a StringIO buffer."""
+@functools.lru_cache(maxsize=None)
+def _needles_pattern(needles: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile an alternation over needles, longest first."""
+    ordered = sorted(needles, key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, ordered)))
+
+
+def _assert_all_in(output: str, *needles: str) -> None:
+    """Assert every needle occurs in output, scanning it once.
+
+    Needles must not overlap each other inside output, since a match
+    consumes the text it covers.
+    """
+    found = set(_needles_pattern(needles).findall(output))
+    missing = [n for n in needles if n not in found]
+    assert not missing, f"missing {missing!r} in output:\n{output}"
+
+
+@pytest.fixture(scope="session")
+def base_suite() -> TrialSuiteResult:
+    """Default 3/3 PASS suite, shared read-only across tests.
+
+    Variants that only change scalar fields derive from it with
+    ``model_copy(update=...)`` instead of rebuilding every model.
+    """
+    return _make_suite()
+
+
+@pytest.fixture(scope="module")
+def _module_console() -> tuple[Console, StringIO]:
+    """One non-terminal Console per module, so Rich's setup runs once."""
     buf = StringIO()
-    console = Console(file=buf, force_terminal=False, width=120)
+    console = Console(file=buf, force_terminal=False, no_color=True, width=120)
     return console, buf
 
 
+@pytest.fixture
+def console_buf(_module_console) -> tuple[Console, StringIO]:
+    """Yield the shared Console and its buffer, emptied after each test."""
+    console, buf = _module_console
+    yield console, buf
+    buf.seek(0)
+    buf.truncate(0)
+
+
+# Score fields for suites where no trial scored.
+_ZERO_SCORES = {
+    "pass_rate": 0.0,
+    "score_avg": 0.0,
+    "score_min": 0.0,
+    "score_p50": 0.0,
+    "score_p95": 0.0,
+}
+
+
 # ---------------------------------------------------------------------------
 # Tests: render_headline
 # ---------------------------------------------------------------------------
@@ -149,92 +229,72 @@ def _capture_console() -> tuple[Console, StringIO]:
 class TestRenderHeadline:
     """Test headline table rendering for each verdict type."""
 
-    def test_pass_verdict(self):
-        """PASS verdict shows check mark and green styling reference."""
-        suite = _make_suite(verdict=Verdict.PASS)
-        console, buf = _capture_console()
-        render_headline(suite, console)
-        output = buf.getvalue()
-        assert "\u2713 PASS" in output
-        assert "3/3 passed" in output
-
-    def test_fail_verdict(self):
-        """FAIL verdict shows X mark."""
-        suite = _make_suite(
-            verdict=Verdict.FAIL,
-            trials_passed=0,
-            trials_failed=3,
-            pass_rate=0.0,
-            score_avg=0.0,
-            score_min=0.0,
-            score_p50=0.0,
-            score_p95=0.0,
-        )
-        console, buf = _capture_console()
-        render_headline(suite, console)
-        output = buf.getvalue()
-        assert "\u2717 FAIL" in output
-        assert "0/3 passed" in output
-
-    def test_hard_fail_verdict(self):
-        """HARD FAIL verdict shows exclamation mark."""
-        suite = _make_suite(
-            verdict=Verdict.HARD_FAIL,
-            trials_passed=0,
-            trials_failed=0,
-            trials_hard_fail=3,
-            pass_rate=0.0,
-            score_avg=0.0,
-            score_min=0.0,
-            score_p50=0.0,
-            score_p95=0.0,
-        )
-        console, buf = _capture_console()
-        render_headline(suite, console)
-        output = buf.getvalue()
-        assert "! HARD FAIL" in output
-        assert "hard fail" in output
-
-    def test_partial_verdict(self):
-        """PARTIAL verdict shows tilde."""
-        suite = _make_suite(
-            verdict=Verdict.PARTIAL,
-            trials_passed=1,
-            trials_failed=2,
-            pass_rate=0.33,
-            score_avg=0.5,
-            score_min=0.0,
-            score_p50=0.5,
-            score_p95=0.8,
-        )
-        console, buf = _capture_console()
-        render_headline(suite, console)
-        output = buf.getvalue()
-        assert "~ PARTIAL" in output
-        assert "1/3 passed" in output
-
-    def test_infra_error_verdict(self):
-        """INFRA_ERROR verdict shows exclamation and infra count."""
-        suite = _make_suite(
-            verdict=Verdict.INFRA_ERROR,
-            trials_passed=0,
-            trials_failed=0,
-            trials_infra_error=3,
-            pass_rate=0.0,
-            score_avg=0.0,
-            score_min=0.0,
-            score_p50=0.0,
-            score_p95=0.0,
-            latency_p50=0.5,
-            latency_p95=0.5,
-        )
-        console, buf = _capture_console()
+    @pytest.mark.parametrize(
+        ("overrides", "symbol", "summary"),
+        [
+            pytest.param({}, "\u2713 PASS", "3/3 passed", id="pass"),
+            pytest.param(
+                {
+                    **_ZERO_SCORES,
+                    "verdict": Verdict.FAIL,
+                    "trials_passed": 0,
+                    "trials_failed": 3,
+                },
+                "\u2717 FAIL",
+                "0/3 passed",
+                id="fail",
+            ),
+            pytest.param(
+                {
+                    **_ZERO_SCORES,
+                    "verdict": Verdict.HARD_FAIL,
+                    "trials_passed": 0,
+                    "trials_hard_fail": 3,
+                },
+                "! HARD FAIL",
+                "hard fail",
+                id="hard-fail",
+            ),
+            pytest.param(
+                {
+                    "verdict": Verdict.PARTIAL,
+                    "trials_passed": 1,
+                    "trials_failed": 2,
+                    "pass_rate": 0.33,
+                    "score_avg": 0.5,
+                    "score_min": 0.0,
+                    "score_p50": 0.5,
+                    "score_p95": 0.8,
+                },
+                "~ PARTIAL",
+                "1/3 passed",
+                id="partial",
+            ),
+            pytest.param(
+                {
+                    **_ZERO_SCORES,
+                    "verdict": Verdict.INFRA_ERROR,
+                    "trials_passed": 0,
+                    "trials_infra_error": 3,
+                    "latency_p50": 0.5,
+                    "latency_p95": 0.5,
+                },
+                "! INFRA ERROR",
+                "3 trial(s) (excluded from score)",
+                id="infra-error",
+            ),
+        ],
+    )
+    def test_verdict(self, console_buf, overrides, symbol, summary):
+        """Each verdict shows its symbol and the matching summary line."""
+        suite = _make_suite(**overrides)
+        console, buf = console_buf
         render_headline(suite, console)
         output = buf.getvalue()
-        assert "! INFRA ERROR" in output
-        assert "3 trial(s) (excluded from score)" in output
+        assert symbol in output
+        assert summary in output
 
-    def test_score_row_values(self):
+    def test_score_row_values(self, console_buf):
         """Score row shows avg, min, p50, p95, and threshold."""
         suite = _make_suite(
             score_avg=0.85,
@@ -243,50 +303,52 @@ class TestRenderHeadline:
             score_p95=0.95,
             threshold=0.80,
         )
-        console, buf = _capture_console()
+        console, buf = console_buf
         render_headline(suite, console)
         output = buf.getvalue()
-        assert "avg=0.85" in output
-        assert "min=0.60" in output
-        assert "p50=0.90" in output
-        assert "p95=0.95" in output
-        assert "threshold=0.80" in output
+        _assert_all_in(
+            output, "avg=0.85", "min=0.60", "p50=0.90", "p95=0.95", "threshold=0.80"
+        )
 
-    def test_latency_row_shown(self):
+    def test_latency_row_shown(self, base_suite, console_buf):
         """Latency row appears when p50 and p95 are set."""
-        suite = _make_suite(latency_p50=1.23, latency_p95=4.56)
-        console, buf = _capture_console()
+        suite = base_suite.model_copy(
+            update={"latency_p50": 1.23, "latency_p95": 4.56}
+        )
+        console, buf = console_buf
         render_headline(suite, console)
         output = buf.getvalue()
-        assert "p50=1.23s" in output
-        assert "p95=4.56s" in output
+        _assert_all_in(output, "p50=1.23s", "p95=4.56s")
 
-    def test_cost_row_shown(self):
+    def test_cost_row_shown(self, base_suite, console_buf):
         """Cost row appears when cost_total and cost_avg are set."""
-        suite = _make_suite(cost_total=0.1234, cost_avg_per_trial=0.0411)
-        console, buf = _capture_console()
+        suite = base_suite.model_copy(
+            update={"cost_total": 0.1234, "cost_avg_per_trial": 0.0411}
+        )
+        console, buf = console_buf
         render_headline(suite, console)
         output = buf.getvalue()
-        assert "total=$0.1234" in output
-        assert "avg=$0.0411/trial" in output
+        _assert_all_in(output, "total=$0.1234", "avg=$0.0411/trial")
 
-    def test_no_failures_row_when_none(self):
+    def test_no_failures_row_when_none(self, base_suite, console_buf):
         """Failures row is omitted when no hard fail or soft fail."""
-        suite = _make_suite(trials_hard_fail=0, trials_failed=0)
-        console, buf = _capture_console()
+        suite = base_suite
+        console, buf = console_buf
         render_headline(suite, console)
         output = buf.getvalue()
         assert "hard fail" not in output.lower().replace("! hard fail", "")
 
-    def test_retries_row_shown(self):
+    def test_retries_row_shown(self, base_suite, console_buf):
         """Retries row appears when total_retries > 0."""
-        suite = _make_suite(total_retries=5, trials_with_retries=2)
-        console, buf = _capture_console()
+        suite = base_suite.model_copy(
+            update={"total_retries": 5, "trials_with_retries": 2}
+        )
+        console, buf = console_buf
         render_headline(suite, console)
         output = buf.getvalue()
         assert "5 retries across 2 trials" in output
 
-    def test_early_stop_row_shown(self):
+    def test_early_stop_row_shown(self, console_buf):
         """Early stop status row appears when early_stopped is True."""
         suite = _make_suite(
             early_stopped=True,
@@ -301,7 +363,7 @@ class TestRenderHeadline:
             score_p50=0.0,
             score_p95=0.0,
         )
-        console, buf = _capture_console()
+        console, buf = console_buf
         render_headline(suite, console)
         output = buf.getvalue()
         assert "early stop after 2/10 trials" in output
@@ -315,7 +377,7 @@ class TestRenderHeadline:
 class TestRenderDetails:
     """Test detail section rendering."""
 
-    def test_top_offenders_shown(self):
+    def test_top_offenders_shown(self, console_buf):
         """Top offenders section displays failure info."""
         suite = _make_suite(
             verdict=Verdict.FAIL,
@@ -330,14 +392,12 @@ class TestRenderDetails:
                 },
             ],
         )
-        console, buf = _capture_console()
+        console, buf = console_buf
         render_details(suite, console)
         output = buf.getvalue()
-        assert "Top Offenders" in output
-        assert "jmespath" in output
-        assert "failed 2/3" in output
+        _assert_all_in(output, "Top Offenders", "jmespath", "failed 2/3")
 
-    def test_top_offenders_limited_to_5(self):
+    def test_top_offenders_limited_to_5(self, console_buf):
         """Only top 5 offenders shown even if more exist."""
         failures = [
             {
@@ -351,13 +411,13 @@ class TestRenderDetails:
             for i in range(8)
         ]
         suite = _make_suite(assertion_failures=failures)
-        console, buf = _capture_console()
+        console, buf = console_buf
         render_details(suite, console)
         output = buf.getvalue()
         assert "type_4" in output
         assert "type_5" not in output
 
-    def test_score_breakdown_shown(self):
+    def test_score_breakdown_shown(self, console_buf):
         """Score breakdown lists per-trial scores."""
         trials = [
             TrialResult(
@@ -375,33 +435,35 @@ class TestRenderDetails:
             trials_passed=1,
             trials_failed=1,
         )
-        console, buf = _capture_console()
+        console, buf = console_buf
         render_details(suite, console)
         output = buf.getvalue()
         assert "Scores:" in output
         assert "1.0" in output
         assert "0.5" in output
 
-    def test_latency_distribution_shown(self):
+    def test_latency_distribution_shown(self, base_suite, console_buf):
         """Latency distribution shows min, p50, p95, max."""
-        suite = _make_suite(latency_p50=1.5, latency_p95=2.0)
-        console, buf = _capture_console()
+        suite = base_suite
+        console, buf = console_buf
         render_details(suite, console)
         output = buf.getvalue()
         assert "Latency:" in output
         assert "min=" in output
         assert "max=" in output
 
-    def test_cost_breakdown_shown(self):
+    def test_cost_breakdown_shown(self, base_suite, console_buf):
         """Cost breakdown shows total, min, max, avg."""
-        suite = _make_suite(cost_total=0.03, cost_avg_per_trial=0.01)
-        console, buf = _capture_console()
+        suite = base_suite.model_copy(
+            update={"cost_total": 0.03, "cost_avg_per_trial": 0.01}
+        )
+        console, buf = console_buf
         render_details(suite, console)
         output = buf.getvalue()
         assert "Cost:" in output
         assert "total=$0.0300" in output
 
-    def test_sample_failures_shown(self):
+    def test_sample_failures_shown(self, console_buf):
         """Sample failures section displays truncated detail strings."""
         suite = _make_suite(
             assertion_failures=[
@@ -418,13 +480,13 @@ class TestRenderDetails:
                 },
             ],
         )
-        console, buf = _capture_console()
+        console, buf = console_buf
         render_details(suite, console)
         output = buf.getvalue()
         assert "Sample Failures" in output
         assert "Expected 'hello' but got 'goodbye'" in output
 
-    def test_sample_failures_truncated_at_200(self):
+    def test_sample_failures_truncated_at_200(self, console_buf):
         """Long sample details are truncated to 200 chars."""
         long_detail = "x" * 300
         suite = _make_suite(
@@ -439,13 +501,13 @@ class TestRenderDetails:
                 },
             ],
         )
-        console, buf = _capture_console()
+        console, buf = console_buf
         render_details(suite, console)
         output = buf.getvalue()
         # Should have ellipsis after truncation, not the full 300 chars
         assert "..." in output
 
-    def test_infra_error_trials_excluded_from_scores(self):
+    def test_infra_error_trials_excluded_from_scores(self, console_buf):
         """Infra error trials are not included in score breakdown."""
         trials = [
             TrialResult(
@@ -463,7 +525,7 @@ class TestRenderDetails:
             trials_passed=1,
             trials_infra_error=1,
         )
-        console, buf = _capture_console()
+        console, buf = console_buf
         render_details(suite, console)
         output = buf.getvalue()
         # Score breakdown should only list 1 trial score (the passed one)
@@ -480,32 +542,37 @@ class TestRenderDetails:
 class TestOutputJson:
     """Test JSON output mode."""
 
-    def test_valid_json_output(self, capsys):
+    def test_valid_json_output(self, capsys, base_suite):
         """output_json writes valid JSON to stdout."""
-        suite = _make_suite()
-        output_json(suite)
+        output_json(base_suite)
         captured = capsys.readouterr()
         data = json.loads(captured.out)
         assert data["run_id"] == "test-run-001"
         assert data["verdict"] == "PASS"
         assert data["score_avg"] == 1.0
 
-    def test_no_rich_markup_in_json(self, capsys):
+    def test_no_rich_markup_in_json(self, capsys, base_suite):
         """JSON output contains no Rich markup tags."""
-        suite = _make_suite(verdict=Verdict.FAIL)
+        suite = base_suite.model_copy(update={"verdict": Verdict.FAIL})
         output_json(suite)
         captured = capsys.readouterr()
         assert "[bold" not in captured.out
         assert "[/" not in captured.out
 
-    def test_json_includes_all_trials(self, capsys):
+    def test_json_includes_all_trials(self, capsys, base_suite):
         """JSON output includes all trial results."""
-        suite = _make_suite(trials_total=3, trials_passed=3)
-        output_json(suite)
+        output_json(base_suite)
         captured = capsys.readouterr()
         data = json.loads(captured.out)
         assert len(data["trials"]) == 3
 
+    def test_text_only_stdout(self, monkeypatch, base_suite):
+        """Streams without a binary buffer get the same document as text."""
+        out = StringIO()
+        monkeypatch.setattr("sys.stdout", out)
+        output_json(base_suite)
+        assert out.getvalue() == base_suite.model_dump_json(indent=2) + "\n"
+
 
 # ---------------------------------------------------------------------------
 # Tests: create_trial_progress
@@ -536,18 +603,16 @@ class TestCreateTrialProgress:
 class TestNonTTYMode:
     """Test that non-TTY/CI mode works without ANSI garbage."""
 
-    def test_headline_no_ansi_in_non_terminal(self):
+    def test_headline_no_ansi_in_non_terminal(self, base_suite, console_buf):
         """Headline renders without ANSI escape codes in non-TTY mode."""
-        suite = _make_suite()
-        buf = StringIO()
-        console = Console(file=buf, force_terminal=False, no_color=True, width=120)
-        render_headline(suite, console)
+        console, buf = console_buf
+        render_headline(base_suite, console)
         output = buf.getvalue()
         # Should have the verdict symbol but no ANSI escapes
         assert "\u2713 PASS" in output
         assert "\x1b[" not in output
 
-    def test_details_no_ansi_in_non_terminal(self):
+    def test_details_no_ansi_in_non_terminal(self, console_buf):
         """Details render without ANSI escape codes in non-TTY mode."""
         suite = _make_suite(
             assertion_failures=[
@@ -561,8 +626,7 @@ class TestNonTTYMode:
                 },
             ],
         )
-        buf = StringIO()
-        console = Console(file=buf, force_terminal=False, no_color=True, width=120)
+        console, buf = console_buf
         render_details(suite, console)
         output = buf.getvalue()
         assert "Top Offenders" in output
@@ -60,7 +60,6 @@ class TestIsTransient:
 class TestRetryWithBackoff:
     """Test retry_with_backoff async retry logic."""
 
-    @pytest.mark.asyncio
     async def test_success_no_retry(self):
         """Immediate success returns result with 0 retries."""
         call_count = 0
@@ -78,7 +77,6 @@ class TestRetryWithBackoff:
         assert errors == []
         assert call_count == 1
 
-    @pytest.mark.asyncio
     async def test_retry_on_timeout_then_success(self):
         """TimeoutError triggers retry; second call succeeds."""
         call_count = 0
@@ -98,7 +96,6 @@ class TestRetryWithBackoff:
         assert errors == ["TimeoutError"]
         assert call_count == 2
 
-    @pytest.mark.asyncio
     async def test_retry_on_connection_error(self):
         """ConnectionError triggers retry."""
         call_count = 0
@@ -117,7 +114,6 @@ class TestRetryWithBackoff:
         assert retries == 2
         assert errors == ["ConnectionError", "ConnectionError"]
 
-    @pytest.mark.asyncio
     async def test_retry_on_status_code_429(self):
         """Exception with status_code=429 triggers retry."""
         call_count = 0
@@ -137,7 +133,6 @@ class TestRetryWithBackoff:
         assert result == "ok"
         assert retries == 1
 
-    @pytest.mark.asyncio
     async def test_non_transient_raises_immediately(self):
         """ValueError (non-transient) raises without retry."""
         call_count = 0
@@ -154,7 +149,6 @@ class TestRetryWithBackoff:
 
         assert call_count == 1
 
-    @pytest.mark.asyncio
     async def test_retries_exhausted_raises(self):
         """All retries fail with transient error -- raises last exception."""
         call_count = 0
@@ -172,7 +166,6 @@ class TestRetryWithBackoff:
         # 1 initial + 3 retries = 4 total calls
         assert call_count == 4
 
-    @pytest.mark.asyncio
     async def test_max_retries_zero_no_retry(self):
         """max_retries=0 means only one attempt, no retries."""
         call_count = 0
@@ -189,7 +182,6 @@ class TestRetryWithBackoff:
 
         assert call_count == 1
 
-    @pytest.mark.asyncio
     async def test_backoff_delay_is_bounded(self):
         """Verify that we actually wait (small delay for test speed)."""
         call_count = 0
@@ -6,8 +6,6 @@ import asyncio
 from typing import Any
 from unittest.mock import patch
 
-import pytest
-
 from salvo.adapters.base import (
     AdapterConfig,
     AdapterTurnResult,
@@ -114,7 +112,6 @@ def _make_failing_factory(
 class TestTrialRunnerSingleTrial:
     """Test basic single-trial execution."""
 
-    @pytest.mark.asyncio
     async def test_single_trial_pass(self):
         """N=1, adapter returns valid response, no assertions -> PASS."""
         _created, factory = _make_passing_factory()
@@ -138,7 +135,6 @@ class TestTrialRunnerSingleTrial:
         assert len(result.trials) == 1
         assert result.trials[0].status == TrialStatus.passed
 
-    @pytest.mark.asyncio
     async def test_single_trial_with_assertions(self):
         """N=1, with a jmespath assertion that passes."""
         _created, factory = _make_passing_factory()
@@ -172,7 +168,6 @@ class TestTrialRunnerSingleTrial:
 class TestTrialRunnerMultipleTrials:
     """Test multiple trial execution."""
 
-    @pytest.mark.asyncio
     async def test_multiple_trials_all_pass(self):
         """N=5, all pass -> PASS with correct counts."""
         _created, factory = _make_passing_factory()
@@ -198,7 +193,6 @@ class TestTrialRunnerMultipleTrials:
 class TestTrialRunnerConcurrent:
     """Test concurrent execution mode."""
 
-    @pytest.mark.asyncio
     async def test_concurrent_execution(self):
         """N=5, max_parallel=3, all 5 complete with correct results."""
         _created, factory = _make_passing_factory()
@@ -221,7 +215,6 @@ class TestTrialRunnerConcurrent:
         # Verify each trial got a unique adapter
         assert len(_created) == 5
 
-    @pytest.mark.asyncio
     async def test_concurrent_same_as_sequential(self):
         """Concurrent mode produces same aggregate results as sequential."""
         scenario = _make_scenario()
@@ -259,7 +252,6 @@ class TestTrialRunnerConcurrent:
 class TestTrialIsolation:
     """Test that each trial gets isolation (unique tmpdir + fresh adapter)."""
 
-    @pytest.mark.asyncio
     async def test_trial_isolation_unique_adapters(self):
         """Each trial creates a unique adapter via factory."""
         created, factory = _make_passing_factory()
@@ -279,7 +271,6 @@ class TestTrialIsolation:
         assert len(created) == 3
         assert len(set(id(a) for a in created)) == 3
 
-    @pytest.mark.asyncio
     async def test_trial_isolation_tmpdir(self):
         """Each trial creates a TemporaryDirectory with unique prefix."""
         tmpdir_names: list[str] = []
@@ -316,7 +307,6 @@ class TestTrialIsolation:
 class TestTrialRunnerRetry:
     """Test retry behavior on transient errors."""
 
-    @pytest.mark.asyncio
     async def test_retry_on_transient_error(self):
         """Adapter raises TimeoutError first call, succeeds second -> retries_used=1."""
         created: list[MockTrialAdapter] = []
@@ -348,7 +338,6 @@ class TestTrialRunnerRetry:
         assert result.total_retries == 1
         assert result.trials_with_retries == 1
 
-    @pytest.mark.asyncio
     async def test_retry_exhausted_infra_error(self):
         """Adapter always raises 429 -> trial status=INFRA_ERROR."""
         _created, factory = _make_failing_factory()
@@ -373,7 +362,6 @@ class TestTrialRunnerRetry:
 class TestTrialRunnerEarlyStop:
     """Test early-stop behavior."""
 
-    @pytest.mark.asyncio
     async def test_early_stop_on_hard_fail(self):
         """N=10, first trial has hard fail with early_stop -> stops after 1."""
         call_count = 0
@@ -414,7 +402,6 @@ class TestTrialRunnerEarlyStop:
         assert result.trials_total < 10
         assert result.verdict == Verdict.HARD_FAIL
 
-    @pytest.mark.asyncio
     async def test_early_stop_mathematically_impossible(self):
         """N=10, first trials all score 0.0 with threshold 0.8 -> stops early."""
         def factory():
@@ -452,7 +439,6 @@ class TestTrialRunnerEarlyStop:
         assert result.trials_total < 10
         assert result.early_stop_reason is not None
 
-    @pytest.mark.asyncio
     async def test_no_early_stop_when_disabled(self):
         """N=5, hard fail but early_stop=False -> all 5 run."""
         def factory():
@@ -490,7 +476,6 @@ class TestTrialRunnerEarlyStop:
 class TestTrialRunnerProgressCallback:
     """Test progress callback invocation."""
 
-    @pytest.mark.asyncio
     async def test_progress_callback_called(self):
         """Callback invoked once per trial with (trial_num, total)."""
         _created, factory = _make_passing_factory()
@@ -520,7 +505,6 @@ class TestTrialRunnerProgressCallback:
 class TestTrialRunnerAllInfraError:
     """Test all trials failing with infra errors."""
 
-    @pytest.mark.asyncio
     async def test_all_infra_error(self):
         """All trials fail with infra errors -> INFRA_ERROR, zeroed metrics."""
         _created, factory = _make_failing_factory()
@@ -547,7 +531,6 @@ class TestTrialRunnerAllInfraError:
 class TestTrialRunnerProjectConfig:
     """Test project_config threading and defensive normalization."""
 
-    @pytest.mark.asyncio
     async def test_accepts_project_config(self):
         """TrialRunner accepts project_config parameter without error."""
         from salvo.models.config import ProjectConfig
@@ -568,7 +551,6 @@ class TestTrialRunnerProjectConfig:
         result = await runner.run_all()
         assert result.verdict == Verdict.PASS
 
-    @pytest.mark.asyncio
     async def test_normalize_assertions_called(self):
         """Verify normalize_assertions is called during trial execution."""
         _created, factory = _make_passing_factory()
@@ -599,7 +581,6 @@ class TestTrialRunnerProjectConfig:
             await runner.run_all()
             assert mock_normalize.call_count >= 1
 
-    @pytest.mark.asyncio
     async def test_project_judge_config_injected(self):
         """Verify _project_judge_config injected into judge assertions."""
         from salvo.models.config import JudgeConfig, ProjectConfig